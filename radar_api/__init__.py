@@ -31,23 +31,30 @@ import os
 from importlib.metadata import PackageNotFoundError, version
 
 from radar_api._config import config
+from radar_api.catalog import FileCatalog
 from radar_api.configs import (
     define_configs,
     read_configs,
 )
-from radar_api.download import download_files
+from radar_api.download import download_files, download_files_multi
 from radar_api.info import group_filepaths
+from radar_api.inventory import reindex
 from radar_api.io import (
     available_networks,
     available_products,
     available_radars,
+    close_filesystems,
 )
 from radar_api.readers import (
+    ReaderPool,
     open_dataset,
     open_datatree,
+    open_many,
+    open_mfdatatree,
     open_pyart,
 )
-from radar_api.search import find_files
+from radar_api.search import find_files, find_files_multi, iter_files
+from radar_api.stream import stream_datasets
 from radar_api.utilities import (
     available_radars_around_point,
     available_radars_within_extent,
@@ -58,21 +65,31 @@ _root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 
 
 __all__ = [
+    "FileCatalog",
+    "ReaderPool",
     "available_networks",
     "available_products",
     "available_radars",
     "available_radars_around_point",
     "available_radars_within_extent",
+    "close_filesystems",
     "config",
     "define_configs",
     "download_files",
+    "download_files_multi",
     "find_files",
+    "find_files_multi",
     "group_filepaths",
+    "iter_files",
     "open_dataset",
     "open_datatree",
+    "open_many",
+    "open_mfdatatree",
     "open_pyart",
     "read_configs",
     "read_database",
+    "reindex",
+    "stream_datasets",
 ]
 
 # Get version
@@ -46,6 +46,22 @@ def _get_default_configs():
 
 _CONFIG_DEFAULTS = {
     "base_dir": None,
+    "listing_cache": {
+        "enabled": True,
+        "filepath": None,
+        "ttl": 300,
+    },
+    "inventory": {
+        "enabled": True,
+    },
+    "filesystem": {
+        "max_pool_connections": 50,
+    },
+    "read_cache": {
+        "enabled": True,
+        "directory": None,
+        "max_bytes": 10 * 1024**3,
+    },
 }
 _CONFIG_DEFAULTS.update(_get_default_configs())
 
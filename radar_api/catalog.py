@@ -0,0 +1,249 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides the FileCatalog, an in-memory time-indexed catalog of radar files.
+
+The files are stored sorted by start time, so that time period queries are answered
+with a binary search (``numpy.searchsorted``) followed by a vectorized interval test
+on the candidate files only. Filenames are parsed once when the catalog is created:
+repeated sub-period queries over large inventories do not parse or list files again.
+"""
+
+import numpy as np
+import pandas as pd
+
+from radar_api.checks import check_network, check_product, check_time
+from radar_api.filter import are_files_within_time, fill_files_end_time
+from radar_api.info import FILE_KEYS, get_radar_from_filepaths, parse_filepaths
+from radar_api.io import get_product_file_time_coverage
+
+
+class FileCatalog:
+    """Catalog of the radar files of a network product, sorted by start time."""
+
+    def __init__(self, df, network, product):
+        """Initialize the catalog from a table of file information.
+
+        Use :py:meth:`FileCatalog.from_filepaths` to create a catalog from a list of filepaths.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Table with the ``filepath``, ``radar`` and ``size`` columns, and the
+            file information columns returned by ``radar_api.info.parse_filepaths``.
+        network : str
+            The name of the radar network.
+        product : str
+            The product acronym.
+        """
+        df = df.sort_values(["start_time", "filepath"], kind="stable").reset_index(drop=True)
+        start_times = df["start_time"].to_numpy(dtype="datetime64[us]")
+        end_times = fill_files_end_time(
+            start_times,
+            df["end_time"].to_numpy(dtype="datetime64[us]"),
+            file_time_coverage=get_product_file_time_coverage(network, product),
+        )
+        durations = end_times - start_times
+        max_duration = durations.max() if len(durations) > 0 else np.timedelta64(0, "us")
+        self._set_table(df, network=network, product=product, start_times=start_times, end_times=end_times)
+        self._max_duration = max_duration
+
+    def _set_table(self, df, network, product, start_times, end_times):
+        """Set the table of the files, already sorted by start time, and their start and end times."""
+        self.network = network
+        self.product = product
+        self._df = df
+        self.start_times = start_times
+        self.end_times = end_times
+
+    @classmethod
+    def from_filepaths(cls, filepaths, network, product=None, radar=None, *, sizes=None, ignore_errors=False):
+        """
+        Create a catalog from a list of filepaths.
+
+        Parameters
+        ----------
+        filepaths : list
+            List of filepaths.
+        network : str
+            The name of the radar network.
+        product : str, optional
+            The product acronym. It must be specified if multiple products are
+            available for the network.
+        radar : str or list, optional
+            The name of the radar of the files.
+            If None, the radar name is inferred from the directory paths
+            (see ``radar_api.info.get_radar_from_filepaths``).
+        sizes : list, optional
+            The size of the files in bytes. The default is None.
+        ignore_errors : bool, optional
+            If False (the default), raise an error if a filename can not be parsed.
+            If True, files whose filename can not be parsed are discarded.
+
+        Returns
+        -------
+        FileCatalog
+        """
+        network = check_network(network)
+        product = check_product(network=network, product=product)
+        filepaths = [str(fpath) for fpath in filepaths]
+        df = parse_filepaths(filepaths, network=network, product=product, ignore_errors=ignore_errors)
+        if radar is None:
+            radar = get_radar_from_filepaths(filepaths, network=network, product=product, ignore_errors=ignore_errors)
+        df["radar"] = radar
+        df["size"] = pd.Series([None] * len(df) if sizes is None else list(sizes), dtype="Int64")
+        df = df.loc[~df["start_time"].isna()]
+        return cls(df, network=network, product=product)
+
+    def __repr__(self):
+        """Return the string representation of the catalog."""
+        if len(self) == 0:
+            return f"<FileCatalog {self.network} {self.product}: 0 files>"
+        start_time = pd.Timestamp(self.start_times[0])
+        end_time = pd.Timestamp(self.end_times.max())
+        return f"<FileCatalog {self.network} {self.product}: {len(self)} files from {start_time} to {end_time}>"
+
+    def __len__(self):
+        """Return the number of files."""
+        return len(self._df)
+
+    def __iter__(self):
+        """Iterate over the filepaths."""
+        return iter(self.filepaths)
+
+    def __contains__(self, filepath):
+        """Return True if the filepath is in the catalog."""
+        return filepath in set(self._df["filepath"])
+
+    def __getitem__(self, key):
+        """Return a filepath (integer key) or a sub-catalog (slice, integer or boolean array key)."""
+        if isinstance(key, (int, np.integer)):
+            return self._df["filepath"].iloc[key]
+        return self.isel(key)
+
+    def __eq__(self, other):
+        """Return True if the catalogs have the same network, product and files."""
+        if not isinstance(other, FileCatalog):
+            return NotImplemented
+        return self.network == other.network and self.product == other.product and self.filepaths == other.filepaths
+
+    __hash__ = None
+
+    @property
+    def filepaths(self):
+        """Return the list of filepaths."""
+        return self._df["filepath"].tolist()
+
+    @property
+    def sizes(self):
+        """Return the list of file sizes in bytes (None if unknown)."""
+        return [None if pd.isna(size) else int(size) for size in self._df["size"]]
+
+    @property
+    def radars(self):
+        """Return the sorted list of radars."""
+        return sorted(self._df["radar"].unique().tolist())
+
+    def to_dataframe(self):
+        """Return a copy of the catalog table."""
+        return self._df.copy()
+
+    def isel(self, indexer):
+        """Return the sub-catalog of the files at the given positions.
+
+        The files of the sub-catalog keep their time order, whatever the order of the positions.
+        """
+        positions = np.atleast_1d(np.arange(len(self))[indexer])
+        if np.any(positions[1:] < positions[:-1]):
+            positions = np.sort(positions, kind="stable")
+        catalog = FileCatalog.__new__(FileCatalog)
+        catalog._set_table(
+            self._df.iloc[positions].reset_index(drop=True),
+            network=self.network,
+            product=self.product,
+            start_times=self.start_times[positions],
+            end_times=self.end_times[positions],
+        )
+        # The maximum file duration is an upper bound of the sub-catalog file durations
+        catalog._max_duration = self._max_duration
+        return catalog
+
+    def sel(self, **indexers):
+        """
+        Return the sub-catalog of the files matching the given file information values.
+
+        Parameters
+        ----------
+        **indexers
+            File information key(s) and value(s) to select.
+            Valid keys are ``radar``, ``filepath``, ``size`` and the file information
+            keys returned by ``radar_api.info.parse_filepaths`` (i.e. ``volume_identifier``).
+            Values can be a scalar or a list of values.
+
+        Returns
+        -------
+        FileCatalog
+        """
+        valid_keys = ["filepath", "radar", "size", *FILE_KEYS]
+        is_selected = np.ones(len(self), dtype=bool)
+        for key, value in indexers.items():
+            if key not in valid_keys:
+                raise ValueError(f"Invalid key '{key}'. Valid keys are {valid_keys}.")
+            values = value if isinstance(value, (list, tuple, set, np.ndarray)) else [value]
+            is_selected &= self._df[key].isin(values).to_numpy()
+        return self.isel(np.flatnonzero(is_selected))
+
+    def sel_time(self, start_time, end_time):
+        """
+        Return the sub-catalog of the files overlapping a time period.
+
+        Parameters
+        ----------
+        start_time : datetime.datetime
+            The start (inclusive) time of the interval period.
+        end_time : datetime.datetime
+            The end (exclusive) time of the interval period.
+
+        Returns
+        -------
+        FileCatalog
+        """
+        start_time = np.datetime64(check_time(start_time), "us")
+        end_time = np.datetime64(check_time(end_time), "us")
+        if start_time > end_time:
+            raise ValueError("Provide start_time occurring before of end_time")
+        # Identify candidate files with a binary search
+        # - Files starting before start_time can overlap the period up to the maximum file duration
+        idx_start = np.searchsorted(self.start_times, start_time - self._max_duration, side="left")
+        idx_end = np.searchsorted(self.start_times, end_time, side="right")
+        # Select files within the time period
+        is_selected = are_files_within_time(
+            start_time,
+            end_time,
+            self.start_times[idx_start:idx_end],
+            self.end_times[idx_start:idx_end],
+        )
+        return self.isel(np.arange(idx_start, idx_end)[is_selected])
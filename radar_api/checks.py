@@ -32,6 +32,7 @@ import numpy as np
 
 PROTOCOLS = ["s3", "local", "file"]  # "gcs"
 BUCKET_PROTOCOLS = ["s3"]  # "gcs"
+ENCODINGS = [None, "float32", "packed"]
 
 
 def get_current_utc_time():
@@ -77,26 +78,51 @@ def check_base_dir(base_dir):
 
 def check_radar(radar, network):
     """Check radar name validity."""
-    from radar_api.io import available_radars
+    from radar_api.io import available_radars, get_config_registry
 
     if not isinstance(radar, str):
         raise TypeError("Specify 'radar' as a string.")
     check_network(network)
-    valid_radars = available_radars(only_online=False)
-    if radar not in valid_radars:
+    if radar not in get_config_registry().radars:
+        valid_radars = available_radars(only_online=False)
         raise ValueError(f"Invalid {network} radar {radar}. Available radars: {valid_radars}")
     return radar
 
 
+def check_radars(radars, network):
+    """Check the validity of a list of radars of a network.
+
+    The radars can be specified as a list of radar names or as a list of ``(network, radar, ...)``
+    tuples (i.e. as returned by ``radar_api.available_radars_within_extent``). In the latter
+    case, the radars of other networks are discarded.
+    """
+    network = check_network(network)
+    if isinstance(radars, str):
+        radars = [radars]
+    if not isinstance(radars, (list, tuple)):
+        raise TypeError("Specify 'radars' as a list of radar names or of (network, radar) tuples.")
+    list_radars = []
+    for radar in radars:
+        if isinstance(radar, (list, tuple)):
+            if len(radar) < 2:
+                raise ValueError(f"Invalid radar specification {radar}. Expected a (network, radar) tuple.")
+            if radar[0] != network:
+                continue
+            radar = radar[1]
+        list_radars.append(check_radar(radar=radar, network=network))
+    return list(dict.fromkeys(list_radars))
+
+
 def check_network(network):
     """Check radar network validity."""
-    from radar_api.io import available_networks
+    from radar_api.io import get_config_registry
 
     if not isinstance(network, str):
         raise TypeError("Specify 'network' as a string.")
 
-    valid_networks = available_networks(only_online=False)
+    valid_networks = get_config_registry().networks
     if network not in valid_networks:
+        valid_networks = sorted(valid_networks)
         raise ValueError(f"Invalid network {network}. Available networks: {valid_networks}")
     return network
 
@@ -106,9 +132,10 @@ def check_product(network, product=None):
 
     If only one product available for that network, return that.
     """
-    from radar_api.io import available_products
+    from radar_api.io import get_config_registry
 
-    valid_products = available_products(network, only_online=False)
+    check_network(network)
+    valid_products = sorted(get_config_registry().get_products(network))
     if product is None:
         if len(valid_products) == 1:
             return valid_products[0]
@@ -192,3 +219,10 @@ def check_start_end_time(start_time, end_time):
     # if end_time > get_current_utc_time():
     #     raise ValueError("Provide a end_time occurring in the past.")
     return (start_time, end_time)
+
+
+def check_encoding(encoding):
+    """Check the encoding of the radar moments."""
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Valid `encoding` are {ENCODINGS}.")
+    return encoding
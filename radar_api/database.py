@@ -0,0 +1,219 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides a precompiled snapshot of the radar configuration database.
+
+The radar configuration YAML files are baked into a single columnar NumPy ``.npz``
+file which can be loaded in a few milliseconds. The snapshot stores a digest of
+the YAML files it was built from, and it is ignored if the YAML files have changed.
+
+The snapshot must be rebuilt with :py:func:`build_database_snapshot` when
+the radar configuration files are modified.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from radar_api.io import available_networks, available_radars, get_radar_info, get_radars_config_path
+
+SNAPSHOT_VERSION = 1
+
+
+def get_database_snapshot_filepath():
+    """Get filepath of the radar database snapshot."""
+    from radar_api import _root_path
+
+    return os.path.join(_root_path, "radar_api", "etc", "radar_database.npz")
+
+
+def get_database_digest():
+    """Return the digest of the radar configuration YAML files."""
+    radars_config_path = get_radars_config_path()
+    hasher = hashlib.sha256()
+    for network in available_networks():
+        network_dir = os.path.join(radars_config_path, network)
+        for radar in available_radars(network=network):
+            with open(os.path.join(network_dir, f"{radar}.yaml"), "rb") as f:
+                hasher.update(f"{network}/{radar}\n".encode())
+                hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+def _read_database_records(network=None):
+    """Read the radar configuration YAML files into a list of records."""
+    networks = available_networks() if network is None else [network]
+    records = []
+    for current_network in networks:
+        for radar in available_radars(network=current_network):
+            record = {
+                "network": current_network,
+                "radar": radar,
+            }
+            record.update(get_radar_info(network=current_network, radar=radar))
+            records.append(record)
+    return records
+
+
+def _get_column_kind(values):
+    """Return the storage kind of a column given its (non-missing) values."""
+    if all(isinstance(value, str) for value in values):
+        return "str"
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        return "number"
+    return "json"
+
+
+def _encode_column(records, column):
+    """Encode a column of the records into a ``(kind, values, is_missing, is_integer)`` tuple.
+
+    ``is_integer`` flags the numeric values which are integers, so that their type can be restored.
+    """
+    is_missing = np.array([column not in record for record in records], dtype=bool)
+    values = [record[column] for record in records if column in record]
+    kind = _get_column_kind(values)
+    if kind == "str":
+        arr = np.array([record.get(column, "") for record in records], dtype=str)
+    elif kind == "number":
+        arr = np.array([record.get(column, np.nan) for record in records], dtype="float64")
+    else:
+        arr = np.array([json.dumps(record.get(column)) for record in records], dtype=str)
+    is_integer = np.array([isinstance(record.get(column), int) for record in records], dtype=bool)
+    return kind, arr, is_missing, is_integer
+
+
+def _decode_column(kind, arr, is_missing, is_integer):
+    """Decode a column of the snapshot into a list of Python objects (with NaN for missing values)."""
+    if kind == "json":
+        values = arr.tolist()
+        return [np.nan if missing else json.loads(value) for value, missing in zip(values, is_missing, strict=True)]
+    values = arr.tolist()
+    if kind == "number":
+        for i in np.flatnonzero(is_integer):
+            values[i] = int(values[i])
+    for i in np.flatnonzero(is_missing):
+        values[i] = np.nan
+    return values
+
+
+def build_database_snapshot(filepath=None):
+    """Build the radar database snapshot from the radar configuration YAML files.
+
+    Parameters
+    ----------
+    filepath : str, optional
+        Filepath of the snapshot. If ``None``, the snapshot is written
+        in the RADAR-API ``etc`` directory.
+
+    Returns
+    -------
+    str
+        Filepath of the snapshot.
+    """
+    filepath = get_database_snapshot_filepath() if filepath is None else filepath
+    records = _read_database_records()
+    # Define columns in order of appearance
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    arrays = {
+        "version": np.array(SNAPSHOT_VERSION),
+        "digest": np.array(get_database_digest()),
+        "columns": np.array(columns, dtype=str),
+    }
+    kinds = []
+    for i, column in enumerate(columns):
+        kind, arr, is_missing, is_integer = _encode_column(records, column)
+        kinds.append(kind)
+        arrays[f"values_{i}"] = arr
+        arrays[f"missing_{i}"] = is_missing
+        arrays[f"integer_{i}"] = is_integer
+    arrays["kinds"] = np.array(kinds, dtype=str)
+    # Write to a temporary file and move it to avoid leaving a partial snapshot
+    tmp_filepath = filepath + ".tmp.npz"
+    np.savez_compressed(tmp_filepath, **arrays)
+    os.replace(tmp_filepath, filepath)
+    return filepath
+
+
+def load_database_snapshot(network=None, filepath=None, check_digest=True):
+    """Load the radar database snapshot.
+
+    Parameters
+    ----------
+    network : str, optional
+        Radar network name. If ``None``, load the radar metadata of all networks.
+    filepath : str, optional
+        Filepath of the snapshot. If ``None``, the snapshot in the RADAR-API ``etc`` directory is used.
+    check_digest : bool, optional
+        If ``True`` (the default), returns ``None`` if the snapshot is out of date
+        with respect to the radar configuration YAML files.
+
+    Returns
+    -------
+    pandas.DataFrame or None
+        The radar database, or ``None`` if the snapshot is missing, invalid or out of date.
+    """
+    filepath = get_database_snapshot_filepath() if filepath is None else filepath
+    if not os.path.isfile(filepath):
+        return None
+    try:
+        with np.load(filepath, allow_pickle=False) as arrays:
+            if int(arrays["version"]) != SNAPSHOT_VERSION:
+                return None
+            if check_digest and str(arrays["digest"]) != get_database_digest():
+                return None
+            columns = arrays["columns"].tolist()
+            kinds = arrays["kinds"].tolist()
+            # Select the network radars
+            idx_network = columns.index("network")
+            networks = arrays[f"values_{idx_network}"]
+            is_selected = np.ones(networks.shape, dtype=bool) if network is None else networks == network
+            # Decode the columns of the selected radars (discarding columns not defined for such radars)
+            dict_columns = {}
+            for i, column in enumerate(columns):
+                is_missing = arrays[f"missing_{i}"][is_selected]
+                if is_missing.all():
+                    continue
+                dict_columns[column] = _decode_column(
+                    kind=kinds[i],
+                    arr=arrays[f"values_{i}"][is_selected],
+                    is_missing=is_missing,
+                    is_integer=arrays[f"integer_{i}"][is_selected],
+                )
+    except Exception:
+        return None
+    if len(dict_columns) == 0:
+        return pd.DataFrame(columns=["network", "radar"])
+    return pd.DataFrame(dict_columns)
+
+
+def read_database_from_yaml(network=None):
+    """Return a DataFrame of the radar metadata read from the radar configuration YAML files."""
+    records = _read_database_records(network=network)
+    if len(records) == 0:
+        return pd.DataFrame(columns=["network", "radar"])
+    return pd.DataFrame.from_records(records)
@@ -26,29 +26,38 @@
 # -----------------------------------------------------------------------------.
 """Define download functions."""
 
+import asyncio
 import concurrent.futures
+import contextlib
 import datetime
+import hashlib
 import os
+import sqlite3
 import time
 from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
+from fsspec.asyn import sync
 from tqdm import tqdm
 from trollsift import Parser
 
+from radar_api.catalog import FileCatalog
 from radar_api.checks import (
     check_base_dir,
     check_download_protocol,
     check_network,
     check_product,
     check_radar,
+    check_radars,
     check_start_end_time,
 )
 from radar_api.configs import get_base_dir
 from radar_api.info import get_info_from_filepath
+from radar_api.inventory import get_local_inventory
 from radar_api.io import get_directory_pattern, get_filesystem
 from radar_api.search import find_files
+from radar_api.transfer import TransferError, async_transfer_file, transfer_file
 from radar_api.utils.timing import print_elapsed_time
 
 ####--------------------------------------------------------------------------.
@@ -59,12 +68,111 @@ def create_local_directories(fpaths, exist_ok=True):
     _ = [os.makedirs(os.path.dirname(fpath), exist_ok=exist_ok) for fpath in fpaths]
 
 
-def remove_corrupted_files(local_fpaths, bucket_fpaths, fs, return_corrupted_fpaths=True):
+def _get_local_sizes(local_fpaths):
+    """Return the size of files on local storage. The size is -1 if the file does not exist."""
+    sizes = np.full(len(local_fpaths), -1, dtype=np.int64)
+    for i, fpath in enumerate(local_fpaths):
+        with contextlib.suppress(OSError):
+            sizes[i] = os.stat(fpath).st_size
+    return sizes
+
+
+async def _async_get_file_info(fs, fpath, semaphore):
+    """Return the metadata of a file using the filesystem coroutines, or None if it fails."""
+    async with semaphore:
+        try:
+            return await fs._info(fpath)
+        except Exception:
+            return None
+
+
+async def _async_get_files_info(fs, fpaths, max_concurrency):
+    """Return the metadata of multiple files, fetching them concurrently."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*[_async_get_file_info(fs=fs, fpath=fpath, semaphore=semaphore) for fpath in fpaths])
+
+
+def _try_get_file_info(fs, fpath):
+    """Return the metadata of a file, or None if it fails."""
+    try:
+        return fs.info(fpath)
+    except Exception:
+        return None
+
+
+def get_files_info(fs, fpaths, max_concurrency=20):
+    """
+    Return the metadata of multiple files of a filesystem.
+
+    The metadata are fetched concurrently: asynchronous filesystems (i.e. s3fs) use
+    coroutines bounded by a semaphore, while the other filesystems use a pool of threads.
+
+    Parameters
+    ----------
+    fs : fsspec.FileSystem
+        fsspec filesystem instance.
+    fpaths : list
+        List of filepaths.
+    max_concurrency : int, optional
+        Maximum number of concurrent requests. The default is 20.
+
+    Returns
+    -------
+    list
+        List with the metadata dictionary of each file, in the same order as ``fpaths``.
+        The metadata are None for files whose metadata can not be retrieved.
+    """
+    max_concurrency = max(int(max_concurrency), 1)
+    fpaths = list(fpaths)
+    if max_concurrency == 1 or len(fpaths) <= 1:
+        return [_try_get_file_info(fs=fs, fpath=fpath) for fpath in fpaths]
+    if getattr(fs, "async_impl", False):
+        return sync(fs.loop, _async_get_files_info, fs, fpaths, max_concurrency)
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(fpaths))) as executor:
+        return list(executor.map(lambda fpath: _try_get_file_info(fs=fs, fpath=fpath), fpaths))
+
+
+def _get_md5_checksum(fpath, chunk_size=2**20):
+    """Return the MD5 checksum of a local file."""
+    md5 = hashlib.md5()
+    with open(fpath, "rb") as f:
+        while chunk := f.read(chunk_size):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _get_md5_from_etag(info):
+    """Return the MD5 checksum encoded in the ETag of a cloud bucket file, or None.
+
+    The ETag of files uploaded with multipart uploads is not the MD5 checksum of the file.
+    """
+    etag = (info or {}).get("ETag", (info or {}).get("etag"))
+    if not isinstance(etag, str):
+        return None
+    etag = etag.strip('"').lower()
+    if len(etag) != 32 or any(c not in "0123456789abcdef" for c in etag):
+        return None
+    return etag
+
+
+def remove_corrupted_files(
+    local_fpaths,
+    bucket_fpaths,
+    fs,
+    return_corrupted_fpaths=True,
+    *,
+    bucket_sizes=None,
+    verify_checksum=False,
+    max_concurrency=20,
+):
     """
     Check and remove files from local disk which are corrupted.
 
     Corruption is evaluated by comparing the size of data on local storage against
     size of data located in the cloud bucket.
+    The bucket file sizes are taken from ``bucket_sizes`` when available (i.e. from the
+    directory listings of ``find_files(detail=True)``). Otherwise, the bucket file metadata
+    are fetched concurrently.
 
     Parameters
     ----------
@@ -79,6 +187,18 @@ def remove_corrupted_files(local_fpaths, bucket_fpaths, fs, return_corrupted_fpa
         If True, it returns the list of corrupted files.
         If False, it returns the list of valid files.
         The default is True.
+    bucket_sizes : list, optional
+        List with the size of the files on cloud bucket.
+        Unknown sizes can be specified with None.
+        The default is None.
+    verify_checksum : bool, optional
+        If True, it also compares the MD5 checksum of the local files against the ETag
+        of the cloud bucket files. Files uploaded with multipart uploads, whose ETag is not
+        a MD5 checksum, are only checked by size.
+        The default is False.
+    max_concurrency : int, optional
+        Maximum number of concurrent requests to retrieve the bucket file metadata.
+        The default is 20.
 
     Returns
     -------
@@ -86,25 +206,47 @@ def remove_corrupted_files(local_fpaths, bucket_fpaths, fs, return_corrupted_fpa
         (list_local_filepaths, list_bucket_filepaths)
 
     """
-    l_corrupted_local = []
-    l_corrupted_bucket = []
-    l_valid_local = []
-    l_valid_bucket = []
-    for local_fpath, bucket_fpath in zip(local_fpaths, bucket_fpaths, strict=False):
-        local_exists = os.path.isfile(local_fpath)
-        if local_exists:
-            bucket_size = fs.info(bucket_fpath)["size"]
-            local_size = os.path.getsize(local_fpath)
-            if bucket_size != local_size:
-                os.remove(local_fpath)
-                l_corrupted_local.append(local_fpath)
-                l_corrupted_bucket.append(bucket_fpath)
-            else:
-                l_valid_local.append(local_fpath)
-                l_valid_bucket.append(bucket_fpath)
+    local_fpaths = np.asarray(local_fpaths, dtype=object)
+    bucket_fpaths = np.asarray(bucket_fpaths, dtype=object)
+    n_files = len(local_fpaths)
+    if bucket_sizes is None:
+        bucket_sizes = [None] * n_files
+
+    # Retrieve local file sizes
+    local_sizes = _get_local_sizes(local_fpaths)
+    local_exists = local_sizes >= 0
+
+    # Retrieve bucket file sizes
+    # - Missing sizes are retrieved by fetching the files metadata
+    # - Files whose size can not be retrieved are not considered corrupted
+    bucket_sizes = np.array([-1 if size is None else size for size in bucket_sizes], dtype=np.int64)
+    is_unknown = local_exists & ((bucket_sizes < 0) | verify_checksum)
+    idx_unknown = np.flatnonzero(is_unknown)
+    infos = get_files_info(fs=fs, fpaths=bucket_fpaths[idx_unknown], max_concurrency=max_concurrency)
+    for i, info in zip(idx_unknown, infos, strict=True):
+        if info is not None and info.get("size") is not None:
+            bucket_sizes[i] = info["size"]
+
+    # Identify corrupted files
+    is_corrupted = local_exists & (bucket_sizes >= 0) & (bucket_sizes != local_sizes)
+
+    # Optionally verify checksums
+    if verify_checksum:
+        for i, info in zip(idx_unknown, infos, strict=True):
+            md5 = _get_md5_from_etag(info)
+            if not is_corrupted[i] and md5 is not None and _get_md5_checksum(local_fpaths[i]) != md5:
+                is_corrupted[i] = True
+
+    # Remove corrupted files
+    # - The same file can be listed multiple times or be removed by another process
+    for fpath in set(local_fpaths[is_corrupted]):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(fpath)
+
     if return_corrupted_fpaths:
-        return l_corrupted_local, l_corrupted_bucket
-    return l_valid_local, l_valid_bucket
+        return local_fpaths[is_corrupted].tolist(), bucket_fpaths[is_corrupted].tolist()
+    is_valid = local_exists & ~is_corrupted
+    return local_fpaths[is_valid].tolist(), bucket_fpaths[is_valid].tolist()
 
 
 def _select_missing_fpaths(local_fpaths, bucket_fpaths):
@@ -149,52 +291,346 @@ def _get_local_from_bucket_fpaths(base_dir, network, product, radar, bucket_fpat
     return fpaths
 
 
-def _fs_get_parallel(bucket_fpaths, local_fpaths, fs, n_threads=10, progress_bar=True):
+_REPORT_COLUMNS = ["bucket_fpath", "local_fpath", "error_type", "error_message", "n_attempts"]
+
+
+def _check_n_threads(n_threads):
+    """Check the number of download threads. The max value is set automatically to 50."""
+    n_threads = max(n_threads, 1)
+    return min(n_threads, 50)
+
+
+class _ThreadDownloader:
+    """Download files with a pool of threads calling ``fs.get_file``."""
+
+    def __init__(self, fs, n_threads, n_retries=5):
+        self.fs = fs
+        self.n_retries = n_retries
+        self.executor = ThreadPoolExecutor(max_workers=_check_n_threads(n_threads))
+
+    def submit(self, bucket_fpath, local_fpath):
+        """Schedule the download of a file and return a concurrent.futures.Future."""
+        return self.executor.submit(transfer_file, self.fs, bucket_fpath, local_fpath, n_retries=self.n_retries)
+
+    def shutdown(self):
+        """Wait for all downloads to complete."""
+        self.executor.shutdown(wait=True)
+
+
+class _AsyncDownloader:
+    """Download files with the filesystem coroutines running on the fsspec event loop.
+
+    The number of concurrent downloads is bounded by an asyncio semaphore.
+    No additional OS thread is created.
+    """
+
+    def __init__(self, fs, n_concurrent, n_retries=5):
+        if not getattr(fs, "async_impl", False):
+            raise ValueError("The 'async' download backend requires an asynchronous filesystem (i.e. protocol='s3').")
+        self.fs = fs
+        self.n_retries = n_retries
+        self.semaphore = asyncio.Semaphore(max(n_concurrent, 1))
+        self.futures = []
+
+    async def _get_file(self, bucket_fpath, local_fpath):
+        async with self.semaphore:
+            return await async_transfer_file(self.fs, bucket_fpath, local_fpath, n_retries=self.n_retries)
+
+    def submit(self, bucket_fpath, local_fpath):
+        """Schedule the download of a file and return a concurrent.futures.Future."""
+        future = asyncio.run_coroutine_threadsafe(self._get_file(bucket_fpath, local_fpath), self.fs.loop)
+        self.futures.append(future)
+        return future
+
+    def shutdown(self):
+        """Wait for all downloads to complete."""
+        concurrent.futures.wait(self.futures)
+
+
+def _get_downloader(fs, backend="threads", n_threads=20, n_retries=5):
+    """Return the downloader implementing the specified download backend."""
+    if backend == "threads":
+        return _ThreadDownloader(fs=fs, n_threads=n_threads, n_retries=n_retries)
+    if backend == "async":
+        return _AsyncDownloader(fs=fs, n_concurrent=n_threads, n_retries=n_retries)
+    raise ValueError(f"Invalid download backend '{backend}'. Valid backends are 'threads' and 'async'.")
+
+
+def _search_catalog(catalog, radar, start_time, end_time):
+    """Return the ``{filepath: size}`` dictionary of the catalog files of a radar within a time period."""
+    sub_catalog = catalog.sel(radar=radar).sel_time(start_time, end_time)
+    return dict(zip(sub_catalog.filepaths, sub_catalog.sizes, strict=True))
+
+
+def _check_catalog(catalog, network, product):
+    """Check the file catalog matches the network product to download."""
+    if catalog is None:
+        return None
+    if not isinstance(catalog, FileCatalog):
+        raise TypeError("'catalog' must be a radar_api.FileCatalog.")
+    if catalog.network != network or catalog.product != product:
+        raise ValueError(
+            f"The catalog refers to the {catalog.network} {catalog.product} product, "
+            f"not to the {network} {product} product.",
+        )
+    return catalog
+
+
+def _download_pipeline(
+    network,
+    radars,
+    product,
+    time_blocks,
+    fs,
+    *,
+    base_dir,
+    protocol="s3",
+    fs_args={},
+    n_threads=20,
+    max_concurrency=20,
+    backend="threads",
+    n_retries=5,
+    force_download=False,
+    progress_bar=True,
+    verbose=True,
+    catalog=None,
+):
     """
-    Run fs.get() asynchronously in parallel using multithreading.
+    Search and download the files of multiple radars and time blocks with a pipelined engine.
+
+    The files of all radars and time blocks are searched concurrently. As soon as the search
+    of a time block completes, its files are submitted to a single shared downloader.
+    The downloader therefore keeps busy across radars and time blocks boundaries.
 
     Parameters
     ----------
-    bucket_fpaths : list
-        List of bucket filepaths to download.
-    local_fpath : list
-        List of filepaths where to save data on local storage.
+    radars : list
+        List of radar names.
+    time_blocks : list
+        List of (start_time, end_time) tuples.
+    fs : fsspec.FileSystem
+        fsspec filesystem instance used to download the files.
     n_threads : int, optional
         Number of files to be downloaded concurrently.
-        The default is 10. The max value is set automatically to 50.
+        The default is 20. With the 'threads' backend, the max value is set automatically to 50.
+    max_concurrency : int, optional
+        Maximum number of time blocks searched concurrently.
+        The default is 20.
+    backend : str, optional
+        The download backend. Either 'threads' or 'async'. The default is 'threads'.
+    n_retries : int, optional
+        Maximum number of retries of each file transfer on transient errors. The default is 5.
+    catalog : radar_api.FileCatalog, optional
+        If specified, the files of each time block are selected from the catalog
+        instead of being searched on the cloud bucket. The default is None.
 
     Returns
     -------
-    List of cloud bucket filepaths which were not downloaded.
+    dict
+        Dictionary of format ``{<radar>: <summary>}``. Each summary is a dictionary with the queried
+        ``local_fpaths``, ``bucket_fpaths`` and ``bucket_sizes``, the ``failures`` list of dictionaries
+        describing the files which could not be downloaded, and the ``n_total_files``,
+        ``n_existing_files`` and ``n_downloaded_files`` counts.
     """
-    # Check n_threads
-    n_threads = max(n_threads, 1)
-    n_threads = min(n_threads, 50)
+    max_concurrency = max(int(max_concurrency), 1)
+    downloader = _get_downloader(fs=fs, backend=backend, n_threads=n_threads, n_retries=n_retries)
 
-    ##------------------------------------------------------------------------.
     # Initialize progress bar
-    if progress_bar:
-        n_files = len(local_fpaths)
-        pbar = tqdm(total=n_files)
-    with ThreadPoolExecutor(max_workers=n_threads) as executor:
-        dict_futures = {
-            executor.submit(fs.get, bucket_path, local_fpath): bucket_path
-            for bucket_path, local_fpath in zip(bucket_fpaths, local_fpaths, strict=False)
+    # - The total number of files is updated as soon as a time block search completes
+    pbar = tqdm(total=0) if progress_bar else None
+
+    summaries = {
+        radar: {
+            "local_fpaths": [],
+            "bucket_fpaths": [],
+            "bucket_sizes": [],
+            "failures": [],
+            "n_total_files": 0,
+            "n_existing_files": 0,
+            "n_downloaded_files": 0,
         }
-        # List files that didn't work
-        l_file_error = []
-        for future in concurrent.futures.as_completed(dict_futures.keys()):
-            # Update the progress bar
-            if progress_bar:
-                pbar.update(1)
-            # Collect all commands that caused problems
-            if future.exception() is not None:
-                l_file_error.append(dict_futures[future])
-    if progress_bar:
-        pbar.close()
-    ##------------------------------------------------------------------------.
-    # Return list of bucket fpaths raising errors
-    return l_file_error
+        for radar in radars
+    }
+
+    def _search_block(radar, start_time, end_time):
+        if catalog is not None:
+            return _search_catalog(catalog, radar=radar, start_time=start_time, end_time=end_time)
+        return find_files(
+            protocol=protocol,
+            fs_args=fs_args,
+            radar=radar,
+            network=network,
+            product=product,
+            start_time=start_time,
+            end_time=end_time,
+            base_dir=None,
+            max_concurrency=1,
+            detail=True,
+            verbose=False,
+        )
+
+    blocks = [(radar, start_time, end_time) for radar in radars for start_time, end_time in time_blocks]
+    dict_futures = {}
+    # Files overlapping a time block boundary are returned by the searches of both time blocks:
+    # they must be recorded and downloaded only once
+    seen_fpaths = set()
+    try:
+        with ThreadPoolExecutor(max_workers=max(min(max_concurrency, len(blocks)), 1)) as search_executor:
+            # Search files of all radars and time blocks concurrently
+            search_futures = {search_executor.submit(_search_block, *block): block for block in blocks}
+            # Submit the files of each time block to the downloader as soon as they are found
+            for search_future in concurrent.futures.as_completed(search_futures):
+                radar, start_time, end_time = search_futures[search_future]
+                summary = summaries[radar]
+                dict_sizes = {fpath: size for fpath, size in search_future.result().items() if fpath not in seen_fpaths}
+                seen_fpaths.update(dict_sizes)
+                bucket_fpaths = list(dict_sizes)
+
+                # Check there are files to retrieve
+                n_files = len(bucket_fpaths)
+                summary["n_total_files"] += n_files
+                if n_files == 0:
+                    continue
+
+                # Define local destination fpaths
+                local_fpaths = _get_local_from_bucket_fpaths(
+                    base_dir=base_dir,
+                    network=network,
+                    radar=radar,
+                    product=product,
+                    bucket_fpaths=bucket_fpaths,
+                )
+
+                # Record the local and bucket fpath queried
+                summary["local_fpaths"] += local_fpaths
+                summary["bucket_fpaths"] += bucket_fpaths
+                summary["bucket_sizes"] += list(dict_sizes.values())
+
+                # Optionally exclude files that already exist on disk
+                if not force_download:
+                    local_fpaths, bucket_fpaths = _select_missing_fpaths(
+                        local_fpaths=local_fpaths,
+                        bucket_fpaths=bucket_fpaths,
+                    )
+                    # Update count of existing files on disk
+                    summary["n_existing_files"] += n_files - len(bucket_fpaths)
+
+                # Check there are still files to retrieve
+                n_files = len(local_fpaths)
+                summary["n_downloaded_files"] += n_files
+                if n_files == 0:
+                    continue
+
+                # Create local directories
+                create_local_directories(local_fpaths)
+
+                # Print # files to download
+                if verbose:
+                    radar_name = f"{radar} " if len(radars) > 1 else ""
+                    print(f" - Downloading {n_files} {radar_name}files from {start_time} to {end_time}")
+
+                # Submit the downloads to the shared downloader
+                if pbar is not None:
+                    pbar.total += n_files
+                    pbar.refresh()
+                for bucket_fpath, local_fpath in zip(bucket_fpaths, local_fpaths, strict=True):
+                    future = downloader.submit(bucket_fpath, local_fpath)
+                    if pbar is not None:
+                        future.add_done_callback(lambda _: pbar.update(1))
+                    dict_futures[future] = (radar, bucket_fpath, local_fpath)
+    finally:
+        # Wait for all downloads to complete
+        downloader.shutdown()
+        if pbar is not None:
+            pbar.close()
+
+    # Report files that didn't work
+    for future, (radar, bucket_fpath, local_fpath) in dict_futures.items():
+        error = future.exception()
+        if error is None:
+            continue
+        if not isinstance(error, TransferError):
+            error = TransferError(bucket_fpath, local_fpath, error=error, n_attempts=1)
+        summaries[radar]["failures"].append(error.to_dict())
+    return summaries
+
+
+def _finalize_download(
+    summary,
+    fs,
+    network,
+    product,
+    radar,
+    *,
+    base_dir,
+    t_elapsed,
+    force_download=False,
+    check_data_integrity=True,
+    verify_checksum=False,
+    max_concurrency=20,
+    verbose=True,
+):
+    """Report the download outcome, check the data integrity and update the local inventory of a radar.
+
+    Returns
+    -------
+    tuple
+        The list of valid local filepaths and the report of the files which could not be downloaded.
+    """
+    list_all_local_fpaths = summary["local_fpaths"]
+    list_all_bucket_fpaths = summary["bucket_fpaths"]
+    n_total_files = summary["n_total_files"]
+    n_existing_files = summary["n_existing_files"]
+    n_downloaded_files = summary["n_downloaded_files"]
+    report = pd.DataFrame(summary["failures"], columns=_REPORT_COLUMNS)
+
+    # Report errors if occurred
+    if verbose:
+        l_bucket_errors = report["bucket_fpath"].tolist()
+        n_errors = len(l_bucket_errors)
+        if n_errors > 0:
+            print(f" - Unable to download the following files: {l_bucket_errors}")
+
+    # Report the total number of file downloaded
+    if verbose:
+        t_elapsed = round(t_elapsed)
+        if not force_download and n_existing_files > 0:
+            print(
+                f" - {n_existing_files}/{n_total_files} files were already present on disk !",
+            )
+        if n_downloaded_files > 0:
+            print(
+                f" - {n_downloaded_files}/{n_total_files} files have been downloaded in {t_elapsed} seconds !",
+            )
+
+        print("-------------------------------------------------------------------- ")
+
+    # Check for data corruption
+    if check_data_integrity:
+        if verbose:
+            print("Checking data integrity:")
+        list_all_local_fpaths, _ = remove_corrupted_files(
+            list_all_local_fpaths,
+            list_all_bucket_fpaths,
+            fs=fs,
+            return_corrupted_fpaths=False,
+            bucket_sizes=summary["bucket_sizes"],
+            verify_checksum=verify_checksum,
+            max_concurrency=max_concurrency,
+        )
+        if verbose:
+            n_corrupted = len(list_all_bucket_fpaths) - len(list_all_local_fpaths)
+            print(f" - {n_corrupted} corrupted files were identified and removed.")
+            print(
+                "--------------------------------------------------------------------",
+            )
+
+    # Update the local inventory (if built)
+    inventory = get_local_inventory(base_dir)
+    if inventory is not None and inventory.is_indexed(network=network, product=product):
+        with contextlib.suppress(sqlite3.Error):
+            inventory.update_files(list_all_local_fpaths, network=network, product=product, radar=radar)
+    return sorted(list_all_local_fpaths), report
 
 
 def get_end_of_day(time):
@@ -252,6 +688,13 @@ def download_files(
     base_dir=None,
     protocol="s3",
     fs_args={},
+    *,
+    max_concurrency=20,
+    backend="threads",
+    n_retries=5,
+    verify_checksum=False,
+    return_report=False,
+    catalog=None,
 ):
     """
     Download files from a cloud bucket storage.
@@ -282,7 +725,28 @@ def download_files(
         The default is an empty dictionary. Anonymous connection is set by default.
     n_threads: int
         Number of files to be downloaded concurrently.
-        The default is 20. The max value is set automatically to 50.
+        The default is 20. With the 'threads' backend, the max value is set automatically to 50.
+    max_concurrency : int, optional
+        Maximum number of daily time blocks searched concurrently.
+        The files of each time block are downloaded as soon as they are found.
+        It also bounds the number of concurrent requests of the data integrity check.
+        The default is 20.
+    backend : str, optional
+        The download backend.
+        If 'threads', files are downloaded by a pool of threads calling ``fs.get_file``.
+        If 'async', files are downloaded by the filesystem coroutines on the fsspec event loop,
+        without additional OS threads. The number of concurrent downloads (``n_threads``)
+        can then be set in the hundreds. It requires an asynchronous filesystem (i.e. protocol='s3').
+        The default is 'threads'.
+    n_retries : int, optional
+        Maximum number of retries of each file transfer on transient errors
+        (i.e. throttling, server or connection errors). Retries are spaced by an exponential
+        backoff with jitter. Files are first written to a temporary ``.part`` file, which
+        is renamed once the transfer succeeds. Transfers interrupted by a transient error,
+        by a killed process or by exhausted retries are resumed with range requests
+        (also by a later call) if the cloud bucket file is unchanged.
+        Errors of the local storage (i.e. no space left on device) are not retried.
+        The default is 5.
     force_download: bool
         If True, it downloads and overwrites the files already existing on local storage.
         If False, it does not downloads files already existing on local storage.
@@ -290,13 +754,33 @@ def download_files(
     check_data_integrity: bool
         If True, it checks that the downloaded files are not corrupted.
         Corruption is assessed by comparing file size between local and cloud bucket storage.
+        The cloud bucket file sizes are taken from the directory listings when available.
         The default is True.
+    verify_checksum: bool
+        If True and check_data_integrity is True, it also compares the MD5 checksum of
+        the local files against the ETag of the cloud bucket files.
+        The default is False.
     progress_bar: bool
         If True, it displays a progress bar showing the download status.
         The default is True.
     verbose : bool, optional
         If True, it print some information concerning the download process.
         The default is False.
+    return_report : bool, optional
+        If True, it also returns a pandas.DataFrame reporting the files which could not be
+        downloaded, with the columns ``bucket_fpath``, ``local_fpath``, ``error_type``,
+        ``error_message`` and ``n_attempts``.
+        The default is False.
+    catalog : radar_api.FileCatalog, optional
+        A file catalog of the cloud bucket files, as returned by ``find_files(return_catalog=True)``.
+        If specified, the files to download are selected from the catalog and the
+        cloud bucket is not searched again. The default is None.
+
+    Returns
+    -------
+    list or tuple
+        The sorted list of local filepaths.
+        If ``return_report=True``, a tuple ``(filepaths, report)``.
 
     """
     # -------------------------------------------------------------------------.
@@ -309,6 +793,7 @@ def download_files(
     radar = check_radar(radar=radar, network=network)
     product = check_product(network=network, product=product)
     start_time, end_time = check_start_end_time(start_time, end_time)
+    catalog = _check_catalog(catalog, network=network, product=product)
 
     # Initialize timing
     t_i = time.time()
@@ -324,114 +809,185 @@ def download_files(
         print("-------------------------------------------------------------------- ")
         print(f"Starting downloading {network.upper()} {radar} data between {start_time} and {end_time}.")
 
-    # Loop over daily time blocks (to search for data)
-    list_all_local_fpaths = []
-    list_all_bucket_fpaths = []
-    n_downloaded_files = 0
-    n_existing_files = 0
-    n_total_files = 0
-    for start_time, end_time in time_blocks:
-        # Retrieve bucket fpaths
-        bucket_fpaths = find_files(
-            protocol=protocol,
-            fs_args=fs_args,
-            radar=radar,
-            network=network,
-            product=product,
-            start_time=start_time,
-            end_time=end_time,
-            base_dir=None,
-            verbose=False,
-        )
-        # Check there are files to retrieve
-        n_files = len(bucket_fpaths)
-        n_total_files += n_files
-        if n_files == 0:
-            continue
+    # Search and download the data of all daily time blocks
+    summaries = _download_pipeline(
+        network=network,
+        radars=[radar],
+        product=product,
+        time_blocks=time_blocks,
+        fs=fs,
+        base_dir=base_dir,
+        protocol=protocol,
+        fs_args=fs_args,
+        n_threads=n_threads,
+        max_concurrency=max_concurrency,
+        backend=backend,
+        n_retries=n_retries,
+        force_download=force_download,
+        progress_bar=progress_bar,
+        verbose=verbose,
+        catalog=catalog,
+    )
+    list_all_local_fpaths, report = _finalize_download(
+        summary=summaries[radar],
+        fs=fs,
+        network=network,
+        product=product,
+        radar=radar,
+        base_dir=base_dir,
+        t_elapsed=time.time() - t_i,
+        force_download=force_download,
+        check_data_integrity=check_data_integrity,
+        verify_checksum=verify_checksum,
+        max_concurrency=max_concurrency,
+        verbose=verbose,
+    )
 
-        # Define local destination fpaths
-        local_fpaths = _get_local_from_bucket_fpaths(
-            base_dir=base_dir,
-            network=network,
-            radar=radar,
-            product=product,
-            bucket_fpaths=bucket_fpaths,
-        )
+    # Return list of local fpaths
+    if return_report:
+        return list_all_local_fpaths, report
+    return list_all_local_fpaths
 
-        # Record the local and bucket fpath queried
-        list_all_local_fpaths = list_all_local_fpaths + local_fpaths
-        list_all_bucket_fpaths = list_all_bucket_fpaths + bucket_fpaths
 
-        # Optionally exclude files that already exist on disk
-        if not force_download:
-            local_fpaths, bucket_fpaths = _select_missing_fpaths(
-                local_fpaths=local_fpaths,
-                bucket_fpaths=bucket_fpaths,
-            )
-            # Update count of existing files on disk
-            n_existing_files += n_files - len(bucket_fpaths)
+####---------------------------------------------------------------------------.
 
-        # Check there are still files to retrieve
-        n_files = len(local_fpaths)
-        n_downloaded_files += n_files
-        if n_files == 0:
-            continue
 
-        # Create local directories
-        create_local_directories(local_fpaths)
+@print_elapsed_time
+def download_files_multi(
+    network,
+    radars,
+    start_time,
+    end_time,
+    product=None,
+    *,
+    n_threads=20,
+    force_download=False,
+    check_data_integrity=True,
+    progress_bar=True,
+    verbose=True,
+    base_dir=None,
+    protocol="s3",
+    fs_args={},
+    max_concurrency=20,
+    backend="threads",
+    n_retries=5,
+    verify_checksum=False,
+    return_report=False,
+    catalog=None,
+):
+    """
+    Download the files of multiple radars from a cloud bucket storage.
 
-        # Print # files to download
-        if verbose:
-            print(f" - Downloading {n_files} files from {start_time} to {end_time}")
+    The configuration is checked and the filesystem is created only once.
+    The files of all radars are searched concurrently and downloaded by a single
+    shared downloader, which keeps busy across radars.
 
-        # Download data asynchronously with multithreading
-        l_bucket_errors = _fs_get_parallel(
-            bucket_fpaths=bucket_fpaths,
-            local_fpaths=local_fpaths,
-            fs=fs,
-            n_threads=n_threads,
-            progress_bar=progress_bar,
-        )
-        # Report errors if occurred
-        if verbose:
-            n_errors = len(l_bucket_errors)
-            if n_errors > 0:
-                print(f" - Unable to download the following files: {l_bucket_errors}")
+    Parameters
+    ----------
+    network : str
+        The name of the radar network.
+        See `radar_api.available_network()` for available radar networks.
+    radars : list
+        List of radar names, or list of ``(network, radar)`` tuples as returned by
+        ``radar_api.available_radars_within_extent`` or ``radar_api.available_radars_around_point``.
+        Tuples of other networks are discarded.
+    start_time : datetime.datetime
+        The start (inclusive) time of the interval period for retrieving the filepaths.
+    end_time : datetime.datetime
+        The end (exclusive) time of the interval period for retrieving the filepaths.
+    n_threads: int
+        Number of files to be downloaded concurrently across all radars.
+        The default is 20. With the 'threads' backend, the max value is set automatically to 50.
+    max_concurrency : int, optional
+        Maximum number of daily time blocks searched concurrently across all radars.
+        The default is 20.
+    return_report : bool, optional
+        If True, it also returns a pandas.DataFrame reporting the files which could not be
+        downloaded, with an additional ``radar`` column. The default is False.
 
-    # Report the total number of file downloaded
-    if verbose:
-        t_f = time.time()
-        t_elapsed = round(t_f - t_i)
-        if not force_download and n_existing_files > 0:
-            print(
-                f" - {n_existing_files}/{n_total_files} files were already present on disk !",
-            )
-        if n_downloaded_files > 0:
-            print(
-                f" - {n_downloaded_files}/{n_total_files} files have been downloaded in {t_elapsed} seconds !",
-            )
+    See ``radar_api.download_files`` for the description of the other arguments.
+
+    Returns
+    -------
+    dict or tuple
+        Dictionary of format ``{<radar>: <sorted list of local filepaths>}``.
+        If ``return_report=True``, a tuple ``(dict_filepaths, report)``.
+
+    """
+    # -------------------------------------------------------------------------.
+    # Get default directory
+    base_dir = get_base_dir(base_dir)
+    # Checks
+    check_download_protocol(protocol)
+    base_dir = check_base_dir(base_dir)
+    network = check_network(network)
+    radars = check_radars(radars=radars, network=network)
+    product = check_product(network=network, product=product)
+    start_time, end_time = check_start_end_time(start_time, end_time)
+    catalog = _check_catalog(catalog, network=network, product=product)
+
+    # Initialize timing
+    t_i = time.time()
+
+    # -------------------------------------------------------------------------.
+    # Get filesystem
+    fs = get_filesystem(protocol=protocol, fs_args=fs_args)
+
+    # Define list of daily time blocks (start_time, end_time)
+    time_blocks = get_list_daily_time_blocks(start_time, end_time)
 
+    if verbose:
         print("-------------------------------------------------------------------- ")
+        print(
+            f"Starting downloading {network.upper()} data of {len(radars)} radars between {start_time} and {end_time}.",
+        )
 
-    # Check for data corruption
-    if check_data_integrity:
+    # Search and download the data of all radars and daily time blocks
+    summaries = _download_pipeline(
+        network=network,
+        radars=radars,
+        product=product,
+        time_blocks=time_blocks,
+        fs=fs,
+        base_dir=base_dir,
+        protocol=protocol,
+        fs_args=fs_args,
+        n_threads=n_threads,
+        max_concurrency=max_concurrency,
+        backend=backend,
+        n_retries=n_retries,
+        force_download=force_download,
+        progress_bar=progress_bar,
+        verbose=verbose,
+        catalog=catalog,
+    )
+    t_elapsed = time.time() - t_i
+
+    # Finalize the download of each radar
+    dict_filepaths = {}
+    list_reports = []
+    for radar, summary in summaries.items():
         if verbose:
-            print("Checking data integrity:")
-        list_all_local_fpaths, _ = remove_corrupted_files(
-            list_all_local_fpaths,
-            list_all_bucket_fpaths,
+            print(f"{network.upper()} {radar}:")
+        dict_filepaths[radar], report = _finalize_download(
+            summary=summary,
             fs=fs,
-            return_corrupted_fpaths=False,
+            network=network,
+            product=product,
+            radar=radar,
+            base_dir=base_dir,
+            t_elapsed=t_elapsed,
+            force_download=force_download,
+            check_data_integrity=check_data_integrity,
+            verify_checksum=verify_checksum,
+            max_concurrency=max_concurrency,
+            verbose=verbose,
         )
-        if verbose:
-            n_corrupted = len(list_all_bucket_fpaths) - len(list_all_local_fpaths)
-            print(f" - {n_corrupted} corrupted files were identified and removed.")
-            print(
-                "--------------------------------------------------------------------",
-            )
-
-    # Return list of local fpaths
-    return sorted(list_all_local_fpaths)
-
-
-####---------------------------------------------------------------------------.
+        list_reports.append(report.assign(radar=radar))
+
+    # Return the local fpaths of each radar
+    if return_report:
+        report = pd.concat(list_reports, ignore_index=True) if list_reports else pd.DataFrame(columns=_REPORT_COLUMNS)
+        report = report.reindex(columns=["radar", *_REPORT_COLUMNS])
+        return dict_filepaths, report
+    return dict_filepaths
@@ -25,10 +25,12 @@
 
 # -----------------------------------------------------------------------------.
 """This module provides files filtering functions."""
-import datetime
+
+import numpy as np
 
 from radar_api.checks import check_product, check_start_end_time
-from radar_api.info import get_info_from_filepath
+from radar_api.info import get_info_from_filepath, parse_filepaths
+from radar_api.io import get_product_file_time_coverage
 
 
 def is_file_within_time(start_time, end_time, file_start_time, file_end_time):
@@ -52,6 +54,59 @@ def is_file_within_time(start_time, end_time, file_start_time, file_end_time):
     return is_case1 or is_case2 or is_case3
 
 
+def are_files_within_time(start_time, end_time, file_start_times, file_end_times):
+    """Check which files are within start_time and end_time.
+
+    Vectorized version of ``is_file_within_time`` over arrays of file start and end times.
+    """
+    start_time = np.datetime64(start_time)
+    end_time = np.datetime64(end_time)
+    file_start_times = np.asarray(file_start_times, dtype="datetime64[us]")
+    file_end_times = np.asarray(file_end_times, dtype="datetime64[us]")
+    is_case1 = (file_start_times <= start_time) & (file_end_times > start_time)
+    is_case2 = (file_start_times >= start_time) & (file_end_times <= end_time)
+    is_case3 = (file_start_times < end_time) & (file_end_times > end_time)
+    return is_case1 | is_case2 | is_case3
+
+
+def fill_files_end_time(file_start_times, file_end_times, file_time_coverage):
+    """Fill the missing file end times with the file start time plus the file time coverage."""
+    file_start_times = np.asarray(file_start_times, dtype="datetime64[us]")
+    file_end_times = np.asarray(file_end_times, dtype="datetime64[us]")
+    return np.where(
+        np.isnat(file_end_times),
+        file_start_times + np.timedelta64(file_time_coverage),
+        file_end_times,
+    )
+
+
+def are_parsed_files_within_time(df, network, product, start_time, end_time):
+    """Check which files of a table of parsed filepaths are within start_time and end_time.
+
+    The table is expected to be returned by ``radar_api.info.parse_filepaths``.
+    Files without end time are assumed to last the product ``file_time_coverage``.
+    Files with missing start time are never selected.
+    """
+    file_start_times = df["start_time"].to_numpy(dtype="datetime64[us]")
+    file_end_times = fill_files_end_time(
+        file_start_times,
+        df["end_time"].to_numpy(dtype="datetime64[us]"),
+        file_time_coverage=get_product_file_time_coverage(network, product),
+    )
+    return are_files_within_time(start_time, end_time, file_start_times, file_end_times)
+
+
+def discard_unsupported_files(fpaths, network):
+    """Discard files which are not supported by RADAR-API."""
+    if network == "NEXRAD":
+        # NWS_NEXRAD_NXL2DP or NWS_NEXRAD_NXL2LG tar balls
+        fpaths = [fpath for fpath in fpaths if "NWS_NEXRAD" not in fpath]
+        fpaths = [fpath for fpath in fpaths if not fpath.endswith(".001")]  # repeated files
+        fpaths = [fpath for fpath in fpaths if not fpath.endswith(".Z")]  # corrupted compressed files
+        fpaths = [fpath for fpath in fpaths if not fpath.endswith("_MDM")]
+    return fpaths
+
+
 def filter_file(fpath, network, product, start_time, end_time):
     """Utility function to select a file is matching the specified time periods."""
     # Filter by start_time
@@ -65,9 +120,7 @@ def filter_file(fpath, network, product, start_time, end_time):
         file_start_time = info_dict.get("start_time")
         file_end_time = info_dict.get("end_time")
         if file_end_time is None:
-            file_end_time = file_start_time + datetime.timedelta(
-                minutes=7,
-            )  # TODO: maybe based on file_time_coverage setting?
+            file_end_time = file_start_time + get_product_file_time_coverage(network, product)
         if not is_file_within_time(start_time, end_time, file_start_time, file_end_time):
             return None
     return fpath
@@ -88,15 +141,19 @@ def filter_files(
 
     if isinstance(fpaths, str):
         fpaths = [fpaths]
-    fpaths = [
-        filter_file(
-            fpath,
-            network=network,
-            product=product,
-            start_time=start_time,
-            end_time=end_time,
-        )
-        for fpath in fpaths
-    ]
-    fpaths = [fpath for fpath in fpaths if fpath is not None]
-    return fpaths
+    fpaths = list(fpaths)
+    if start_time is None or end_time is None or len(fpaths) == 0:
+        return fpaths
+
+    # Parse all filenames at once
+    # - Files without the expected filename structure have a missing start time and are discarded
+    df = parse_filepaths(fpaths, network=network, product=product, ignore_errors=True)
+    # Subset by time
+    is_selected = are_parsed_files_within_time(
+        df,
+        network=network,
+        product=product,
+        start_time=start_time,
+        end_time=end_time,
+    )
+    return [fpath for fpath, selected in zip(fpaths, is_selected, strict=True) if selected]
@@ -26,15 +26,19 @@
 # -----------------------------------------------------------------------------.
 """This module provides tools to extract information from radar filenames."""
 
+import contextlib
+import datetime
 import os
 import re
 from collections import defaultdict
+from functools import cache
 
 import numpy as np
-from trollsift import Parser
+import pandas as pd
 
 from radar_api.checks import check_product
-from radar_api.io import get_product_filename_patterns
+from radar_api.io import get_directory_pattern, get_product_filename_patterns
+from radar_api.utils.patterns import FilenameParser
 
 # TODO: Create a class all such methods that depend on the filename_patterns and network
 
@@ -80,22 +84,24 @@ DEFAULT_FILE_KEY = {
 ##########################
 
 
+@cache
+def _compile_filename_parser(filename_patterns):
+    """Compile a tuple of filename patterns into a filename parser."""
+    return FilenameParser(filename_patterns)
+
+
+def get_filename_parser(network, product):
+    """Return the precompiled filename parser of a network product.
+
+    The filename patterns are compiled only once per process.
+    """
+    filename_patterns = get_product_filename_patterns(network, product)
+    return _compile_filename_parser(tuple(filename_patterns))
+
+
 def parse_filename(filename, network, product):
     """Try to parse the filename based on the radar network."""
-    filename_patterns = get_product_filename_patterns(network, product)
-    pattern_identified = False
-    for pattern in filename_patterns:
-        try:
-            p = Parser(pattern)
-            info_dict = p.parse(filename)
-            pattern_identified = True
-        except Exception:
-            pass
-        if pattern_identified:
-            break
-    if not pattern_identified:
-        info_dict = {}
-    return info_dict
+    return get_filename_parser(network, product).parse(filename)
 
 
 def get_info_from_filename(filename, network, product, ignore_errors=False):
@@ -131,15 +137,152 @@ def get_key_from_filepath(filepath, key, network, product, ignore_errors=False):
     return get_info_from_filepath(filepath, network=network, product=product, ignore_errors=ignore_errors)[key]
 
 
-def get_key_from_filepaths(filepaths, key, network, product=None, ignore_errors=False):
-    """Extract specific key information from a list of filepaths."""
+####--------------------------------------------------------------------------.
+###############################
+#### Batch filepaths parser ####
+###############################
+
+
+def _parse_filenames_with_pattern(filenames, pattern):
+    """Parse a list of filenames with a precompiled filename pattern.
+
+    Returns a :py:class:`pandas.DataFrame` with the typed values of the successfully
+    parsed filenames. The DataFrame index corresponds to the filenames positions.
+    """
+    is_matched, dict_values = pattern.extract(filenames)
+    df = pd.DataFrame(dict_values).loc[is_matched]
+    for key, format_spec in pattern.format_specs.items():
+        if "%" in format_spec:
+            df[key] = pd.to_datetime(df[key], format=format_spec, errors="coerce")
+            is_valid = df[key].notna()
+        elif key in pattern.converters:
+            converter = pattern.converters[key]
+
+            def _try_convert(value, converter=converter):
+                try:
+                    return converter(value)
+                except ValueError:
+                    return None
+
+            df[key] = df[key].map(_try_convert).astype(object)
+            is_valid = df[key].notna()
+        else:
+            continue
+        # Discard filenames which can't be converted (i.e. invalid dates)
+        df = df.loc[is_valid]
+    return df
+
+
+def _get_filenames(filepaths):
+    """Return the filenames of a list of filepaths."""
+    if os.name == "nt":
+        return [os.path.basename(filepath) for filepath in filepaths]
+    return [filepath.rpartition("/")[2] for filepath in filepaths]
+
+
+def _format_file_keys(df, integer_version=True):
+    """Set default file keys values and column types of the parsed filepaths table."""
+    for key, default_value in DEFAULT_FILE_KEY.items():
+        if key in ["start_time", "end_time"]:
+            df[key] = pd.to_datetime(df[key]) if key in df else pd.Series(pd.NaT, index=df.index, dtype="M8[ns]")
+        elif key == "version" and integer_version:
+            if key in df:
+                versions = pd.to_numeric(df[key], errors="coerce")
+                # Extract the version number from non-numeric version strings (i.e. 'V06')
+                is_non_numeric = versions.isna() & df[key].notna() & (df[key] != "")
+                if is_non_numeric.any():
+                    extracted = df.loc[is_non_numeric, key].astype(str).str.extract(r"(\d+)", expand=False)
+                    versions[is_non_numeric] = pd.to_numeric(extracted)
+                df[key] = versions.astype("Int64")
+            else:
+                df[key] = pd.Series(pd.NA, index=df.index, dtype="Int64")
+        else:
+            df[key] = df[key].fillna(default_value).astype(object) if key in df else default_value
+    return df
+
+
+def parse_filepaths(filepaths, network, product=None, ignore_errors=False, *, integer_version=True):
+    """Parse a list of filepaths into a table of file information.
+
+    The filenames are parsed in a single vectorized pass for each filename pattern
+    of the network product.
+
+    Parameters
+    ----------
+    filepaths : list or str
+        List of filepaths.
+    network : str
+        The name of the radar network.
+    product : str, optional
+        The product acronym. It must be specified if multiple products are
+        available for the network.
+    ignore_errors : bool, optional
+        If ``False`` (the default), raise an error if a filename can not be parsed.
+        If ``True``, the information of filenames that can not be parsed are set to missing values.
+    integer_version : bool, optional
+        If ``True`` (the default), ``version`` is converted to a nullable integer.
+        If ``False``, ``version`` keeps the version strings of the filenames.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame with one row per filepath (in the input order) and columns
+        ``filepath``, ``radar_acronym``, ``volume_identifier``, ``sweep_identifier``,
+        ``start_time``, ``end_time``, ``version`` and ``extension``.
+        ``start_time`` and ``end_time`` have ``datetime64`` type, while ``version``
+        is a nullable integer (or a string if ``integer_version=False``).
+    """
     product = check_product(network, product=product)
     if isinstance(filepaths, str):
         filepaths = [filepaths]
-    return [
-        get_key_from_filepath(filepath, key=key, network=network, product=product, ignore_errors=ignore_errors)
-        for filepath in filepaths
-    ]
+    filepaths = list(filepaths)
+    filenames = np.array(_get_filenames(filepaths), dtype=object)
+
+    # Parse filenames with the first matching pattern
+    list_df = []
+    indices = np.arange(len(filenames))
+    for pattern in get_filename_parser(network, product).patterns:
+        if len(indices) == 0:
+            break
+        df = _parse_filenames_with_pattern(filenames[indices].tolist(), pattern)
+        df.index = indices[df.index.to_numpy()]
+        list_df.append(df)
+        indices = indices[np.isin(indices, df.index.to_numpy(), invert=True)]
+
+    # Check all filenames have been parsed
+    if len(indices) > 0 and not ignore_errors:
+        raise ValueError(f"Impossible to parse filename '{filenames[indices[0]]}' for {network} network.")
+
+    # Combine results in the input order
+    list_df = [df for df in list_df if len(df) > 0]
+    df = pd.concat(list_df) if len(list_df) > 0 else pd.DataFrame()
+    df = df.reindex(range(len(filepaths)))
+    df = _format_file_keys(df, integer_version=integer_version)
+    df.insert(0, "filepath", filepaths)
+    return df[["filepath", *FILE_KEYS]]
+
+
+def _get_key_values(df, key):
+    """Return the values of a column of the parsed filepaths table as a list of Python objects."""
+    values = df[key]
+    if key in ["start_time", "end_time"]:
+        # NaT are converted to None
+        return values.to_numpy().astype("datetime64[us]").tolist()
+    if key == "version" and isinstance(values.dtype, pd.Int64Dtype):
+        return ["" if pd.isna(version) else str(version) for version in values]
+    return values.tolist()
+
+
+def get_key_from_filepaths(filepaths, key, network, product=None, ignore_errors=False):
+    """Extract specific key information from a list of filepaths."""
+    df = parse_filepaths(
+        filepaths,
+        network=network,
+        product=product,
+        ignore_errors=ignore_errors,
+        integer_version=False,
+    )
+    return _get_key_values(df, key)
 
 
 ####--------------------------------------------------------------------------.
@@ -172,19 +315,9 @@ def get_end_time_from_filepaths(filepaths, network, product, ignore_errors=False
 
 def get_start_end_time_from_filepaths(filepaths, network, product=None, ignore_errors=False):
     """Infer files ``start_time`` and ``end_time`` from filenames."""
-    product = check_product(network, product=product)
-    list_start_time = get_start_time_from_filepaths(
-        filepaths,
-        network=network,
-        product=product,
-        ignore_errors=ignore_errors,
-    )
-    list_end_time = get_end_time_from_filepaths(
-        filepaths,
-        network=network,
-        product=product,
-        ignore_errors=ignore_errors,
-    )
+    df = parse_filepaths(filepaths, network=network, product=product, ignore_errors=ignore_errors)
+    list_start_time = _get_key_values(df, key="start_time")
+    list_end_time = _get_key_values(df, key="end_time")
     return np.array(list_start_time), np.array(list_end_time)
 
 
@@ -200,12 +333,97 @@ def get_version_from_filepath(filepath, network, product, integer=True):
 
 def get_version_from_filepaths(filepaths, network, product=None, integer=True):
     """Infer files ``version`` from filenames."""
+    df = parse_filepaths(filepaths, network=network, product=product, integer_version=integer)
+    if integer:
+        return [None if pd.isna(version) else int(version) for version in df["version"]]
+    return [None if version == "" else version for version in df["version"]]
+
+
+####--------------------------------------------------------------------------.
+##########################
+#### Radar information ####
+##########################
+
+# Regex of the fixed width strftime directives of the directory patterns
+_TIME_DIRECTIVE_REGEX = {"%Y": r"\d{4}", "%j": r"\d{3}", "%y": r"\d{2}", "%m": r"\d{2}", "%d": r"\d{2}", "%H": r"\d{2}"}
+
+
+def _get_directory_field_regex(field):
+    """Return the regex of a ``{name:format}`` field of a directory pattern."""
+    name, _, format_spec = field[1:-1].partition(":")
+    if name == "time":
+        return "".join(
+            _TIME_DIRECTIVE_REGEX.get(part, "[^/]+" if part.startswith("%") else re.escape(part))
+            for part in re.split(r"(%.)", format_spec)
+            if part != ""
+        )
+    width = re.match(r"\d*", format_spec).group()
+    regex = f"[^/]{{{width}}}" if width else "[^/]+"
+    return f"(?P<radar>{regex})" if name == "radar" else regex
+
+
+@cache
+def _compile_directory_regex(directory_pattern):
+    """Compile the regex matching the end of the directory paths of a directory pattern.
+
+    The regex captures the radar name. The leading directories without fields (i.e. the
+    protocol, bucket name and ``{base_dir}``) are not matched, so that the files can be
+    stored in any root directory.
+    """
+    components = directory_pattern.split("/")
+    idx_first_field = next(
+        (i for i, component in enumerate(components) if "{" in component and component != "{base_dir}"),
+        len(components),
+    )
+    regex = "(?:^|/)"
+    for part in re.split(r"(\{[^{}]*\})", "/".join(components[idx_first_field:])):
+        regex += _get_directory_field_regex(part) if part.startswith("{") else re.escape(part)
+    return re.compile(regex + "$")
+
+
+def _get_radar_from_directory(dir_path, directory_patterns):
+    """Return the radar name of a directory path, or None if it does not follow the directory patterns."""
+    dir_path = dir_path.replace(os.sep, "/")
+    for directory_pattern in directory_patterns:
+        match = _compile_directory_regex(directory_pattern).search(dir_path)
+        if match is not None and "radar" in match.groupdict():
+            return match.group("radar")
+    return None
+
+
+def get_radar_from_filepaths(filepaths, network, product=None, ignore_errors=False):
+    """Infer files ``radar`` from the directory paths.
+
+    The radar name is extracted from the directories following the local or cloud directory patterns
+    of the network product. Otherwise, the radar acronym of the filenames is returned.
+    """
     product = check_product(network, product=product)
     if isinstance(filepaths, str):
         filepaths = [filepaths]
-    return [
-        get_version_from_filepath(filepath, integer=integer, network=network, product=product) for filepath in filepaths
-    ]
+    directory_patterns = []
+    for protocol in ["local", "s3"]:
+        with contextlib.suppress(NotImplementedError):
+            directory_patterns.append(get_directory_pattern(protocol=protocol, network=network, product=product))
+    dir_radars = {}
+    for filepath in filepaths:
+        dir_path = os.path.dirname(filepath)
+        if dir_path not in dir_radars:
+            dir_radars[dir_path] = _get_radar_from_directory(dir_path, directory_patterns)
+    radars = [dir_radars[os.path.dirname(filepath)] for filepath in filepaths]
+    # Fall back to the radar acronym of the filenames
+    if any(radar is None for radar in radars):
+        radar_acronyms = get_key_from_filepaths(
+            filepaths,
+            key="radar_acronym",
+            network=network,
+            product=product,
+            ignore_errors=ignore_errors,
+        )
+        radars = [
+            radar_acronym if radar is None else radar
+            for radar, radar_acronym in zip(radars, radar_acronyms, strict=True)
+        ]
+    return radars
 
 
 ####--------------------------------------------------------------------------.
@@ -240,6 +458,10 @@ def get_season(time):
     return "SON"  # Autumn (September, October, November)
 
 
+# Season of each month
+_SEASONS = {month: get_season(datetime.date(2000, month, 1)) for month in range(1, 13)}
+
+
 def get_time_component(time, component):
     """Get time component from `datetime.datetime` object."""
     func_dict = {
@@ -259,27 +481,44 @@ def get_time_component(time, component):
     return str(func_dict[component](time))
 
 
-def _get_groups_value(groups, filepath, network, product):
-    """Return the value associated to the groups keys.
+def _get_time_component_values(times, component):
+    """Get the time component values of a :py:class:`pandas.Series` of ``datetime64`` times."""
+    func_dict = {
+        "year": lambda times: times.dt.year,
+        "month": lambda times: times.dt.month,
+        "day": lambda times: times.dt.day,
+        "doy": lambda times: times.dt.dayofyear,  # Day of year
+        "dow": lambda times: times.dt.dayofweek,  # Day of week (0=Monday, 6=Sunday)
+        "hour": lambda times: times.dt.hour,
+        "minute": lambda times: times.dt.minute,
+        "second": lambda times: times.dt.second,
+        # Additional
+        "month_name": lambda times: times.dt.month_name(),  # Full month name
+        "quarter": lambda times: times.dt.quarter,  # Quarter (1-4)
+        "season": lambda times: times.dt.month.map(_SEASONS),  # Season (DJF, MAM, JJA, SON)
+    }
+    return func_dict[component](times).astype(str).tolist()
+
+
+def _get_groups_values(groups, df):
+    """Return the values associated to the groups keys for each filepath of the parsed filepaths table.
 
     If multiple keys are specified, the value returned is a string of format: ``<group_value_1>/<group_value_2>/...``
 
     If a single key is specified and is ``start_time`` or ``end_time``, the function
-    returns a :py:class:`datetime.datetime` object.
+    returns :py:class:`datetime.datetime` objects.
     """
     single_key = len(groups) == 1
-    info_dict = get_info_from_filepath(filepath, network=network, product=product)
-    start_time = info_dict["start_time"]
     list_key_values = []
     for key in groups:
         if key in TIME_KEYS:
-            list_key_values.append(get_time_component(start_time, component=key))
+            list_key_values.append(_get_time_component_values(df["start_time"], component=key))
         else:
-            value = info_dict.get(key, f"{key}=None")
-            list_key_values.append(value if single_key else str(value))
+            values = _get_key_values(df, key)
+            list_key_values.append(values if single_key else [str(value) for value in values])
     if single_key:
         return list_key_values[0]
-    return "/".join(list_key_values)
+    return ["/".join(key_values) for key_values in zip(*list_key_values, strict=True)]
 
 
 def group_filepaths(filepaths, network, product=None, groups=None):
@@ -288,8 +527,8 @@ def group_filepaths(filepaths, network, product=None, groups=None):
 
     Parameters
     ----------
-    filepaths : list
-        List of filepaths.
+    filepaths : list or radar_api.FileCatalog
+        List of filepaths or a file catalog.
     groups: list or str
         The group keys by which to group the filepaths.
         Valid group keys are
@@ -307,16 +546,27 @@ def group_filepaths(filepaths, network, product=None, groups=None):
     dict or list
         Either a dictionary of format ``{<group_value>: <list_filepaths>}``.
         or the original input filepaths (if ``groups=None``)
+        If a file catalog is provided, the dictionary values are file catalogs.
 
     """
+    from radar_api.catalog import FileCatalog
+
     product = check_product(network, product=product)
 
     if groups is None:
         return filepaths
     groups = check_groups(groups)
+    if isinstance(filepaths, FileCatalog):
+        # Reuse the file information already parsed
+        df = filepaths.to_dataframe()
+        groups_values = _get_groups_values(groups, df)
+        dict_indices = defaultdict(list)
+        for i, group_value in enumerate(groups_values):
+            dict_indices[group_value].append(i)
+        return {group_value: filepaths.isel(indices) for group_value, indices in dict_indices.items()}
+    df = parse_filepaths(filepaths, network=network, product=product, integer_version=False)
+    groups_values = _get_groups_values(groups, df)
     filepaths_dict = defaultdict(list)
-    _ = [
-        filepaths_dict[_get_groups_value(groups, filepath, network=network, product=product)].append(filepath)
-        for filepath in filepaths
-    ]
+    for group_value, filepath in zip(groups_values, filepaths, strict=True):
+        filepaths_dict[group_value].append(filepath)
     return dict(filepaths_dict)
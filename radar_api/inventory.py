@@ -0,0 +1,443 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides an incremental inventory of the radar files on local storage.
+
+The inventory is a SQLite database stored in ``<base_dir>/.radar_api/inventory.sqlite``.
+It records the network, product, radar, start and end time, size and modification time
+of each local file, and enables to search local files with an indexed time range scan
+instead of listing every local directory.
+
+The inventory of a network product is built (or rebuilt) with :py:func:`reindex`.
+Once built, it is updated by ``radar_api.download_files``, and ``radar_api.find_files``
+uses it to search files on local storage. The inventory also records the modification
+time of the scanned directories: before a search, the directories of the time period
+modified since their last scan (i.e. by files added with other tools) are scanned again.
+Files removed from the local storage are discarded from the inventory when searched.
+
+The inventory can be disabled with the ``inventory.enabled`` key of ``radar_api.config``.
+"""
+import datetime
+import glob
+import os
+import re
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+
+import radar_api
+from radar_api.checks import check_base_dir, check_network, check_product
+from radar_api.configs import get_base_dir
+from radar_api.filter import are_files_within_time, discard_unsupported_files, fill_files_end_time
+from radar_api.info import parse_filepaths
+from radar_api.io import (
+    available_networks,
+    available_products,
+    get_directory_pattern,
+    get_product_file_time_coverage,
+)
+from radar_api.transfer import TEMPORARY_SUFFIXES
+
+# Maximum duration of a radar file. It bounds the time range scan of the inventory.
+_MAX_FILE_DURATION = datetime.timedelta(days=1)
+
+# Resolution of the directory modification times (in seconds).
+# Directories modified more recently are scanned again, since files added within
+# the same time resolution would not change the directory modification time.
+_MTIME_RESOLUTION = 2
+
+# Maximum number of directories queried at once
+_QUERY_CHUNK_SIZE = 500
+
+
+def _to_microseconds(times):
+    """Convert datetime64 values to integer microseconds since epoch (None for NaT)."""
+    times = np.asarray(times, dtype="datetime64[us]")
+    values = times.astype(np.int64).astype(object)
+    values[np.isnat(times)] = None
+    return values.tolist()
+
+
+class LocalInventory:
+    """SQLite inventory of the radar files on local storage."""
+
+    def __init__(self, filepath):
+        """Initialize the inventory stored at the given filepath."""
+        self.filepath = str(filepath)
+        dir_path = os.path.dirname(self.filepath)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "filepath TEXT PRIMARY KEY, "
+                "network TEXT NOT NULL, "
+                "product TEXT NOT NULL, "
+                "radar TEXT NOT NULL, "
+                "start_time INTEGER NOT NULL, "
+                "end_time INTEGER, "
+                "size INTEGER NOT NULL, "
+                "mtime REAL NOT NULL)",
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS files_time_index ON files (network, product, radar, start_time)",
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS directories ("
+                "dir_path TEXT PRIMARY KEY, "
+                "network TEXT NOT NULL, "
+                "product TEXT NOT NULL, "
+                "mtime REAL)",
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS indexed ("
+                "network TEXT NOT NULL, "
+                "product TEXT NOT NULL, "
+                "indexed_at REAL NOT NULL, "
+                "PRIMARY KEY (network, product))",
+            )
+
+    def __repr__(self):
+        """Return the string representation of the inventory."""
+        return f"LocalInventory({self.filepath!r})"
+
+    def _connect(self):
+        return sqlite3.connect(self.filepath, timeout=60)
+
+    def is_indexed(self, network, product):
+        """Return True if the inventory of the network product has been built."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM indexed WHERE network = ? AND product = ?",
+                (network, product),
+            ).fetchone()
+        return row is not None
+
+    def clear(self, network, product):
+        """Remove the inventory of a network product."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM files WHERE network = ? AND product = ?", (network, product))
+            conn.execute("DELETE FROM directories WHERE network = ? AND product = ?", (network, product))
+            conn.execute("DELETE FROM indexed WHERE network = ? AND product = ?", (network, product))
+
+    def set_indexed(self, network, product):
+        """Mark the inventory of the network product as built."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO indexed VALUES (?, ?, ?)",
+                (network, product, datetime.datetime.now().timestamp()),
+            )
+
+    def remove_files(self, filepaths):
+        """Remove files from the inventory."""
+        filepaths = list(filepaths)
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM files WHERE filepath = ?", [(fpath,) for fpath in filepaths])
+
+    def update_files(self, filepaths, network, product, radar):
+        """Add or update files of a radar in the inventory.
+
+        Files which do not exist on local storage are removed from the inventory.
+        Files whose filename can not be parsed are ignored.
+
+        Returns
+        -------
+        int
+            Number of files added or updated.
+        """
+        filepaths = [str(fpath) for fpath in filepaths if not str(fpath).endswith(TEMPORARY_SUFFIXES)]
+        filepaths = discard_unsupported_files(filepaths, network=network)
+        df = parse_filepaths(filepaths, network=network, product=product, ignore_errors=True)
+        df = df[~df["start_time"].isna()]
+
+        # Retrieve size and modification time of existing files
+        rows = []
+        parsed_fpaths = set(df["filepath"])
+        missing_fpaths = [fpath for fpath in filepaths if fpath not in parsed_fpaths]
+        start_times = _to_microseconds(df["start_time"])
+        end_times = _to_microseconds(df["end_time"])
+        for fpath, start_time, end_time in zip(df["filepath"], start_times, end_times, strict=True):
+            try:
+                stat = os.stat(fpath)
+            except OSError:
+                missing_fpaths.append(fpath)
+                continue
+            rows.append((fpath, network, product, radar, start_time, end_time, stat.st_size, stat.st_mtime))
+
+        # Update the inventory
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany("DELETE FROM files WHERE filepath = ?", [(fpath,) for fpath in missing_fpaths])
+        return len(rows)
+
+    def scan_directory(self, dir_path, network, product, radar):
+        """Add the files of a local directory to the inventory and record the directory modification time.
+
+        Returns
+        -------
+        int
+            Number of files added or updated.
+        """
+        dir_path = os.path.normpath(dir_path)
+        # The modification time is retrieved before listing, so that files added meanwhile trigger a new scan
+        mtime = os.stat(dir_path).st_mtime
+        if mtime > datetime.datetime.now().timestamp() - _MTIME_RESOLUTION:
+            mtime = None
+        n_files = self.update_files(_list_local_files(dir_path), network=network, product=product, radar=radar)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO directories VALUES (?, ?, ?, ?)", (dir_path, network, product, mtime))
+        return n_files
+
+    def refresh_directories(self, dir_paths, network, product, radar):
+        """Scan the local directories modified since their last scan.
+
+        Directories which do not exist are skipped.
+
+        Returns
+        -------
+        int
+            Number of files added or updated.
+        """
+        dir_paths = [os.path.normpath(dir_path) for dir_path in dir_paths]
+        scanned_mtimes = {}
+        with closing(self._connect()) as conn:
+            # Query by chunks to not exceed the maximum number of SQL parameters
+            for i in range(0, len(dir_paths), _QUERY_CHUNK_SIZE):
+                chunk = dir_paths[i : i + _QUERY_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT dir_path, mtime FROM directories WHERE dir_path IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                scanned_mtimes.update(rows)
+        n_files = 0
+        for dir_path in dir_paths:
+            try:
+                mtime = os.stat(dir_path).st_mtime
+            except OSError:
+                continue
+            if scanned_mtimes.get(dir_path) != mtime:
+                n_files += self.scan_directory(dir_path, network=network, product=product, radar=radar)
+        return n_files
+
+    def query(self, network, product, radar, start_time, end_time, *, detail=False):
+        """
+        Search the files of a radar overlapping a time period.
+
+        Parameters
+        ----------
+        network : str
+            The name of the radar network.
+        product : str
+            The product acronym.
+        radar : str
+            The name of the radar.
+        start_time : datetime.datetime
+            The start (inclusive) time of the interval period.
+        end_time : datetime.datetime
+            The end (exclusive) time of the interval period.
+        detail : bool, optional
+            If True, it returns a dictionary mapping the filepaths to their size.
+            The default is False.
+
+        Returns
+        -------
+        list or dict
+            The sorted filepaths. Files no longer present on local storage are
+            removed from the inventory and not returned.
+        """
+        start_time = np.datetime64(start_time, "us")
+        end_time = np.datetime64(end_time, "us")
+        scan_start_time = start_time - np.timedelta64(_MAX_FILE_DURATION)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT filepath, start_time, end_time, size FROM files "
+                "WHERE network = ? AND product = ? AND radar = ? AND start_time >= ? AND start_time < ?",
+                (network, product, radar, int(scan_start_time.astype(np.int64)), int(end_time.astype(np.int64))),
+            ).fetchall()
+        if len(rows) == 0:
+            return {} if detail else []
+
+        # Select files within the time period
+        filepaths, file_start_times, file_end_times, sizes = zip(*rows, strict=True)
+        file_start_times = np.array(file_start_times, dtype=np.int64).astype("datetime64[us]")
+        file_end_times = np.array(
+            [np.datetime64("NaT") if value is None else value for value in file_end_times],
+            dtype="datetime64[us]",
+        )
+        file_end_times = fill_files_end_time(
+            file_start_times,
+            file_end_times,
+            file_time_coverage=get_product_file_time_coverage(network, product),
+        )
+        is_selected = are_files_within_time(start_time, end_time, file_start_times, file_end_times)
+        selected = sorted(
+            (fpath, size) for fpath, size, selected in zip(filepaths, sizes, is_selected, strict=True) if selected
+        )
+
+        # Discard files no longer present on local storage
+        missing_fpaths = [fpath for fpath, _ in selected if not os.path.exists(fpath)]
+        if missing_fpaths:
+            self.remove_files(missing_fpaths)
+            missing_fpaths = set(missing_fpaths)
+            selected = [(fpath, size) for fpath, size in selected if fpath not in missing_fpaths]
+
+        if detail:
+            return dict(selected)
+        return [fpath for fpath, _ in selected]
+
+
+def get_inventory_filepath(base_dir):
+    """Return the filepath of the local inventory database."""
+    return os.path.join(str(base_dir), ".radar_api", "inventory.sqlite")
+
+
+def get_local_inventory(base_dir=None, create=False):
+    """Return the local inventory of the given base directory.
+
+    Returns None if the inventory is disabled, or if it does not exist and ``create=False``.
+    """
+    if not radar_api.config.get("inventory.enabled", True):
+        return None
+    base_dir = get_base_dir(base_dir)
+    filepath = get_inventory_filepath(base_dir)
+    if not create and not os.path.exists(filepath):
+        return None
+    return LocalInventory(filepath)
+
+
+def _is_indexable_directory_pattern(directory_pattern):
+    """Return True if the radar files of a local directory pattern can be indexed.
+
+    The directories must be located within the ``base_dir`` and be specific to a radar.
+    """
+    return directory_pattern.startswith("{base_dir}") and "{radar" in directory_pattern
+
+
+def _get_local_radar_directories(base_dir, network, product):
+    """Return the local directories of a network product, with the corresponding radar name.
+
+    Returns None if the local directory pattern of the network product can not be indexed.
+    """
+    directory_pattern = get_directory_pattern(protocol="local", network=network, product=product)
+    if not _is_indexable_directory_pattern(directory_pattern):
+        return None
+    # Define the glob pattern and the regex extracting the radar name from the directory paths
+    glob_pattern = ""
+    regex = ""
+    for part in re.split(r"(\{[^{}]*\})", directory_pattern):
+        if part == "{base_dir}":
+            glob_pattern += glob.escape(base_dir)
+            regex += re.escape(base_dir.replace(os.sep, "/"))
+        elif part.startswith("{"):
+            glob_pattern += "*"
+            regex += "(?P<radar>[^/]+)" if part.startswith("{radar") else "[^/]+"
+        else:
+            glob_pattern += glob.escape(part)
+            regex += re.escape(part)
+    regex = re.compile(regex + "$")
+    dir_paths = sorted(dir_path for dir_path in glob.glob(glob_pattern) if os.path.isdir(dir_path))
+    results = []
+    for dir_path in dir_paths:
+        match = regex.match(dir_path.replace(os.sep, "/"))
+        if match is not None:
+            results.append((dir_path, match.group("radar")))
+    return results
+
+
+def _list_local_files(dir_path):
+    """Return the filepaths within a local directory."""
+    with os.scandir(dir_path) as it:
+        return [entry.path for entry in it if entry.is_file()]
+
+
+def reindex(network=None, product=None, base_dir=None, verbose=False):
+    """
+    Build the inventory of the radar files on local storage.
+
+    The inventory enables ``radar_api.find_files(protocol="local")`` to search local files
+    with an indexed time range scan. Once built, the inventory is updated by
+    ``radar_api.download_files`` and by the searches, which scan again the directories
+    modified since their last scan.
+
+    Products whose local directories are not specific to a radar, or are not located
+    within ``base_dir``, are not indexed: their local files are still searched by
+    listing the local directories.
+
+    Parameters
+    ----------
+    network : str, optional
+        The name of the radar network. If None, all networks are indexed.
+        The default is None.
+    product : str, optional
+        The product acronym. If None, all products of the network(s) are indexed.
+        The default is None.
+    base_dir : str, optional
+        The path to the directory where radar data are stored.
+        If None, it use the one specified in the RADAR-API config file.
+        The default is None.
+    verbose : bool, optional
+        If True, it print the number of files indexed for each network product.
+        The default is False.
+
+    Returns
+    -------
+    int
+        Number of indexed files.
+    """
+    base_dir = check_base_dir(get_base_dir(base_dir))
+    inventory = get_local_inventory(base_dir, create=True)
+    if inventory is None:
+        raise ValueError("The local inventory is disabled. Set 'inventory.enabled' to True in radar_api.config.")
+    networks = available_networks() if network is None else [check_network(network)]
+    n_total_files = 0
+    for current_network in networks:
+        if product is None:
+            products = available_products(network=current_network)
+        else:
+            products = [check_product(network=current_network, product=product)]
+        for current_product in products:
+            inventory.clear(network=current_network, product=current_product)
+            # Products whose local directories can not be indexed are not marked as indexed,
+            # so that find_files keeps listing their directories
+            radar_directories = _get_local_radar_directories(base_dir, current_network, current_product)
+            if radar_directories is None:
+                if verbose:
+                    print(f"The local directories of {current_network} {current_product} files can not be indexed.")
+                continue
+            n_files = 0
+            for dir_path, radar in radar_directories:
+                n_files += inventory.scan_directory(
+                    dir_path,
+                    network=current_network,
+                    product=current_product,
+                    radar=radar,
+                )
+            inventory.set_indexed(network=current_network, product=current_product)
+            n_total_files += n_files
+            if verbose:
+                print(f"{n_files} {current_network} {current_product} files have been indexed.")
+    return n_total_files
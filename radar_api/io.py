@@ -23,16 +23,25 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Define filesystems, buckets, connection types and directory structures."""
+import contextlib
 import datetime
 import os
+import threading
+import time
+from types import MappingProxyType
 
 import fsspec
+import numpy as np
 import pandas as pd
+from fsspec.utils import tokenize
 
 from radar_api.checks import check_network, check_start_end_time, get_current_utc_time
 from radar_api.utils.list import flatten_list
 from radar_api.utils.yaml import read_yaml
 
+# Duration assumed for files without end time information if file_time_coverage is not specified
+DEFAULT_FILE_DURATION = datetime.timedelta(minutes=7)
+
 
 def get_network_config_path():
     """Get directory path with the network configuration files."""
@@ -42,6 +51,14 @@ def get_network_config_path():
     return path
 
 
+def get_radars_config_path():
+    """Get directory path with the radar configuration files."""
+    from radar_api import _root_path
+
+    path = os.path.join(_root_path, "radar_api", "etc", "radar")
+    return path
+
+
 def get_network_radars_config_path(network):
     """Get directory path with the radar configuration files of a given network."""
     from radar_api import _root_path
@@ -70,13 +87,152 @@ def get_radar_config_filepath(network, radar):
     return filepath
 
 
+####--------------------------------------------------------------------------.
+################################
+#### Configuration registry ####
+################################
+
+
+def _scan_yaml_files(dir_path):
+    """Return a dictionary ``{<file_stem>: <filepath>}`` of the (non-hidden) YAML files within a directory."""
+    if not os.path.isdir(dir_path):
+        return {}
+    return {
+        os.path.splitext(entry.name)[0]: entry.path
+        for entry in os.scandir(dir_path)
+        if entry.is_file() and not entry.name.startswith(".") and entry.name.endswith(".yaml")
+    }
+
+
+def _scan_subdirectories(dir_path):
+    """Return a dictionary ``{<name>: <path>}`` of the (non-hidden) subdirectories of a directory."""
+    if not os.path.isdir(dir_path):
+        return {}
+    return {
+        entry.name: entry.path for entry in os.scandir(dir_path) if entry.is_dir() and not entry.name.startswith(".")
+    }
+
+
+def _get_config_signature(dir_paths):
+    """Return the modification signature of the configuration files within the specified directories."""
+    signature = []
+    for dir_path in dir_paths:
+        for root, dirs, files in os.walk(dir_path):
+            dirs.sort()
+            signature.append((root, os.stat(root).st_mtime_ns))
+            signature.extend((name, os.stat(os.path.join(root, name)).st_mtime_ns) for name in sorted(files))
+    return tuple(signature)
+
+
+def _copy_info(info_dict):
+    """Return a copy of a configuration dictionary which can be safely modified by the caller."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in info_dict.items()}
+
+
+class ConfigRegistry:
+    """In-memory registry of the RADAR-API network and radar configuration files.
+
+    The registry is built once per process by :py:func:`get_config_registry`.
+    The network products configurations are read at initialization, while
+    the radar configuration files are read only when first requested.
+    Lookups of networks, products and radars are dictionary lookups.
+    """
+
+    def __init__(self, network_config_path, radars_config_path):
+        self.network_config_path = network_config_path
+        self.radars_config_path = radars_config_path
+        self.signature = _get_config_signature([network_config_path, radars_config_path])
+
+        # Read network products configurations
+        network_dirs = _scan_subdirectories(network_config_path)
+        self._products = {
+            network: {
+                product: MappingProxyType(read_yaml(filepath))
+                for product, filepath in sorted(_scan_yaml_files(network_dir).items())
+            }
+            for network, network_dir in sorted(network_dirs.items())
+        }
+        self.networks = tuple(self._products)
+
+        # List radars configuration files
+        self._radars_filepaths = {
+            network: dict(sorted(_scan_yaml_files(os.path.join(radars_config_path, network)).items()))
+            for network in self.networks
+        }
+        self.radars = frozenset(radar for radars in self._radars_filepaths.values() for radar in radars)
+        self._radars_info = {}
+        self._lock = threading.Lock()
+
+    def is_valid(self):
+        """Check whether the configuration files have not been modified since the registry creation."""
+        return self.signature == _get_config_signature([self.network_config_path, self.radars_config_path])
+
+    def get_products(self, network):
+        """Return the products available for a network."""
+        return tuple(self._products[network])
+
+    def get_product_info(self, network, product):
+        """Return the (read-only) configuration of a network product."""
+        return self._products[network][product]
+
+    def get_network_radars(self, network):
+        """Return the radars available for a network."""
+        return tuple(self._radars_filepaths[network])
+
+    def get_radar_info(self, network, radar):
+        """Return the (read-only) configuration of a radar."""
+        key = (network, radar)
+        info_dict = self._radars_info.get(key)
+        if info_dict is None:
+            filepath = self._radars_filepaths[network][radar]
+            with self._lock:
+                info_dict = MappingProxyType(read_yaml(filepath))
+                self._radars_info[key] = info_dict
+        return info_dict
+
+
+_CONFIG_REGISTRY = None
+_CONFIG_REGISTRY_LAST_CHECK = 0.0
+_CONFIG_REGISTRY_CHECK_INTERVAL = 1.0  # seconds
+_CONFIG_REGISTRY_LOCK = threading.Lock()
+
+
+def reset_config_registry():
+    """Discard the in-memory configuration registry.
+
+    The registry is rebuilt at the next configuration lookup.
+    """
+    global _CONFIG_REGISTRY
+    with _CONFIG_REGISTRY_LOCK:
+        _CONFIG_REGISTRY = None
+
+
+def get_config_registry():
+    """Return the in-memory configuration registry.
+
+    The registry is built at the first call. At most once every second, the
+    modification times of the configuration files are checked and the registry
+    is rebuilt if any file has been added, removed or modified.
+    """
+    global _CONFIG_REGISTRY, _CONFIG_REGISTRY_LAST_CHECK
+    registry = _CONFIG_REGISTRY
+    now = time.monotonic()
+    if registry is not None and now - _CONFIG_REGISTRY_LAST_CHECK < _CONFIG_REGISTRY_CHECK_INTERVAL:
+        return registry
+    with _CONFIG_REGISTRY_LOCK:
+        if _CONFIG_REGISTRY is None or not _CONFIG_REGISTRY.is_valid():
+            _CONFIG_REGISTRY = ConfigRegistry(
+                network_config_path=get_network_config_path(),
+                radars_config_path=get_radars_config_path(),
+            )
+        _CONFIG_REGISTRY_LAST_CHECK = time.monotonic()
+        return _CONFIG_REGISTRY
+
+
+####--------------------------------------------------------------------------.
 def available_networks(only_online=False):
     """Get list of available networks."""
-    network_config_path = get_network_config_path()
-    # Select only directory and not hiddend directories
-    networks = [
-        entry.name for entry in os.scandir(network_config_path) if entry.is_dir() and not entry.name.startswith(".")
-    ]
+    networks = list(get_config_registry().networks)
     # If only_online=True, check if there are available_products online
     if only_online:
         networks = [network for network in networks if len(available_products(network, only_online=only_online)) > 0]
@@ -86,29 +242,24 @@ def available_networks(only_online=False):
 def available_products(network, only_online=False):
     """Get list of available products for a given network."""
     network = check_network(network)
-    products_config_path = get_products_config_path(network)
-
-    # Select only yaml files and remove hidden files
-    products = [
-        os.path.splitext(entry.name)[0]
-        for entry in os.scandir(products_config_path)
-        if entry.is_file() and not entry.name.startswith(".") and entry.name.endswith(".yaml")
-    ]
+    registry = get_config_registry()
+    products = list(registry.get_products(network))
 
     # If only_online=True, return products where cloud_directory_pattern is specified
     if only_online:
         products = [
             product
             for product in products
-            if get_product_info(network, product=product).get("cloud_directory_pattern", None) is not None
+            if registry.get_product_info(network, product).get("cloud_directory_pattern", None) is not None
         ]
     return sorted(products)
 
 
 def _get_network_radars(network, start_time=None, end_time=None):
-    radars_config_path = get_network_radars_config_path(network)
-    radars_config_filenames = os.listdir(radars_config_path)
-    radars = [fname.split(".")[0] for fname in radars_config_filenames]
+    radars = list(get_config_registry().get_network_radars(network))
+    # Do not check radars time coverage if start_time and end_time not specified
+    if start_time is None and end_time is None:
+        return radars
     radars = [
         radar
         for radar in radars
@@ -132,18 +283,26 @@ def available_radars(network=None, start_time=None, end_time=None, only_online=F
     return sorted(radars)
 
 
+def _get_product_info(network, product):
+    """Get the read-only network product information from the configuration registry."""
+    try:
+        return get_config_registry().get_product_info(network, product)
+    except KeyError:
+        raise FileNotFoundError(f"No configuration file available for product {product} of network {network}.")
+
+
 def get_product_info(network, product):
     """Get network information."""
-    product_config_path = get_product_config_filepath(network, product)
-    info_dict = read_yaml(product_config_path)
-    return info_dict
+    return _copy_info(_get_product_info(network, product))
 
 
 def get_radar_info(network, radar):
     """Get radar information."""
-    network_config_path = get_radar_config_filepath(network, radar)
-    info_dict = read_yaml(network_config_path)
-    return info_dict
+    try:
+        info_dict = get_config_registry().get_radar_info(network, radar)
+    except KeyError:
+        raise FileNotFoundError(f"No configuration file available for {network} radar {radar}.")
+    return _copy_info(info_dict)
 
 
 def get_radar_time_coverage(network, radar):
@@ -229,21 +388,19 @@ def is_radar_available(network, radar, start_time=None, end_time=None):
     )
 
 
-def get_network_database(network, only_online=False):
+def get_network_database(network, only_online=False):  # noqa: ARG001
     """Retrieve the radar network database."""
-    list_info = []
-    for radar in available_radars(network=network, only_online=only_online):
-        try:
-            radar_info_path = get_radar_config_filepath(network=network, radar=radar)
-            radar_info = read_yaml(radar_info_path)
-            variables = ["latitude", "longitude", "altitude", "radar_band", "start_time", "end_time"]
-            dict_info = {var: radar_info[var] for var in variables}
-            dict_info["radar"] = radar
-            dict_info["network"] = network
-            list_info.append(dict_info)
-        except Exception:
-            print(f"Skip info for {radar}")
-    return pd.DataFrame(list_info)
+    from radar_api.utilities import read_database
+
+    variables = ["latitude", "longitude", "altitude", "radar_band", "start_time", "end_time"]
+    db = read_database(network=network)
+    if any(var not in db.columns for var in variables):
+        is_complete = np.zeros(len(db), dtype=bool)
+    else:
+        is_complete = db[variables].notna().all(axis=1).to_numpy()
+    for radar in db.loc[~is_complete, "radar"]:
+        print(f"Skip info for {radar}")
+    return db.loc[is_complete, [*variables, "radar", "network"]].reset_index(drop=True)
 
 
 def get_database(only_online=False):
@@ -254,24 +411,142 @@ def get_database(only_online=False):
 
 def get_product_filename_patterns(network, product):
     """Get radar filenames patterns."""
-    return get_product_info(network, product)["filename_patterns"]
+    return list(_get_product_info(network, product)["filename_patterns"])
+
+
+def get_product_file_time_coverage(network, product):
+    """Get the time period covered by each radar file of a network product.
+
+    It is used as file duration when the filename does not contain the file end time.
+    It is defined by the ``file_time_coverage`` setting of the network product
+    configuration file (i.e. ``"5min"``). If not specified, it defaults to ``DEFAULT_FILE_DURATION``.
+    """
+    file_time_coverage = _get_product_info(network, product).get("file_time_coverage", None)
+    if file_time_coverage is None:
+        return DEFAULT_FILE_DURATION
+    try:
+        file_time_coverage = pd.Timedelta(file_time_coverage).to_pytimedelta()
+    except ValueError:
+        raise ValueError(f"Invalid file_time_coverage '{file_time_coverage}' for {network} product {product}.")
+    if file_time_coverage <= datetime.timedelta(0):
+        raise ValueError(f"The file_time_coverage of {network} product {product} must be positive.")
+    return file_time_coverage
 
 
 def get_directory_pattern(protocol, network, product):
     """Get directory pattern."""
     if protocol in ["s3", "gcs"]:
-        directory_pattern = get_product_info(network, product)["cloud_directory_pattern"]
+        directory_pattern = _get_product_info(network, product)["cloud_directory_pattern"]
     else:
-        directory_pattern = get_product_info(network, product)["local_directory_pattern"]
+        directory_pattern = _get_product_info(network, product)["local_directory_pattern"]
     if directory_pattern is None:
         raise NotImplementedError(f"protocol {protocol} is not implemented for {network}.")
     return directory_pattern
 
 
+def _normalize_fs_args(protocol, fs_args=None):
+    """Return a copy of the filesystem arguments completed with the RADAR-API defaults.
+
+    The copy is shallow: the argument values (e.g. sessions or credentials) are passed through as is.
+    """
+    import radar_api
+
+    fs_args = dict(fs_args or {})
+    if protocol == "s3":
+        # Set defaults
+        # - Use the anonymous credentials to access public data
+        # - Size the connection pool to the number of concurrent requests
+        fs_args.setdefault("anon", True)
+        max_pool_connections = radar_api.config.get("filesystem.max_pool_connections", None)
+        if max_pool_connections is not None:
+            config_kwargs = dict(fs_args.get("config_kwargs") or {})
+            config_kwargs.setdefault("max_pool_connections", int(max_pool_connections))
+            fs_args["config_kwargs"] = config_kwargs
+    return fs_args
+
+
+def _close_filesystem(fs):
+    """Close the sessions and connection pools of a filesystem (if any)."""
+    s3 = getattr(fs, "_s3", None)
+    if s3 is not None and hasattr(fs, "close_session"):
+        with contextlib.suppress(Exception):
+            fs.close_session(fs.loop, s3)
+        fs._s3 = None
+
+
+class FilesystemPool:
+    """Thread-safe pool of fsspec filesystem instances.
+
+    Filesystems are keyed by protocol and normalized arguments, so that their sessions,
+    connection pools and DNS/TLS state are reused across calls and threads.
+    Pooled filesystems are discarded (without being closed) in forked child processes.
+    """
+
+    def __init__(self):
+        self._filesystems = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def __len__(self):
+        """Return the number of pooled filesystems."""
+        return len(self._filesystems)
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            self._filesystems = {}
+            self._pid = os.getpid()
+
+    def get(self, protocol, fs_args=None):
+        """Return the pooled filesystem of a protocol and arguments, creating it if needed."""
+        fs_args = _normalize_fs_args(protocol, fs_args)
+        # The token is only used as lookup key: the filesystem receives the original arguments
+        try:
+            key = tokenize(protocol, fs_args)
+        except Exception:
+            return fsspec.filesystem(protocol, skip_instance_cache=True, **fs_args)
+        with self._lock:
+            self._check_pid()
+            fs = self._filesystems.get(key)
+            if fs is None:
+                fs = fsspec.filesystem(protocol, skip_instance_cache=True, **fs_args)
+                self._filesystems[key] = fs
+        return fs
+
+    def close(self):
+        """Close and discard all pooled filesystems."""
+        with self._lock:
+            self._check_pid()
+            filesystems = list(self._filesystems.values())
+            self._filesystems = {}
+        for fs in filesystems:
+            _close_filesystem(fs)
+
+
+_FILESYSTEM_POOL = FilesystemPool()
+
+
+def get_filesystem_pool():
+    """Return the pool of fsspec filesystem instances."""
+    return _FILESYSTEM_POOL
+
+
+def close_filesystems():
+    """Close and discard the pooled filesystems.
+
+    The filesystems are created again at the next search or download.
+    It must be called after modifying the ``filesystem.max_pool_connections`` setting
+    or the credentials used by the filesystems.
+    """
+    _FILESYSTEM_POOL.close()
+
+
 def get_filesystem(protocol, fs_args=None):
     """
     Define fsspec filesystem.
 
+    The filesystem instances are pooled: calls with the same protocol and arguments
+    return the same instance. The ``fs_args`` dictionary is not modified.
+
     protocol : str
        String specifying the cloud bucket storage from which to retrieve
        the data. It must be specified if not searching data on local storage.
@@ -279,14 +554,11 @@ def get_filesystem(protocol, fs_args=None):
     fs_args : dict, optional
        Dictionary specifying optional settings to initiate the fsspec.filesystem.
        The default is an empty dictionary. Anonymous connection is set by default.
+       The size of the connection pool is defined by the ``filesystem.max_pool_connections``
+       setting of ``radar_api.config``, unless specified in ``fs_args["config_kwargs"]``.
     """
-    fs_args = {} if fs_args is None else fs_args
     if protocol == "s3":
-        # Set defaults
-        # - Use the anonymous credentials to access public data
-        _ = fs_args.setdefault("anon", True)  # TODO: or if is empty
-        fs = fsspec.filesystem("s3", **fs_args)
-        return fs
+        return _FILESYSTEM_POOL.get("s3", fs_args=fs_args)
     # if protocol == "gcs":
     #     # Set defaults
     #     # - Use the anonymous credentials to access public data
@@ -0,0 +1,198 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides an on-disk cache of the cloud bucket directory listings.
+
+The listing of each directory is stored in a SQLite database together with the
+end time of the period covered by the directory. The listing of a directory whose
+period was already closed when it was listed is never expired, while the listing
+of directories still receiving data expires after ``listing_cache.ttl`` seconds.
+
+The cache is controlled through the ``listing_cache`` keys of ``radar_api.config``:
+
+- ``listing_cache.enabled``: whether to use the cache. The default is True.
+- ``listing_cache.filepath``: path of the SQLite database. If None, the cache is
+  stored in ``<base_dir>/.radar_api/listings.sqlite``. If neither is specified,
+  or if the ``base_dir`` does not exist, the cache is disabled.
+- ``listing_cache.ttl``: time to live (in seconds) of the listings of directories
+  still receiving data. The default is 300 seconds.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+import radar_api
+
+# Delay (in seconds) after the end of a directory period before considering it closed.
+# It accounts for files uploaded with latency in the cloud bucket.
+_CLOSED_PERIOD_DELAY = 3600
+
+# Maximum number of SQL variables per query
+_SQL_CHUNK_SIZE = 500
+
+_LISTING_CACHES = {}
+_LISTING_CACHES_LOCK = threading.Lock()
+
+
+class ListingCache:
+    """SQLite cache of directory listings keyed by (protocol, directory path)."""
+
+    def __init__(self, filepath):
+        """Initialize the listing cache stored at the given filepath."""
+        self.filepath = str(filepath)
+        dir_path = os.path.dirname(self.filepath)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS listings ("
+                "protocol TEXT NOT NULL, "
+                "dir_path TEXT NOT NULL, "
+                "listed_at REAL NOT NULL, "
+                "end_time REAL, "
+                "files TEXT NOT NULL, "
+                "PRIMARY KEY (protocol, dir_path))",
+            )
+
+    def __repr__(self):
+        """Return the string representation of the listing cache."""
+        return f"ListingCache({self.filepath!r})"
+
+    def _connect(self):
+        return sqlite3.connect(self.filepath, timeout=60)
+
+    def get(self, protocol, dir_paths, ttl, now=None):
+        """Return the valid cached listings of the given directories.
+
+        Parameters
+        ----------
+        protocol : str
+            Protocol of the filesystem.
+        dir_paths : list
+            Directory paths.
+        ttl : float
+            Time to live (in seconds) of the listings of directories whose period
+            was not yet closed when listed.
+        now : float, optional
+            Current POSIX timestamp. The default is ``time.time()``.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping the cached directory paths to a list of (name, size) tuples.
+            Directories without valid listings are not included.
+        """
+        now = time.time() if now is None else now
+        dir_paths = list(dict.fromkeys(dir_paths))
+        listings = {}
+        with closing(self._connect()) as conn:
+            for i in range(0, len(dir_paths), _SQL_CHUNK_SIZE):
+                chunk = dir_paths[i : i + _SQL_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT dir_path, listed_at, end_time, files FROM listings "
+                    f"WHERE protocol = ? AND dir_path IN ({placeholders})",
+                    [protocol, *chunk],
+                ).fetchall()
+                for dir_path, listed_at, end_time, files in rows:
+                    is_closed = end_time is not None and listed_at >= end_time + _CLOSED_PERIOD_DELAY
+                    if is_closed or now - listed_at < ttl:
+                        listings[dir_path] = [tuple(file) for file in json.loads(files)]
+        return listings
+
+    def set(self, protocol, listings, end_times=None, now=None):
+        """Store the listings of the given directories.
+
+        Parameters
+        ----------
+        protocol : str
+            Protocol of the filesystem.
+        listings : dict
+            Dictionary mapping directory paths to a list of (name, size) tuples.
+        end_times : dict, optional
+            Dictionary mapping directory paths to the POSIX timestamp of the end
+            of the period covered by the directory.
+            Listings without end time always expire after the TTL.
+        now : float, optional
+            Current POSIX timestamp. The default is ``time.time()``.
+        """
+        now = time.time() if now is None else now
+        end_times = {} if end_times is None else end_times
+        rows = [
+            (protocol, dir_path, now, end_times.get(dir_path), json.dumps(files))
+            for dir_path, files in listings.items()
+        ]
+        if not rows:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?)", rows)
+
+    def clear(self):
+        """Remove all cached listings."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM listings")
+
+
+def get_listing_cache_filepath():
+    """Return the filepath of the listing cache database.
+
+    Returns None if neither ``listing_cache.filepath`` nor ``base_dir`` are specified.
+    The ``base_dir`` is not created implicitly: None is also returned if it does not exist.
+    """
+    filepath = radar_api.config.get("listing_cache.filepath", None)
+    if filepath is not None:
+        return str(filepath)
+    base_dir = radar_api.config.get("base_dir", None)
+    if base_dir is None or not os.path.isdir(base_dir):
+        return None
+    return os.path.join(str(base_dir), ".radar_api", "listings.sqlite")
+
+
+def get_listing_cache():
+    """Return the listing cache defined by ``radar_api.config``.
+
+    Returns None if the listing cache is disabled or can not be located.
+    """
+    if not radar_api.config.get("listing_cache.enabled", True):
+        return None
+    filepath = get_listing_cache_filepath()
+    if filepath is None:
+        return None
+    with _LISTING_CACHES_LOCK:
+        if filepath not in _LISTING_CACHES:
+            try:
+                _LISTING_CACHES[filepath] = ListingCache(filepath)
+            except (OSError, sqlite3.Error):
+                return None
+        return _LISTING_CACHES[filepath]
+
+
+def get_listing_cache_ttl():
+    """Return the time to live (in seconds) of the listings of open directories."""
+    return float(radar_api.config.get("listing_cache.ttl", 300))
@@ -0,0 +1,303 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides a size-bounded on-disk cache of the remote files opened by the readers.
+
+The cached files mirror the layout of the cloud buckets and are tracked in a SQLite
+index together with their size and last access time. When the total size of the
+cached files exceeds ``read_cache.max_bytes``, the least recently used files are evicted.
+Files are written under a temporary name and atomically renamed, so that the cache
+can be shared by concurrent processes.
+
+The cache is controlled through the ``read_cache`` keys of ``radar_api.config``:
+
+- ``read_cache.enabled``: whether to use the cache. The default is True.
+- ``read_cache.directory``: directory of the cache. If None, the cache is stored in
+  ``<base_dir>/.radar_api/read_cache`` or, if ``base_dir`` is not specified, in the
+  temporary directory of the system.
+- ``read_cache.max_bytes``: maximum total size (in bytes) of the cached files.
+  The default is 10 GB.
+
+Before reading a remote file, the readers also look for a copy of the file
+in the ``base_dir`` archive populated by ``radar_api.download_files``.
+"""
+
+import contextlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import closing
+
+from fsspec.core import split_protocol
+
+import radar_api
+from radar_api.checks import check_product
+from radar_api.download import define_local_filepath
+from radar_api.io import get_directory_pattern
+from radar_api.transfer import PART_SUFFIX
+
+_READ_CACHES = {}
+_READ_CACHES_LOCK = threading.Lock()
+
+
+class ReadCache:
+    """Size-bounded LRU cache of remote files, indexed in a SQLite database."""
+
+    def __init__(self, directory, max_bytes):
+        """Initialize the read cache stored in the given directory."""
+        self.directory = str(directory)
+        self.max_bytes = int(max_bytes)
+        self.filepath = os.path.join(self.directory, "index.sqlite")
+        os.makedirs(self.directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "key TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, "
+                "accessed_at REAL NOT NULL)",
+            )
+
+    def __repr__(self):
+        """Return the string representation of the read cache."""
+        return f"ReadCache({self.directory!r}, max_bytes={self.max_bytes})"
+
+    def _connect(self):
+        return sqlite3.connect(self.filepath, timeout=60)
+
+    def _get_cache_filepath(self, filepath):
+        """Return the path of the cached copy of a remote file."""
+        protocol, path = split_protocol(filepath)
+        return os.path.join(self.directory, protocol or "file", *path.split("/"))
+
+    def _touch(self, filepath, size, now=None):
+        now = time.time() if now is None else now
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO files VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET size = excluded.size, accessed_at = excluded.accessed_at",
+                (filepath, size, now),
+            )
+
+    def lookup(self, filepath, now=None):
+        """Return the path of the cached copy of a remote file, or None if not cached.
+
+        The access time of the cached file is updated.
+        """
+        cache_filepath = self._get_cache_filepath(filepath)
+        try:
+            size = os.path.getsize(cache_filepath)
+        except OSError:
+            return None
+        self._touch(filepath, size=size, now=now)
+        return cache_filepath
+
+    def get(self, filepath, fs, now=None):
+        """Return the path of the cached copy of a remote file, downloading it if not cached.
+
+        Parameters
+        ----------
+        filepath : str
+            Remote filepath.
+        fs : fsspec.AbstractFileSystem
+            Filesystem used to download the file.
+        now : float, optional
+            Current POSIX timestamp. The default is ``time.time()``.
+
+        Returns
+        -------
+        str
+            The path of the cached file.
+        """
+        cache_filepath = self.lookup(filepath, now=now)
+        if cache_filepath is not None:
+            return cache_filepath
+        return self._add(filepath, write=lambda tmp_filepath: fs.get_file(filepath, tmp_filepath), now=now)
+
+    def put(self, filepath, data, now=None):
+        """Store the in-memory content of a remote file in the cache.
+
+        Parameters
+        ----------
+        filepath : str
+            Remote filepath.
+        data : bytes
+            Content of the remote file.
+        now : float, optional
+            Current POSIX timestamp. The default is ``time.time()``.
+
+        Returns
+        -------
+        str
+            The path of the cached file.
+        """
+
+        def write(tmp_filepath):
+            with open(tmp_filepath, "wb") as f:
+                f.write(data)
+
+        return self._add(filepath, write=write, now=now)
+
+    def _add(self, filepath, write, now=None):
+        """Add a file to the cache with the ``write(tmp_filepath)`` function and evict the old files."""
+        cache_filepath = self._get_cache_filepath(filepath)
+        os.makedirs(os.path.dirname(cache_filepath), exist_ok=True)
+        # Write under a unique temporary name and atomically move the file into place
+        tmp_filepath = f"{cache_filepath}.{uuid.uuid4().hex}{PART_SUFFIX}"
+        try:
+            write(tmp_filepath)
+            os.replace(tmp_filepath, cache_filepath)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_filepath)
+        self._touch(filepath, size=os.path.getsize(cache_filepath), now=now)
+        self.evict(keep=filepath)
+        return cache_filepath
+
+    def evict(self, max_bytes=None, keep=None):
+        """Remove the least recently used files until the cache size is below ``max_bytes``.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum total size of the cached files. The default is ``self.max_bytes``.
+        keep : str, optional
+            Remote filepath never evicted, i.e. the file just added to the cache.
+
+        Returns
+        -------
+        list
+            The remote filepaths of the evicted files.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        evicted = []
+        with closing(self._connect()) as conn, conn:
+            # Lock the database so that concurrent processes do not evict the same files
+            conn.execute("BEGIN IMMEDIATE")
+            total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()[0]
+            if total_size <= max_bytes:
+                return evicted
+            for key, size in conn.execute("SELECT key, size FROM files ORDER BY accessed_at"):
+                if total_size <= max_bytes:
+                    break
+                if key == keep:
+                    continue
+                evicted.append(key)
+                total_size -= size
+            conn.executemany("DELETE FROM files WHERE key = ?", [(key,) for key in evicted])
+        # Files opened by other processes remain readable after removal on POSIX systems
+        for key in evicted:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._get_cache_filepath(key))
+        return evicted
+
+    @property
+    def size(self):
+        """Return the total size (in bytes) of the cached files."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()[0]
+
+    def clear(self):
+        """Remove all cached files."""
+        return self.evict(max_bytes=0)
+
+
+def get_read_cache_directory():
+    """Return the directory of the read cache."""
+    directory = radar_api.config.get("read_cache.directory", None)
+    if directory is not None:
+        return str(directory)
+    # The base_dir is not created implicitly
+    base_dir = radar_api.config.get("base_dir", None)
+    if base_dir is not None and os.path.isdir(base_dir):
+        return os.path.join(str(base_dir), ".radar_api", "read_cache")
+    return os.path.join(tempfile.gettempdir(), "radar_api", "read_cache")
+
+
+def get_read_cache_max_bytes():
+    """Return the maximum total size (in bytes) of the read cache."""
+    return int(radar_api.config.get("read_cache.max_bytes", 10 * 1024**3))
+
+
+def get_read_cache():
+    """Return the read cache defined by ``radar_api.config``.
+
+    Returns None if the read cache is disabled or can not be created.
+    """
+    if not radar_api.config.get("read_cache.enabled", True):
+        return None
+    directory = get_read_cache_directory()
+    with _READ_CACHES_LOCK:
+        if directory not in _READ_CACHES:
+            try:
+                _READ_CACHES[directory] = ReadCache(directory, max_bytes=get_read_cache_max_bytes())
+            except (OSError, sqlite3.Error):
+                return None
+        read_cache = _READ_CACHES[directory]
+    read_cache.max_bytes = get_read_cache_max_bytes()
+    return read_cache
+
+
+def _get_radar_from_directory(dir_path, directory_pattern):
+    """Extract the radar name from a directory path following the given directory pattern."""
+    regex = ""
+    for part in re.split(r"(\{[^}]*\})", directory_pattern):
+        if part.startswith("{radar:") or part == "{radar}":
+            regex += "(?P<radar>[^/]+)"
+        elif part.startswith("{"):
+            regex += "[^/]+"
+        else:
+            regex += re.escape(part)
+    match = re.fullmatch(regex, dir_path)
+    if match is None:
+        raise ValueError(f"{dir_path} does not follow the directory pattern {directory_pattern}.")
+    return match.group("radar")
+
+
+def get_local_copy(filepath, network, product):
+    """Return the path of the copy of a remote file in the ``base_dir`` archive, or None if not available."""
+    base_dir = radar_api.config.get("base_dir", None)
+    if base_dir is None or not os.path.isdir(base_dir):
+        return None
+    try:
+        product = check_product(network=network, product=product)
+        directory_pattern = get_directory_pattern(protocol="s3", network=network, product=product)
+        radar = _get_radar_from_directory(os.path.dirname(filepath), directory_pattern)
+        local_filepath = define_local_filepath(
+            filename=os.path.basename(filepath),
+            network=network,
+            product=product,
+            radar=radar,
+            base_dir=base_dir,
+        )
+    except (ValueError, IndexError, NotImplementedError):
+        return None
+    if os.path.isfile(local_filepath):
+        return local_filepath
+    return None
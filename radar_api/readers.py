@@ -23,23 +23,32 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """This module defines file readers."""
+import contextlib
 import importlib
-from functools import wraps
+import io
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import tempfile
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial, wraps
 
-import fsspec
+import numpy as np
 
-from radar_api.checks import check_product
-from radar_api.io import get_product_info
+import radar_api
+from radar_api.checks import check_encoding, check_product
+from radar_api.info import get_info_from_filepath
+from radar_api.io import get_filesystem, get_product_info
+from radar_api.read_cache import get_local_copy, get_read_cache
+from radar_api.zip_archives import open_zip_member, split_zip_member_path
 
 
-def get_simplecache_file(filepath):
-    """Simple cache a s3 file."""
-    file = fsspec.open_local(
-        f"simplecache::{filepath}",  # assume filepath has s3://
-        s3={"anon": True},
-        filecache={"cache_storage": "."},
-    )
-    return file
+def get_file_bytes(filepath):
+    """Read the content of a s3 file into memory."""
+    fs = get_filesystem(protocol="s3")
+    return fs.cat_file(filepath)
 
 
 def check_software_availability(software, conda_package):
@@ -107,36 +116,535 @@ def get_xradar_engine(network, product=None):
     return get_product_info(network, product)["xradar_engine"]
 
 
-def _prepare_file(filepath):
-    if filepath.startswith("s3"):
-        filepath = get_simplecache_file(filepath)
+# xradar engines able to decode the file content directly from bytes
+_XRADAR_BYTES_ENGINES = ["nexradlevel2", "iris"]
+
+
+def _get_remote_file(filepath, network, product, in_memory=True, lookup=True):
+    """Return the local path or the in-memory content of a remote file.
+
+    If ``lookup=False``, the local copies of the file are not looked up and the file is fetched again.
+    """
+    # Reuse the file downloaded in the base_dir archive
+    if lookup:
+        local_filepath = get_local_copy(filepath, network=network, product=product)
+        if local_filepath is not None:
+            return local_filepath
+    # Reuse the file if present in the read cache
+    read_cache = get_read_cache()
+    if lookup and read_cache is not None:
+        cache_filepath = read_cache.lookup(filepath)
+        if cache_filepath is not None:
+            return cache_filepath
+    if read_cache is None:
+        return get_file_bytes(filepath)
+    if not in_memory:
+        return read_cache.get(filepath, fs=get_filesystem(protocol="s3"))
+    # Decode the file from memory and store it in the read cache for the next reads
+    data = get_file_bytes(filepath)
+    with contextlib.suppress(OSError, sqlite3.Error):
+        read_cache.put(filepath, data)
+    return data
+
+
+def _is_remote_file(filepath):
+    return isinstance(filepath, str) and filepath.startswith("s3")
+
+
+def _extract_zip_member(filepath, stack):
+    """Extract a zip member into a temporary directory, removed when the ``stack`` is closed.
+
+    The extracted file keeps the member name, since readers like ``read_metranet``
+    infer the file type from the filename.
+    """
+    tmp_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="radar_api_"))
+    tmp_filepath = os.path.join(tmp_dir, os.path.basename(filepath))
+    with open_zip_member(filepath) as f_src, open(tmp_filepath, "wb") as f_dst:
+        shutil.copyfileobj(f_src, f_dst)
+    return tmp_filepath
+
+
+def _prepare_file(filepath, stack, *, network=None, product=None, engine=None, in_memory=True, lookup=True):
+    """Return the file object, bytes or filepath passed to the reader.
+
+    The resources opened for the reader (i.e. extracted zip members) are released when the ``stack`` is closed.
+    """
+    # Read remote files into memory or through the read cache
+    if _is_remote_file(filepath):
+        filepath = _get_remote_file(filepath, network=network, product=product, in_memory=in_memory, lookup=lookup)
+    # Read the files archived within zip files
+    # - readers without xradar engine (i.e. pyart readers) require a filepath
+    # - xradar engines read the member content from memory
+    if split_zip_member_path(filepath) is not None:
+        if engine is None:
+            return _extract_zip_member(filepath, stack)
+        with open_zip_member(filepath) as f:
+            filepath = f.read()
+    # Wrap in-memory file content into the object expected by the reader
+    # - bytes are decoded without copy by the engines supporting them
+    # - io.BytesIO shares the buffer of the bytes object
+    if isinstance(filepath, (bytes, bytearray)):
+        if engine in _XRADAR_BYTES_ENGINES:
+            return filepath
+        return io.BytesIO(filepath)
     return filepath
 
 
+def _open_file(reader, filepath, *, network=None, product=None, engine=None, in_memory=True):
+    """Open a file with the given reader function.
+
+    The local copy of a remote file (i.e. in the read cache) can be removed by another process
+    between its lookup and its opening. In such case, the remote file is fetched again.
+    """
+    kwargs = {"network": network, "product": product, "engine": engine, "in_memory": in_memory}
+    with contextlib.ExitStack() as stack:
+        file = _prepare_file(filepath, stack, **kwargs)
+        try:
+            return reader(file)
+        except FileNotFoundError:
+            if not (_is_remote_file(filepath) and isinstance(file, str)):
+                raise
+    with contextlib.ExitStack() as stack:
+        file = _prepare_file(filepath, stack, lookup=False, **kwargs)
+        return reader(file)
+
+
+def _set_float32_scaling(ds):
+    """Cast the CF packing attributes to float32, so that the moments are decoded to float32."""
+    for var in ds.data_vars.values():
+        for attr in ["scale_factor", "add_offset"]:
+            if attr in var.attrs:
+                var.attrs[attr] = np.float32(var.attrs[attr])
+    return ds
+
+
+def _get_encoding_kwargs(encoding, kwargs):
+    """Return the reader arguments for the given encoding of the radar moments."""
+    encoding = check_encoding(encoding)
+    if encoding is None:
+        return kwargs
+    if "mask_and_scale" in kwargs:
+        raise ValueError("'mask_and_scale' can not be specified together with 'encoding'.")
+    return {**kwargs, "mask_and_scale": False}
+
+
+def _encode_dataset(ds, encoding):
+    """Lazily decode the packed radar moments to float32 if ``encoding='float32'``."""
+    import xarray as xr
+
+    if encoding != "float32":
+        return ds
+    return xr.decode_cf(_set_float32_scaling(ds), decode_times=False, decode_timedelta=False)
+
+
 @check_software_availability(software="xradar", conda_package="xradar")
-def open_datatree(filepath, network, product=None, **kwargs):
-    """Open a file into an xarray DataTree object using xradar."""
-    filepath = _prepare_file(filepath)
+def open_datatree(filepath, network, product=None, *, in_memory=True, encoding=None, **kwargs):
+    """Open a file (or its in-memory bytes) into an xarray DataTree object using xradar.
+
+    Remote files already downloaded in the ``base_dir`` archive or present in the read cache
+    are opened from disk. Otherwise, if ``in_memory=True`` (the default), they are decoded from
+    memory and then stored in the read cache, else they are downloaded into the read cache and
+    opened from disk. Disable the read cache with the ``read_cache.enabled`` setting to avoid local writes.
+
+    By default, the radar moments are decoded to float64. Specify ``encoding="float32"``
+    to lazily decode them to float32, or ``encoding="packed"`` to keep them in their native
+    integer dtype with the ``scale_factor`` and ``add_offset`` attributes.
+    Packed moments can be later decoded with ``xarray.decode_cf``.
+    """
+    kwargs = _get_encoding_kwargs(encoding, kwargs)
+    engine = get_xradar_engine(network, product)
     open_datatree = get_xradar_datatree_reader(network, product)
-    dt = open_datatree(filepath, **kwargs)
+    dt = _open_file(
+        partial(open_datatree, **kwargs),
+        filepath,
+        network=network,
+        product=product,
+        engine=engine,
+        in_memory=in_memory,
+    )
+    if encoding == "float32":
+        dt = dt.map_over_datasets(_encode_dataset, encoding)
     return dt
 
 
 @check_software_availability(software="xradar", conda_package="xradar")
-def open_dataset(filepath, network, sweep, product=None, **kwargs):
-    """Open a file into an xarray Dataset object using xradar."""
+def open_dataset(filepath, network, sweep, product=None, *, in_memory=True, encoding=None, **kwargs):
+    """Open a file (or its in-memory bytes) into an xarray Dataset object using xradar.
+
+    Remote files already downloaded in the ``base_dir`` archive or present in the read cache
+    are opened from disk. Otherwise, if ``in_memory=True`` (the default), they are decoded from
+    memory and then stored in the read cache, else they are downloaded into the read cache and
+    opened from disk. Disable the read cache with the ``read_cache.enabled`` setting to avoid local writes.
+
+    See ``radar_api.open_datatree`` for the description of the ``encoding`` options.
+    """
     import xarray as xr
 
-    filepath = _prepare_file(filepath)
+    kwargs = _get_encoding_kwargs(encoding, kwargs)
     engine = get_xradar_engine(network, product)
-    ds = xr.open_dataset(filepath, group=sweep, engine=engine, **kwargs)
-    return ds
+    ds = _open_file(
+        partial(xr.open_dataset, group=sweep, engine=engine, **kwargs),
+        filepath,
+        network=network,
+        product=product,
+        engine=engine,
+        in_memory=in_memory,
+    )
+    return _encode_dataset(ds, encoding=encoding)
+
+
+def _reindex_sweep_angle(ds):
+    """Reindex the rays of a sweep to a regular angle grid."""
+    import xradar.util
+
+    params = xradar.util.extract_angle_parameters(ds)
+    return xradar.util.reindex_angle(
+        ds,
+        start_angle=params["start_angle"],
+        stop_angle=params["stop_angle"],
+        angle_res=float(params["angle_res"]),
+        direction=params["direction"],
+    )
+
+
+def _chunk_sweep(ds, chunks):
+    """Load the sweep coordinates into memory and lazily load the radar moments with dask."""
+    for name in ds.coords:
+        ds.variables[name].load()
+    data_vars = {name: ds.variables[name].chunk(chunks) for name in ds.data_vars if ds[name].ndim > 0}
+    return ds.assign(data_vars)
+
+
+def _get_sweep_names(dt):
+    """Return the names of the sweep nodes sorted by sweep index."""
+    return sorted([name for name in dt.children if name.startswith("sweep_")], key=lambda name: int(name[6:]))
+
+
+def _concat_sweeps(datasets, volume_times):
+    """Concatenate the datasets of a sweep along the ``volume_time`` dimension."""
+    import pandas as pd
+    import xarray as xr
+
+    # Select the sweeps with the most common fixed angle
+    fixed_angles = [round(float(ds["sweep_fixed_angle"]), 1) for ds in datasets]
+    fixed_angle = Counter(fixed_angles).most_common(1)[0][0]
+    is_selected = [angle == fixed_angle for angle in fixed_angles]
+    datasets = [ds for ds, selected in zip(datasets, is_selected, strict=True) if selected]
+    volume_times = [time for time, selected in zip(volume_times, is_selected, strict=True) if selected]
+    return xr.concat(
+        datasets,
+        dim=pd.Index(volume_times, name="volume_time"),
+        data_vars="all",
+        coords="different",
+        compat="equals",
+        join="outer",
+        combine_attrs="drop_conflicts",
+    )
+
+
+@check_software_availability(software="xradar", conda_package="xradar")
+@check_software_availability(software="dask", conda_package="dask")
+def open_mfdatatree(
+    filepaths,
+    network,
+    product=None,
+    *,
+    parallel=True,
+    chunks=None,
+    max_workers=None,
+    reindex_angle=True,
+    **kwargs,
+):
+    """Open multiple files into an xarray DataTree stacked along the ``volume_time`` dimension.
+
+    The sweeps are aligned by sweep index. For each sweep index, only the sweeps with
+    the most common fixed angle across the files are concatenated, so that each sweep node
+    can have a different ``volume_time`` coordinate. The data are lazily loaded with dask.
+
+    Parameters
+    ----------
+    filepaths : list
+        Filepaths of the radar files.
+    network : str
+        The name of the radar network.
+    product : str, optional
+        The product acronym. Must be specified for networks with multiple products.
+    parallel : bool, optional
+        If True (the default), the files are opened concurrently with a pool of threads.
+    chunks : dict, optional
+        Dask chunks of each sweep dataset. The default is one chunk per sweep and file.
+    max_workers : int, optional
+        Maximum number of threads opening the files if ``parallel=True``.
+    reindex_angle : bool, optional
+        If True (the default), the rays of each sweep are reindexed to a regular angle grid
+        with ``xradar.util.reindex_angle``, so that sweeps with missing or duplicated rays
+        can be concatenated.
+    **kwargs
+        Additional arguments passed to ``radar_api.open_datatree`` (i.e. ``encoding``).
+
+    Returns
+    -------
+    xarray.DataTree
+        The DataTree with the root metadata of the first file and the sweeps stacked along ``volume_time``.
+    """
+    import xarray as xr
+
+    filepaths = list(filepaths)
+    if len(filepaths) == 0:
+        raise ValueError("No filepaths specified.")
+    product = check_product(network, product=product)
+    chunks = {} if chunks is None else chunks
+    volume_times = [
+        get_info_from_filepath(filepath, network=network, product=product)["start_time"] for filepath in filepaths
+    ]
+
+    def _open_sweeps(filepath):
+        dt = open_datatree(filepath, network=network, product=product, **kwargs)
+        sweeps = {}
+        for name in _get_sweep_names(dt):
+            ds = _chunk_sweep(dt[name].to_dataset(), chunks=chunks)
+            sweeps[name] = _reindex_sweep_angle(ds) if reindex_angle else ds
+        return dt.to_dataset(), sweeps
+
+    # Open the files
+    if parallel:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_open_sweeps, filepaths))
+    else:
+        results = [_open_sweeps(filepath) for filepath in filepaths]
+
+    # Concatenate the sweeps along volume_time
+    root = results[0][0]
+    sweep_names = sorted({name for _, sweeps in results for name in sweeps}, key=lambda name: int(name[6:]))
+    dict_ds = {"/": root}
+    for name in sweep_names:
+        datasets, times = [], []
+        for (_, sweeps), volume_time in zip(results, volume_times, strict=True):
+            if name in sweeps:
+                datasets.append(sweeps[name])
+                times.append(volume_time)
+        dict_ds[name] = _concat_sweeps(datasets, volume_times=times)
+    return xr.DataTree.from_dict(dict_ds)
 
 
 @check_software_availability(software="pyart", conda_package="arm_pyart")
-def open_pyart(filepath, network, product=None, **kwargs):
-    """Open a file into a pyart object."""
-    filepath = _prepare_file(filepath)
+def open_pyart(filepath, network, product=None, in_memory=True, **kwargs):
+    """Open a file (or its in-memory bytes) into a pyart object.
+
+    Files archived within zip files (i.e. MCH_CSCS) can be opened with their
+    ``<zip_filepath>/<member name>`` path, as returned by ``radar_api.find_files``.
+    Since the pyart readers require a filepath, the member is extracted into a
+    temporary directory, which is removed once the file is read.
+
+    Remote files already downloaded in the ``base_dir`` archive or present in the read cache
+    are opened from disk. Otherwise, if ``in_memory=True`` (the default), they are decoded from
+    memory and then stored in the read cache, else they are downloaded into the read cache and
+    opened from disk. Disable the read cache with the ``read_cache.enabled`` setting to avoid local writes.
+    """
     pyart_reader = get_pyart_reader(network, product)
-    pyart_obj = pyart_reader(filepath, **kwargs)
+    pyart_obj = _open_file(
+        partial(pyart_reader, **kwargs),
+        filepath,
+        network=network,
+        product=product,
+        in_memory=in_memory,
+    )
     return pyart_obj
+
+
+READERS = {
+    "xradar": open_datatree,
+    "pyart": open_pyart,
+}
+
+
+def check_reader(reader):
+    """Check reader validity."""
+    if not isinstance(reader, str):
+        raise TypeError("`reader` must be a string.")
+    if reader not in READERS:
+        raise ValueError(f"Valid `reader` are {list(READERS)}.")
+    return reader
+
+
+####---------------------------------------------------------------------------.
+#### Process pool readers
+
+# State of a ReaderPool worker process, set once by _init_reader_worker
+_WORKER_STATE = {}
+
+
+def _init_reader_worker(reader, network, product, config, kwargs):
+    """Initialize a ReaderPool worker process.
+
+    The worker inherits the configuration of the parent process and imports the
+    reader stack (xradar or pyart) once, so that each file only pays the decoding cost.
+    """
+    radar_api.config.set(config)
+    if reader == "xradar":
+        get_xradar_datatree_reader(network, product)
+    else:
+        get_pyart_reader(network, product)
+    _WORKER_STATE.update(
+        {
+            "reader": READERS[reader],
+            "network": network,
+            "product": product,
+            "kwargs": kwargs,
+        },
+    )
+
+
+def _read_in_worker(filepath):
+    """Open a file within a ReaderPool worker and load it into memory to be sent back."""
+    obj = _WORKER_STATE["reader"](
+        filepath,
+        network=_WORKER_STATE["network"],
+        product=_WORKER_STATE["product"],
+        **_WORKER_STATE["kwargs"],
+    )
+    # Lazy arrays refer to the worker open files: load them before pickling
+    if hasattr(obj, "load"):
+        obj.load()
+    return obj
+
+
+def _check_positive_integer(value, name):
+    if not isinstance(value, int) or value < 1:
+        raise ValueError(f"`{name}` must be a positive integer.")
+    return value
+
+
+class ReaderPool:
+    """Pool of persistent processes decoding radar files in parallel.
+
+    Decoding radar files is CPU bound and holds the GIL, so threads do not scale.
+    The worker processes of a ``ReaderPool`` import the reader stack once at startup
+    and are reused across files. Each file is fully loaded in a worker and sent back
+    to the parent process as a pickled ``xarray.DataTree`` (or ``pyart.Radar``).
+
+    The pool must be closed after usage with ``close()``, or be used as context manager.
+
+    Parameters
+    ----------
+    network : str
+        Radar network of the files.
+    product : str, optional
+        Radar product of the files.
+    reader : str, optional
+        Either ``"xradar"`` to read files with ``radar_api.open_datatree``
+        or ``"pyart"`` to read files with ``radar_api.open_pyart``.
+        The default is ``"xradar"``.
+    n_workers : int, optional
+        Number of worker processes. The default is the number of CPUs.
+    max_pending : int, optional
+        Maximum number of files submitted ahead of the consumer by ``imap``.
+        The default is twice the number of workers.
+    mp_context : str, optional
+        Multiprocessing start method of the worker processes.
+        The default is ``"spawn"``, which is safe with threads and open file handles.
+    **kwargs : dict
+        Additional arguments passed to the reader (i.e. ``encoding``).
+    """
+
+    def __init__(
+        self,
+        network,
+        product=None,
+        reader="xradar",
+        *,
+        n_workers=None,
+        max_pending=None,
+        mp_context="spawn",
+        **kwargs,
+    ):
+        product = check_product(network=network, product=product)
+        reader = check_reader(reader)
+        n_workers = (os.cpu_count() or 1) if n_workers is None else n_workers
+        self.n_workers = _check_positive_integer(n_workers, name="n_workers")
+        max_pending = 2 * self.n_workers if max_pending is None else max_pending
+        self.max_pending = _check_positive_integer(max_pending, name="max_pending")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_reader_worker,
+            initargs=(reader, network, product, radar_api.config.config, kwargs),
+        )
+
+    def submit(self, filepath):
+        """Submit a file to the pool and return a ``concurrent.futures.Future``."""
+        return self._executor.submit(_read_in_worker, filepath)
+
+    def imap(self, filepaths, ordered=True):
+        """Yield ``(filepath, obj)`` tuples while the files are decoded by the pool.
+
+        At most ``max_pending`` files are decoded ahead of the consumer.
+        If ``ordered=True``, the results are yielded in the order of ``filepaths``,
+        otherwise as soon as they are available.
+        """
+        if ordered:
+            yield from self._imap_ordered(filepaths)
+        else:
+            yield from self._imap_unordered(filepaths)
+
+    def _imap_ordered(self, filepaths):
+        futures = deque()
+        try:
+            for filepath in filepaths:
+                futures.append((filepath, self.submit(filepath)))
+                if len(futures) >= self.max_pending:
+                    filepath, future = futures.popleft()
+                    yield filepath, future.result()
+            while futures:
+                filepath, future = futures.popleft()
+                yield filepath, future.result()
+        finally:
+            for _, future in futures:
+                future.cancel()
+
+    def _imap_unordered(self, filepaths):
+        futures = {}
+        try:
+            for filepath in filepaths:
+                futures[self.submit(filepath)] = filepath
+                if len(futures) >= self.max_pending:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield futures.pop(future), future.result()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures.pop(future), future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Shut down the worker processes when exiting the context manager."""
+        self.close()
+
+
+def open_many(filepaths, network, product=None, reader="xradar", *, n_workers=None, ordered=True, **kwargs):
+    """Decode many radar files in parallel with a pool of worker processes.
+
+    Yield ``(filepath, obj)`` tuples, where ``obj`` is an in-memory ``xarray.DataTree``
+    (or a ``pyart.Radar`` if ``reader="pyart"``).
+    The worker processes are shut down once the generator is exhausted or closed.
+    See ``radar_api.readers.ReaderPool`` for the description of the arguments.
+
+    Examples
+    --------
+    >>> filepaths = radar_api.find_files(radar, network, start_time, end_time)
+    >>> for filepath, dt in radar_api.open_many(filepaths, network=network, n_workers=8):
+    ...     process(dt)
+    """
+    with ReaderPool(network=network, product=product, reader=reader, n_workers=n_workers, **kwargs) as pool:
+        yield from pool.imap(filepaths, ordered=ordered)
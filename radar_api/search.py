@@ -23,25 +23,45 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """This module provides functions for searching files on local disk and cloud buckets."""
+import asyncio
+import contextlib
 import datetime
+import inspect
+import itertools
 import os
-import zipfile
+import re
+import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
+from fsspec.asyn import sync
 from trollsift import Parser
 
+from radar_api.catalog import FileCatalog
 from radar_api.checks import (
     check_base_dir,
     check_network,
     check_product,
     check_protocol,
     check_radar,
+    check_radars,
     check_start_end_time,
 )
 from radar_api.configs import get_base_dir
-from radar_api.filter import filter_files
-from radar_api.io import get_bucket_prefix, get_directory_pattern, get_filesystem
-from radar_api.utils.list import flatten_list
+from radar_api.filter import are_parsed_files_within_time, discard_unsupported_files, filter_files
+from radar_api.info import parse_filepaths
+from radar_api.inventory import get_local_inventory
+from radar_api.io import (
+    get_bucket_prefix,
+    get_directory_pattern,
+    get_filesystem,
+    get_product_file_time_coverage,
+    get_product_filename_patterns,
+)
+from radar_api.listing_cache import get_listing_cache, get_listing_cache_ttl
+from radar_api.transfer import TEMPORARY_SUFFIXES
+from radar_api.zip_archives import list_zip_members
 
 ####--------------------------------------------------------------------------.
 
@@ -100,8 +120,14 @@ def get_list_timesteps(start_time, end_time, freq):
     return timesteps
 
 
-def get_directories_paths(start_time, end_time, network, product, radar, protocol, base_dir):
-    """Returns a list of the directory paths to scan."""
+def get_directories_end_times(timesteps, freq):
+    """Return the end time of the period covered by each directory timestep."""
+    period_freq = {"YE": "Y", "MS": "M"}.get(freq, freq)
+    return pd.DatetimeIndex(timesteps).to_period(period_freq).end_time
+
+
+def _get_directories_paths_and_end_times(start_time, end_time, network, product, radar, *, protocol, base_dir):
+    """Returns the directory paths to scan and the end time of the period they cover."""
     # Get directory pattern
     directory_pattern = get_directory_pattern(protocol, network, product)
     # Identify frequency
@@ -111,25 +137,576 @@ def get_directories_paths(start_time, end_time, network, product, radar, protoco
     # Compose directories path
     parser = Parser(directory_pattern)
     paths = [parser.compose({"time": time, "radar": radar, "base_dir": base_dir}) for time in list_time]
+    end_times = get_directories_end_times(list_time, freq=freq)
+    return paths, end_times
+
+
+def get_directories_paths(start_time, end_time, network, product, radar, protocol, base_dir):
+    """Returns a list of the directory paths to scan."""
+    paths, _ = _get_directories_paths_and_end_times(
+        start_time=start_time,
+        end_time=end_time,
+        network=network,
+        product=product,
+        radar=radar,
+        protocol=protocol,
+        base_dir=base_dir,
+    )
     return paths
 
 
-def _list_files_within_zip(zip_filepath):
-    """Return the paths of files within a zip file."""
-    with zipfile.ZipFile(zip_filepath, "r") as zf:
-        filenames = zf.namelist()
-    filepaths = [os.path.join(zip_filepath, fname) for fname in filenames]
-    return filepaths
+# Time directives whose rendering preserves the chronological order when they follow each other
+# from the most to the least significant time component. Values are the first and last covered component.
+_ORDERED_TIME_DIRECTIVES = {
+    "%Y": (0, 0),
+    "%y": (0, 0),
+    "%m": (1, 1),
+    "%j": (1, 2),
+    "%d": (2, 2),
+    "%H": (3, 3),
+    "%M": (4, 4),
+    "%S": (5, 5),
+}
+
+
+def _get_ordered_time_format(time_format):
+    """Return the leading part of a time format which renders times in chronological order."""
+    ordered_format = ""
+    last_component = -1
+    for token in re.split(r"(%.)", time_format):
+        if not token.startswith("%"):
+            ordered_format += token
+            continue
+        components = _ORDERED_TIME_DIRECTIVES.get(token)
+        if components is None or components[0] != last_component + 1:
+            break
+        ordered_format += token
+        last_component = components[1]
+    return ordered_format
+
+
+def _get_common_prefix(strings):
+    """Return the longest prefix shared by all strings."""
+    if len(strings) == 0:
+        return ""
+    shortest, longest = min(strings), max(strings)
+    for i, char in enumerate(shortest):
+        if char != longest[i]:
+            return shortest[:i]
+    return shortest
+
+
+def _get_pattern_prefix(pattern, radar, start_time, end_time):
+    """Return the filename prefix shared by the files of a pattern starting within a time period."""
+    prefix = ""
+    for literal, field, spec in re.findall(r"([^{]*)(?:\{(\w+)(?::([^}]*))?\})?", pattern):
+        prefix += literal
+        if field == "radar_acronym":
+            # The radar acronym is known only if the filename contains the full radar name
+            width = re.match(r"\d*", spec).group()
+            if width == "" or int(width) != len(radar):
+                return prefix
+            prefix += radar
+        elif field == "start_time" and "{end_time" not in pattern:
+            time_format = _get_ordered_time_format(spec)
+            return prefix + _get_common_prefix([start_time.strftime(time_format), end_time.strftime(time_format)])
+        elif field:
+            return prefix
+    return prefix
+
+
+def get_filenames_prefix(network, product, radar, start_time, end_time):
+    """
+    Return the filename prefix shared by all files which can overlap a time period.
+
+    The prefix is derived from the ``filename_patterns`` of the network product
+    (i.e. ``KABR20230101_01`` for NEXRAD files between 01:00 and 02:00).
+    Since files can start before ``start_time``, the prefix accounts for the
+    files starting up to ``file_time_coverage`` before ``start_time``.
+
+    Returns
+    -------
+    str
+        The filename prefix. An empty string if the filenames do not share a prefix.
+    """
+    start_time = pd.Timestamp(start_time) - get_product_file_time_coverage(network, product)
+    end_time = pd.Timestamp(end_time)
+    prefixes = [
+        _get_pattern_prefix(pattern, radar=radar, start_time=start_time, end_time=end_time)
+        for pattern in get_product_filename_patterns(network, product)
+    ]
+    return _get_common_prefix(prefixes)
+
+
+def _filter_by_prefix(files, prefix):
+    """Return the filepaths (or file info) whose filename starts with the prefix."""
+    if not prefix:
+        return files
+    return [
+        file for file in files if os.path.basename(file["name"] if isinstance(file, dict) else file).startswith(prefix)
+    ]
+
+
+def _supports_prefix_listing(fs):
+    """Check whether the filesystem can list the objects of a directory starting with a prefix (i.e. s3fs)."""
+    lsdir = getattr(fs, "_lsdir", None)
+    return lsdir is not None and "prefix" in inspect.signature(lsdir).parameters
+
+
+def _get_listing_key(dir_path, prefix=""):
+    """Return the listing cache key of a directory listing restricted to a filename prefix."""
+    if not prefix:
+        return dir_path
+    return f"{dir_path}/{prefix}*"
+
+
+def _list_files_within_zip(zip_filepath, detail=False):
+    """Return the paths (or the info) of files within a zip file."""
+    return list_zip_members(zip_filepath, detail=detail)
+
+
+def _list_directory(fs, dir_path, detail=False, prefix=""):
+    """Return filepaths (or file info) within a given directory (or zip file), or None if listing fails.
+
+    If ``prefix`` is specified, only the files whose filename starts with the prefix are returned.
+    On filesystems supporting it (i.e. s3fs), the prefix is passed to the listing requests.
+    """
+    try:
+        if dir_path.endswith(".zip"):
+            files = _list_files_within_zip(dir_path, detail=detail)
+        elif prefix and _supports_prefix_listing(fs):
+            files = sync(fs.loop, fs._lsdir, dir_path, prefix=prefix)
+            files = files if detail else [info["name"] for info in files]
+        else:
+            files = fs.ls(dir_path, detail=detail)
+    except Exception:
+        return None
+    return _filter_by_prefix(files, prefix=prefix)
 
 
 def _try_list_files(fs, dir_path):
     """Return filepaths within a given directory (or zip file)."""
+    return _list_directory(fs=fs, dir_path=dir_path) or []
+
+
+async def _async_list_directory(fs, dir_path, semaphore, detail=False, prefix=""):
+    """Return filepaths within a given directory using the filesystem coroutines, or None if listing fails."""
+    async with semaphore:
+        try:
+            if dir_path.endswith(".zip"):
+                files = await asyncio.to_thread(_list_files_within_zip, dir_path, detail)
+            elif prefix and _supports_prefix_listing(fs):
+                files = await fs._lsdir(dir_path, prefix=prefix)
+                files = files if detail else [info["name"] for info in files]
+            else:
+                files = await fs._ls(dir_path, detail=detail)
+        except Exception:
+            return None
+    return _filter_by_prefix(files, prefix=prefix)
+
+
+async def _async_list_directories(fs, dir_paths, max_concurrency, detail=False, prefix=""):
+    """Return the filepaths within each directory, listing all directories concurrently."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    prefixes = _get_prefixes(prefix, dir_paths)
+    return await asyncio.gather(
+        *[
+            _async_list_directory(fs=fs, dir_path=dir_path, semaphore=semaphore, detail=detail, prefix=dir_prefix)
+            for dir_path, dir_prefix in zip(dir_paths, prefixes, strict=True)
+        ],
+    )
+
+
+def _get_prefixes(prefix, dir_paths):
+    """Return the filename prefix of each directory."""
+    if isinstance(prefix, str):
+        return [prefix] * len(dir_paths)
+    prefixes = list(prefix)
+    if len(prefixes) != len(dir_paths):
+        raise ValueError("'prefix' must be a string or a list with a prefix for each directory.")
+    return prefixes
+
+
+def _list_directories(fs, dir_paths, max_concurrency=20, detail=False, prefix=""):
+    """Return the filepaths (or file info) within each directory, or None for directories which can not be listed."""
+    max_concurrency = max(int(max_concurrency), 1)
+    dir_paths = list(dir_paths)
+    prefixes = _get_prefixes(prefix, dir_paths)
+    if max_concurrency == 1 or len(dir_paths) <= 1:
+        return [
+            _list_directory(fs=fs, dir_path=dir_path, detail=detail, prefix=dir_prefix)
+            for dir_path, dir_prefix in zip(dir_paths, prefixes, strict=True)
+        ]
+    if getattr(fs, "async_impl", False):
+        return sync(fs.loop, _async_list_directories, fs, dir_paths, max_concurrency, detail, prefixes)
+    n_threads = min(max_concurrency, len(dir_paths))
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(
+            executor.map(
+                lambda dir_path, dir_prefix: _list_directory(
+                    fs=fs,
+                    dir_path=dir_path,
+                    detail=detail,
+                    prefix=dir_prefix,
+                ),
+                dir_paths,
+                prefixes,
+            ),
+        )
+
+
+def _get_names_and_sizes(infos):
+    """Return the list of (name, size) tuples from a detailed directory listing."""
+    return [(info["name"], info.get("size")) for info in infos]
+
+
+def list_directories(fs, dir_paths, max_concurrency=20, detail=False, prefix=""):
+    """
+    Return the filepaths within each directory.
+
+    Directories are listed concurrently: asynchronous filesystems (i.e. s3fs) are
+    listed with coroutines bounded by a semaphore, while the other filesystems are
+    listed with a pool of threads.
+
+    Parameters
+    ----------
+    fs : fsspec.FileSystem
+        fsspec filesystem instance.
+    dir_paths : list
+        List of directory (or zip file) paths to list.
+    max_concurrency : int, optional
+        Maximum number of directories listed concurrently.
+        If 1, directories are listed sequentially.
+        The default is 20.
+    detail : bool, optional
+        If True, it returns (filepath, size) tuples instead of filepaths.
+        The default is False.
+    prefix : str or list, optional
+        If specified, only the files whose filename starts with the prefix are returned.
+        A list specifies the prefix of each directory.
+        On filesystems supporting it (i.e. s3fs), the prefix restricts the listing requests.
+        The default is an empty string.
+
+    Returns
+    -------
+    list
+        List with the filepaths of each directory, in the same order as ``dir_paths``.
+        Directories which can not be listed return an empty list.
+    """
+    results = _list_directories(
+        fs=fs,
+        dir_paths=dir_paths,
+        max_concurrency=max_concurrency,
+        detail=detail,
+        prefix=prefix,
+    )
+    if detail:
+        return [_get_names_and_sizes(infos or []) for infos in results]
+    return [fpaths or [] for fpaths in results]
+
+
+def list_directories_with_cache(
+    fs,
+    protocol,
+    dir_paths,
+    *,
+    end_times=None,
+    max_concurrency=20,
+    listing_cache=None,
+    detail=False,
+    prefix="",
+):
+    """
+    Return the filepaths within each directory, using the on-disk listing cache.
+
+    Only the directories without a valid cached listing are listed.
+    The new listings are then stored in the cache.
+    Listings restricted to a filename prefix are cached separately from the full
+    directory listings, which are reused if available.
+
+    Parameters
+    ----------
+    fs : fsspec.FileSystem
+        fsspec filesystem instance.
+    protocol : str
+        Protocol of the filesystem.
+    dir_paths : list
+        List of directory (or zip file) paths to list.
+    end_times : list, optional
+        End time of the period covered by each directory.
+        Listings of directories whose period is closed never expire.
+        If None, all listings expire after the ``listing_cache.ttl``.
+    max_concurrency : int, optional
+        Maximum number of directories listed concurrently.
+        The default is 20.
+    listing_cache : radar_api.listing_cache.ListingCache, optional
+        The listing cache. If None, it uses the cache defined by ``radar_api.config``.
+        If the cache is disabled, it falls back to ``list_directories``.
+    detail : bool, optional
+        If True, it returns (filepath, size) tuples instead of filepaths.
+        The default is False.
+    prefix : str or list, optional
+        If specified, only the files whose filename starts with the prefix are returned.
+        A list specifies the prefix of each directory.
+        The default is an empty string.
+
+    Returns
+    -------
+    list
+        List with the filepaths of each directory, in the same order as ``dir_paths``.
+        Directories which can not be listed return an empty list.
+    """
+    listing_cache = get_listing_cache() if listing_cache is None else listing_cache
+    if listing_cache is None:
+        return list_directories(
+            fs=fs,
+            dir_paths=dir_paths,
+            max_concurrency=max_concurrency,
+            detail=detail,
+            prefix=prefix,
+        )
+
+    # Retrieve cached listings
+    # - Full directory listings are used also for the listings restricted to a prefix
+    dir_paths = list(dir_paths)
+    prefixes = _get_prefixes(prefix, dir_paths)
+    keys = [
+        _get_listing_key(dir_path, prefix=dir_prefix) for dir_path, dir_prefix in zip(dir_paths, prefixes, strict=True)
+    ]
     try:
-        if not dir_path.endswith(".zip"):
-            return fs.ls(dir_path)
-        return _list_files_within_zip(dir_path)
-    except Exception:
-        return []
+        listings = listing_cache.get(
+            protocol=protocol,
+            dir_paths=list(dict.fromkeys(dir_paths + keys)),
+            ttl=get_listing_cache_ttl(),
+        )
+    except sqlite3.Error:
+        listings = {}
+    for dir_path, dir_prefix, key in zip(dir_paths, prefixes, keys, strict=True):
+        if key not in listings and dir_path in listings:
+            listings[key] = [
+                (name, size) for name, size in listings[dir_path] if os.path.basename(name).startswith(dir_prefix)
+            ]
+
+    # List directories without valid cached listing
+    missing = {
+        key: (dir_path, dir_prefix)
+        for dir_path, dir_prefix, key in zip(dir_paths, prefixes, keys, strict=True)
+        if key not in listings
+    }
+    results = _list_directories(
+        fs=fs,
+        dir_paths=[dir_path for dir_path, _ in missing.values()],
+        max_concurrency=max_concurrency,
+        detail=True,
+        prefix=[dir_prefix for _, dir_prefix in missing.values()],
+    )
+    new_listings = {
+        key: _get_names_and_sizes(infos) for key, infos in zip(missing, results, strict=True) if infos is not None
+    }
+
+    # Update the cache
+    if end_times is not None:
+        end_times = [pd.Timestamp(end_time).timestamp() for end_time in end_times]
+        end_times = dict(zip(keys, end_times, strict=True))
+    with contextlib.suppress(sqlite3.Error):
+        listing_cache.set(protocol=protocol, listings=new_listings, end_times=end_times)
+    listings.update(new_listings)
+    if detail:
+        return [listings.get(key, []) for key in keys]
+    return [[name for name, _ in listings.get(key, [])] for key in keys]
+
+
+def _format_search_results(dict_sizes, network, product, radar, *, detail, return_catalog):
+    """Format the dictionary of filepaths and sizes into the requested find_files output."""
+    if return_catalog:
+        return FileCatalog.from_filepaths(
+            list(dict_sizes),
+            network=network,
+            product=product,
+            radar=radar,
+            sizes=list(dict_sizes.values()),
+        )
+    if detail:
+        return dict_sizes
+    return list(dict_sizes)
+
+
+def _check_search_location(protocol, base_dir, fs_args):
+    """Check and format the storage arguments of a file search."""
+    if protocol not in ["file", "local"] and base_dir is not None:
+        raise ValueError("If protocol is not 'file' or 'local', base_dir must not be specified !")
+
+    # Check for when searching on local storage
+    if protocol in ["file", "local"]:
+        # Get default local directory if base_dir = None
+        base_dir = get_base_dir(base_dir)
+        # Set protocol and fs_args expected by fsspec
+        protocol = "file"
+        fs_args = {}
+    protocol = check_protocol(protocol)
+    base_dir = check_base_dir(base_dir)
+    return protocol, base_dir, fs_args
+
+
+def _discard_files(fpaths, network, protocol):
+    """Discard unsupported files and temporary files of ongoing or interrupted downloads."""
+    # Special conditions
+    fpaths = discard_unsupported_files(fpaths, network=network)
+    # Discard temporary files of ongoing or interrupted downloads
+    if protocol == "file":
+        fpaths = [fpath for fpath in fpaths if not fpath.endswith(TEMPORARY_SUFFIXES)]
+    return fpaths
+
+
+def _refresh_inventory(inventory, *, network, product, radar, start_time, end_time, base_dir):
+    """Scan again the local directories of the time period modified since their last inventory scan."""
+    dir_paths = get_directories_paths(
+        start_time=start_time,
+        end_time=end_time,
+        network=network,
+        product=product,
+        radar=radar,
+        protocol="file",
+        base_dir=base_dir,
+    )
+    inventory.refresh_directories(dir_paths, network=network, product=product, radar=radar)
+
+
+def _search_radars_files(
+    radars,
+    network,
+    product,
+    start_time,
+    end_time,
+    *,
+    base_dir,
+    protocol,
+    fs_args,
+    max_concurrency=20,
+    detail=False,
+    verbose=False,
+):
+    """Search the files of multiple radars of a network product.
+
+    The directories of all radars are listed concurrently with a single filesystem.
+    It expects already checked arguments.
+
+    Returns
+    -------
+    dict
+        Dictionary of format ``{<radar>: {<filepath>: <size>}}`` with the sorted filepaths of each radar.
+        The file sizes are None if ``detail=False``.
+    """
+    # Search files with the local inventory if available
+    if protocol == "file":
+        inventory = get_local_inventory(base_dir)
+        if inventory is not None and inventory.is_indexed(network=network, product=product):
+            if verbose:
+                print("Searching files in the local inventory.")
+            for radar in radars:
+                _refresh_inventory(
+                    inventory,
+                    network=network,
+                    product=product,
+                    radar=radar,
+                    start_time=start_time,
+                    end_time=end_time,
+                    base_dir=base_dir,
+                )
+            return {
+                radar: inventory.query(
+                    network=network,
+                    product=product,
+                    radar=radar,
+                    start_time=start_time,
+                    end_time=end_time,
+                    detail=True,
+                )
+                for radar in radars
+            }
+
+    # Get filesystem
+    fs = get_filesystem(protocol=protocol, fs_args=fs_args)
+    bucket_prefix = get_bucket_prefix(protocol)
+
+    # Get list of directories over which to search
+    # - The filename prefix shared by the files of the time period restricts the cloud bucket listings
+    dir_paths = []
+    dir_end_times = []
+    dir_prefixes = []
+    dir_radars = []
+    for radar in radars:
+        radar_dir_paths, radar_dir_end_times = _get_directories_paths_and_end_times(
+            start_time=start_time,
+            end_time=end_time,
+            network=network,
+            radar=radar,
+            product=product,
+            protocol=protocol,
+            base_dir=base_dir,
+        )
+        prefix = get_filenames_prefix(
+            network=network,
+            product=product,
+            radar=radar,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        dir_paths += radar_dir_paths
+        dir_end_times += list(radar_dir_end_times)
+        dir_prefixes += [prefix] * len(radar_dir_paths)
+        dir_radars += [radar] * len(radar_dir_paths)
+
+    # Report over how many directory to scan
+    n_directories = len(dir_paths)
+    if verbose:
+        print(f"Searching files across {n_directories} directories.")
+
+    # List all directories concurrently
+    # - Cloud bucket listings are cached on disk
+    if protocol == "file":
+        list_dir_files = list_directories(
+            fs=fs,
+            dir_paths=dir_paths,
+            max_concurrency=max_concurrency,
+            detail=detail,
+            prefix=dir_prefixes,
+        )
+    else:
+        list_dir_files = list_directories_with_cache(
+            fs=fs,
+            protocol=protocol,
+            dir_paths=dir_paths,
+            end_times=dir_end_times,
+            max_concurrency=max_concurrency,
+            detail=detail,
+            prefix=dir_prefixes,
+        )
+    if not detail:
+        list_dir_files = [[(fpath, None) for fpath in fpaths] for fpaths in list_dir_files]
+
+    # Group the files by radar
+    dict_radars_files = {radar: [] for radar in radars}
+    for radar, files in zip(dir_radars, list_dir_files, strict=True):
+        dict_radars_files[radar] += files
+
+    dict_radars_sizes = {}
+    for radar, files in dict_radars_files.items():
+        dict_sizes = dict(files)
+        fpaths = _discard_files(list(dict_sizes), network=network, protocol=protocol)
+        # Filter files of all directories at once
+        # - Keep only files with expected filename structure
+        # - Subset by time
+        fpaths = filter_files(
+            fpaths,
+            network=network,
+            product=product,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        # Add bucket prefix
+        dict_radars_sizes[radar] = {bucket_prefix + fpath: dict_sizes[fpath] for fpath in sorted(fpaths)}
+    return dict_radars_sizes
 
 
 def find_files(
@@ -142,6 +719,10 @@ def find_files(
     product=None,
     fs_args={},
     verbose=False,
+    *,
+    max_concurrency=20,
+    detail=False,
+    return_catalog=False,
 ):
     """
     Retrieve files from local or cloud bucket storage.
@@ -181,34 +762,294 @@ def find_files(
     verbose : bool, optional
         If True, it print some information concerning the file search.
         The default is False.
+    max_concurrency : int, optional
+        Maximum number of directories listed concurrently.
+        If 1, directories are listed sequentially.
+        The default is 20.
+    detail : bool, optional
+        If True, it returns a dictionary mapping the sorted filepaths to their size in bytes,
+        as reported by the directory listings. The size is None if unknown.
+        The default is False.
+    return_catalog : bool, optional
+        If True, it returns a ``radar_api.FileCatalog`` enabling fast sub-period
+        and radar/volume selections without searching the files again.
+        The default is False.
     """
     # Check inputs
-    if protocol not in ["file", "local"] and base_dir is not None:
-        raise ValueError("If protocol is not 'file' or 'local', base_dir must not be specified !")
+    protocol, base_dir, fs_args = _check_search_location(protocol=protocol, base_dir=base_dir, fs_args=fs_args)
 
-    # Check for when searching on local storage
-    if protocol in ["file", "local"]:
-        # Get default local directory if base_dir = None
-        base_dir = get_base_dir(base_dir)
-        # Set protocol and fs_args expected by fsspec
-        protocol = "file"
-        fs_args = {}
+    # -------------------------------------------------------------------------.
+    # Format inputs
+    network = check_network(network)
+    radar = check_radar(radar=radar, network=network)
+    product = check_product(network=network, product=product)
+    start_time, end_time = check_start_end_time(start_time, end_time)
+
+    # Search files
+    dict_sizes = _search_radars_files(
+        radars=[radar],
+        network=network,
+        product=product,
+        start_time=start_time,
+        end_time=end_time,
+        base_dir=base_dir,
+        protocol=protocol,
+        fs_args=fs_args,
+        max_concurrency=max_concurrency,
+        detail=detail or return_catalog,
+        verbose=verbose,
+    )[radar]
+    return _format_search_results(
+        dict_sizes,
+        network=network,
+        product=product,
+        radar=radar,
+        detail=detail,
+        return_catalog=return_catalog,
+    )
+
+
+def find_files_multi(
+    radars,
+    network,
+    start_time,
+    end_time,
+    base_dir=None,
+    *,
+    protocol="s3",
+    product=None,
+    fs_args={},
+    verbose=False,
+    max_concurrency=20,
+    detail=False,
+    return_catalog=False,
+):
+    """
+    Retrieve the files of multiple radars from local or cloud bucket storage.
+
+    The configuration is checked and the filesystem is created only once.
+    The directories of all radars are then listed concurrently.
+
+    Parameters
+    ----------
+    radars : list
+        List of radar names, or list of ``(network, radar)`` tuples as returned by
+        ``radar_api.available_radars_within_extent`` or ``radar_api.available_radars_around_point``.
+        Tuples of other networks are discarded.
+    network : str
+        The name of the radar network.
+        See `radar_api.available_network()` for available radar networks.
+    start_time : datetime.datetime
+        The start (inclusive) time of the interval period for retrieving the filepaths.
+    end_time : datetime.datetime
+        The end (exclusive) time of the interval period for retrieving the filepaths.
+    max_concurrency : int, optional
+        Maximum number of directories listed concurrently across all radars.
+        The default is 20.
+
+    See ``radar_api.find_files`` for the description of the other arguments.
+
+    Returns
+    -------
+    dict
+        Dictionary of format ``{<radar>: <find_files output>}``.
+    """
+    # Check inputs
+    protocol, base_dir, fs_args = _check_search_location(protocol=protocol, base_dir=base_dir, fs_args=fs_args)
+
+    # -------------------------------------------------------------------------.
+    # Format inputs
+    network = check_network(network)
+    radars = check_radars(radars=radars, network=network)
+    product = check_product(network=network, product=product)
+    start_time, end_time = check_start_end_time(start_time, end_time)
+
+    # Search files of all radars
+    dict_radars_sizes = _search_radars_files(
+        radars=radars,
+        network=network,
+        product=product,
+        start_time=start_time,
+        end_time=end_time,
+        base_dir=base_dir,
+        protocol=protocol,
+        fs_args=fs_args,
+        max_concurrency=max_concurrency,
+        detail=detail or return_catalog,
+        verbose=verbose,
+    )
+    return {
+        radar: _format_search_results(
+            dict_sizes,
+            network=network,
+            product=product,
+            radar=radar,
+            detail=detail,
+            return_catalog=return_catalog,
+        )
+        for radar, dict_sizes in dict_radars_sizes.items()
+    }
+
+
+def _iter_directories_files(fs, protocol, dir_paths, dir_end_times, *, prefix="", max_concurrency=20, detail=False):
+    """Yield the (filepath, size) tuples of each directory in order.
+
+    Up to ``max_concurrency`` directories are listed ahead of the directory being yielded.
+    """
+    max_concurrency = max(int(max_concurrency), 1)
+
+    def _list_directory_files(dir_path, end_time):
+        if protocol == "file":
+            files = list_directories(fs=fs, dir_paths=[dir_path], max_concurrency=1, detail=detail, prefix=prefix)[0]
+        else:
+            files = list_directories_with_cache(
+                fs=fs,
+                protocol=protocol,
+                dir_paths=[dir_path],
+                end_times=[end_time],
+                max_concurrency=1,
+                detail=detail,
+                prefix=prefix,
+            )[0]
+        return files if detail else [(fpath, None) for fpath in files]
+
+    directories = iter(zip(dir_paths, dir_end_times, strict=True))
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        futures = deque(
+            executor.submit(_list_directory_files, *directory)
+            for directory in itertools.islice(directories, max_concurrency)
+        )
+        while futures:
+            files = futures.popleft().result()
+            directory = next(directories, None)
+            if directory is not None:
+                futures.append(executor.submit(_list_directory_files, *directory))
+            yield files
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_selected_files(files, *, network, product, protocol, bucket_prefix, start_time, end_time, detail=False):
+    """Yield the files overlapping the time period in time order."""
+    dict_sizes = dict(files)
+    fpaths = _discard_files(list(dict_sizes), network=network, protocol=protocol)
+    if len(fpaths) == 0:
+        return
+    df = parse_filepaths(fpaths, network=network, product=product, ignore_errors=True)
+    df = df.loc[
+        are_parsed_files_within_time(df, network=network, product=product, start_time=start_time, end_time=end_time)
+    ]
+    df = df.sort_values(["start_time", "filepath"], kind="stable")
+    if not detail:
+        for fpath in df["filepath"]:
+            yield bucket_prefix + fpath
+        return
+    for record in df.to_dict("records"):
+        record["size"] = dict_sizes[record["filepath"]]
+        record["filepath"] = bucket_prefix + record["filepath"]
+        yield record
+
+
+def iter_files(
+    radar,
+    network,
+    start_time,
+    end_time,
+    base_dir=None,
+    *,
+    protocol="s3",
+    product=None,
+    fs_args={},
+    max_concurrency=20,
+    detail=False,
+    verbose=False,
+):
+    """
+    Iterate over the files of local or cloud bucket storage in time order.
+
+    Contrary to ``find_files``, the files are yielded as soon as the listing of their
+    directory completes, so that the files of the first directories can be processed
+    while the following directories are still being listed. At most ``max_concurrency``
+    directory listings are held in memory.
+
+    Parameters
+    ----------
+    radar : str
+        The name of the radar.
+        Use `radar_api.available_radars()` to retrieve the available satellites.
+    network : str
+        The name of the radar network.
+        See `radar_api.available_network()` for available radar networks.
+    start_time : datetime.datetime
+        The start (inclusive) time of the interval period for retrieving the filepaths.
+    end_time : datetime.datetime
+        The end (exclusive) time of the interval period for retrieving the filepaths.
+    max_concurrency : int, optional
+        Maximum number of directories listed ahead of the files being yielded.
+        The default is 20.
+    detail : bool, optional
+        If False (the default), it yields the filepaths.
+        If True, it yields dictionaries with the ``filepath``, the file ``size`` in bytes
+        and the file information parsed from the filename (i.e. ``start_time``).
+
+    See ``radar_api.find_files`` for the description of the other arguments.
+
+    Yields
+    ------
+    str or dict
+        The filepath (or file information) of each file, sorted by file start time.
+    """
+    # Check inputs
+    protocol, base_dir, fs_args = _check_search_location(protocol=protocol, base_dir=base_dir, fs_args=fs_args)
 
     # -------------------------------------------------------------------------.
     # Format inputs
-    protocol = check_protocol(protocol)
-    base_dir = check_base_dir(base_dir)
     network = check_network(network)
     radar = check_radar(radar=radar, network=network)
     product = check_product(network=network, product=product)
     start_time, end_time = check_start_end_time(start_time, end_time)
+    kwargs = {
+        "network": network,
+        "product": product,
+        "protocol": protocol,
+        "start_time": start_time,
+        "end_time": end_time,
+        "detail": detail,
+    }
+
+    # Search files with the local inventory if available
+    if protocol == "file":
+        inventory = get_local_inventory(base_dir)
+        if inventory is not None and inventory.is_indexed(network=network, product=product):
+            if verbose:
+                print("Searching files in the local inventory.")
+            _refresh_inventory(
+                inventory,
+                network=network,
+                product=product,
+                radar=radar,
+                start_time=start_time,
+                end_time=end_time,
+                base_dir=base_dir,
+            )
+            dict_sizes = inventory.query(
+                network=network,
+                product=product,
+                radar=radar,
+                start_time=start_time,
+                end_time=end_time,
+                detail=True,
+            )
+            yield from _iter_selected_files(dict_sizes.items(), bucket_prefix="", **kwargs)
+            return
 
     # Get filesystem
     fs = get_filesystem(protocol=protocol, fs_args=fs_args)
     bucket_prefix = get_bucket_prefix(protocol)
 
     # Get list of directories over which to search
-    dir_paths = get_directories_paths(
+    dir_paths, dir_end_times = _get_directories_paths_and_end_times(
         start_time=start_time,
         end_time=end_time,
         network=network,
@@ -217,33 +1058,24 @@ def find_files(
         protocol=protocol,
         base_dir=base_dir,
     )
-
-    # Report over how many directory to scan
-    n_directories = len(dir_paths)
     if verbose:
-        print(f"Searching files across {n_directories} directories.")
-
-    # Loop over each directory:
-    list_fpaths = []
-    # dir_path = dir_paths[0]
-    for dir_path in dir_paths:
-        # Retrieve list of files
-        fpaths = _try_list_files(fs=fs, dir_path=dir_path)
-        # Special conditions
-        if network == "NEXRAD":
-            fpaths = [
-                fpath for fpath in fpaths if "NWS_NEXRAD" not in fpath
-            ]  # NWS_NEXRAD_NXL2DP or NWS_NEXRAD_NXL2LG tar balls
-            fpaths = [fpath for fpath in fpaths if not fpath.endswith(".001")]  # repeated files
-            fpaths = [fpath for fpath in fpaths if not fpath.endswith(".Z")]  # corrupted compressed files
-            fpaths = [fpath for fpath in fpaths if not fpath.endswith("_MDM")]
-        # Add bucket prefix
-        fpaths = [bucket_prefix + fpath for fpath in fpaths]
-        # Filter files
-        # - Keep only files with expected filename structure
-        # - Subset by time
-        fpaths = filter_files(fpaths, network=network, product=product, start_time=start_time, end_time=end_time)
-        list_fpaths += fpaths
+        print(f"Searching files across {len(dir_paths)} directories.")
+    prefix = get_filenames_prefix(
+        network=network,
+        product=product,
+        radar=radar,
+        start_time=start_time,
+        end_time=end_time,
+    )
 
-    # Flat the list of filepaths and return it
-    return sorted(flatten_list(list_fpaths))
+    # Yield the files of each directory as soon as it is listed
+    for files in _iter_directories_files(
+        fs=fs,
+        protocol=protocol,
+        dir_paths=dir_paths,
+        dir_end_times=dir_end_times,
+        prefix=prefix,
+        max_concurrency=max_concurrency,
+        detail=detail,
+    ):
+        yield from _iter_selected_files(files, bucket_prefix=bucket_prefix, **kwargs)
@@ -0,0 +1,263 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Define streaming routines to process radar files without archiving them."""
+
+import contextlib
+import os
+import tempfile
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from radar_api.checks import check_network, check_product, check_protocol
+from radar_api.io import get_filesystem
+from radar_api.readers import READERS, ReaderPool, check_reader
+from radar_api.search import iter_files
+
+
+def _check_max_prefetch(max_prefetch):
+    if not isinstance(max_prefetch, int) or max_prefetch < 1:
+        raise ValueError("`max_prefetch` must be a positive integer.")
+    return max_prefetch
+
+
+def _load(obj):
+    """Load the data of lazily opened objects into memory."""
+    if hasattr(obj, "load"):
+        obj.load()
+    return obj
+
+
+def _get_file_fetcher(fs, protocol, in_memory, tmp_dir):
+    """Return a function returning the local path or the in-memory content of a file."""
+
+    def _fetch_file(filepath):
+        # Local files are opened in place
+        if protocol == "file":
+            return filepath
+        # Read the file content without writing it to disk
+        if in_memory:
+            return fs.cat_file(filepath)
+        # Otherwise download the file into a temporary file
+        # - Remote files of different directories can have the same name
+        local_filepath = os.path.join(tmp_dir, f"{uuid.uuid4().hex}_{os.path.basename(filepath)}")
+        fs.get_file(filepath, local_filepath)
+        return local_filepath
+
+    return _fetch_file
+
+
+def _get_file_opener(open_func, fetch_file, use_disk, **kwargs):
+    """Return a function fetching and opening a file."""
+
+    def _open_file(filepath):
+        file = fetch_file(filepath)
+        if not use_disk:
+            return open_func(file, **kwargs)
+        # Load the data of the temporary file and delete it
+        try:
+            return _load(open_func(file, **kwargs))
+        finally:
+            os.remove(file)
+
+    return _open_file
+
+
+def _iter_pool_results(pool, files, use_disk):
+    """Yield the objects decoded by a ReaderPool in order, deleting the temporary files once decoded."""
+    for file, obj in pool.imap(files, ordered=True):
+        if use_disk:
+            os.remove(file)
+        yield obj
+
+
+def _print_filepaths(filepaths):
+    for filepath in filepaths:
+        print(f"Processing {filepath}")
+        yield filepath
+
+
+def _iter_ordered_results(func, iterable, max_prefetch, n_workers):
+    """Yield func(item) for each item in order, computing at most ``max_prefetch`` results ahead.
+
+    A new item is submitted only when a result is consumed, so that a slow consumer
+    stops the pipeline instead of accumulating results in memory.
+    """
+    executor = ThreadPoolExecutor(max_workers=n_workers)
+    futures = deque()
+    try:
+        for item in iterable:
+            futures.append(executor.submit(func, item))
+            if len(futures) >= max_prefetch:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def stream_datasets(
+    network,
+    radar,
+    start_time,
+    end_time,
+    reader="xradar",
+    *,
+    product=None,
+    base_dir=None,
+    protocol="s3",
+    fs_args={},
+    in_memory=True,
+    max_prefetch=4,
+    n_workers=None,
+    n_processes=None,
+    max_concurrency=20,
+    verbose=False,
+    **kwargs,
+):
+    """
+    Stream the radar files of a time period as opened objects.
+
+    The files are searched, fetched and decoded on the fly: the list of files is
+    never fully materialized and the files are not archived on disk.
+    The decoded objects are yielded in time order.
+
+    By default, the files are fetched and decoded by a pool of threads. Since decoding
+    radar files is CPU bound and holds the GIL, the threads mostly overlap the network
+    fetches. Specify ``n_processes`` to decode the files in parallel with a
+    ``radar_api.readers.ReaderPool`` of worker processes, while the threads only fetch them.
+
+    Parameters
+    ----------
+    network : str
+        The name of the radar network.
+        See `radar_api.available_network()` for available radar networks.
+    radar : str
+        The name of the radar.
+        Use `radar_api.available_radars()` to retrieve the available satellites.
+    start_time : datetime.datetime
+        The start (inclusive) time of the interval period for retrieving the files.
+    end_time : datetime.datetime
+        The end (exclusive) time of the interval period for retrieving the files.
+    reader : str, optional
+        Either ``"xradar"`` to yield ``xarray.DataTree`` objects with ``radar_api.open_datatree``
+        or ``"pyart"`` to yield ``pyart.Radar`` objects with ``radar_api.open_pyart``.
+        The default is ``"xradar"``.
+    product : str, optional
+        The product acronym. Must be specified for networks with multiple products.
+    base_dir : str, optional
+        The base directory where to search the files if protocol='file'.
+        If None, the ``base_dir`` specified in the RADAR-API configuration file is used.
+    protocol : str, optional
+        The protocol of the storage where the files are searched.
+        Either "s3", "gcs", "file" or "local". The default is "s3".
+    fs_args : dict, optional
+        Dictionary specifying optional settings to initiate the fsspec.filesystem.
+    in_memory : bool, optional
+        If True (the default), the content of the remote files is decoded from memory.
+        If False, each remote file is downloaded into a temporary directory, its data
+        are loaded into memory and the file is deleted.
+        Local files are always opened in place.
+    max_prefetch : int, optional
+        Maximum number of files fetched and decoded ahead of the object being consumed.
+        It bounds the memory usage of the pipeline. The default is 4.
+    n_workers : int, optional
+        Number of threads fetching the files (and decoding them if ``n_processes`` is None).
+        If None (the default), it is set to ``max_prefetch``.
+    n_processes : int, optional
+        Number of worker processes decoding the files.
+        The decoded objects are fully loaded in memory and sent back to the main process.
+        If None (the default), the files are decoded by the threads.
+    max_concurrency : int, optional
+        Maximum number of directories listed concurrently ahead of the files being processed.
+        The default is 20.
+    verbose : bool, optional
+        If True, it prints the files being processed. The default is False.
+    **kwargs
+        Additional arguments passed to the reader.
+
+    Yields
+    ------
+    xarray.DataTree or pyart.Radar
+        The opened radar file, sorted by file start time.
+    """
+    # Check inputs
+    reader = check_reader(reader)
+    network = check_network(network)
+    product = check_product(network=network, product=product)
+    protocol = check_protocol(protocol)
+    max_prefetch = _check_max_prefetch(max_prefetch)
+    n_workers = max_prefetch if n_workers is None else min(n_workers, max_prefetch)
+
+    # Lazily search the files in time order
+    filepaths = iter_files(
+        radar=radar,
+        network=network,
+        start_time=start_time,
+        end_time=end_time,
+        base_dir=base_dir,
+        protocol=protocol,
+        product=product,
+        fs_args=fs_args,
+        max_concurrency=max_concurrency,
+    )
+    if verbose:
+        filepaths = _print_filepaths(filepaths)
+
+    # Fetch and decode the files with bounded prefetch
+    fs = None if protocol == "file" else get_filesystem(protocol=protocol, fs_args=fs_args)
+    use_disk = protocol != "file" and not in_memory
+    tmp_dir_context = tempfile.TemporaryDirectory(prefix="radar_api_") if use_disk else contextlib.nullcontext()
+    with tmp_dir_context as tmp_dir:
+        fetch_file = _get_file_fetcher(fs=fs, protocol=protocol, in_memory=in_memory, tmp_dir=tmp_dir)
+        try:
+            # Fetch and decode the files with threads
+            if n_processes is None:
+                open_file = _get_file_opener(
+                    READERS[reader],
+                    fetch_file=fetch_file,
+                    use_disk=use_disk,
+                    network=network,
+                    product=product,
+                    **kwargs,
+                )
+                yield from _iter_ordered_results(open_file, filepaths, max_prefetch=max_prefetch, n_workers=n_workers)
+            # Fetch the files with threads and decode them with worker processes
+            else:
+                pool = ReaderPool(
+                    network=network,
+                    product=product,
+                    reader=reader,
+                    n_workers=n_processes,
+                    max_pending=max_prefetch,
+                    **kwargs,
+                )
+                files = _iter_ordered_results(fetch_file, filepaths, max_prefetch=max_prefetch, n_workers=n_workers)
+                with pool, contextlib.closing(files):
+                    yield from _iter_pool_results(pool, files, use_disk=use_disk)
+        finally:
+            filepaths.close()
@@ -25,3 +25,13 @@
 
 # -----------------------------------------------------------------------------.
 """This module defines pytest fixtures available across all test modules."""
+import pytest
+
+import radar_api
+
+
+@pytest.fixture(autouse=True)
+def _disable_listing_cache():
+    """Disable the on-disk listing cache of the cloud bucket directories during the tests."""
+    with radar_api.config.set({"listing_cache.enabled": False}):
+        yield
@@ -0,0 +1,223 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Test the FileCatalog."""
+
+import datetime
+import os
+
+import fsspec
+import numpy as np
+import pandas as pd
+import pytest
+
+from radar_api import FileCatalog, download_files, find_files, group_filepaths
+
+
+def _get_filepaths(radar="KABR", start_time="2023-01-01 00:00:00", end_time="2023-01-02 00:00:00", freq="5min"):
+    """Return fake NEXRAD filepaths."""
+    times = pd.date_range(start_time, end_time, freq=freq, inclusive="left")
+    return [f"s3://unidata-nexrad-level2/{radar}{time.strftime('%Y%m%d_%H%M%S')}_V06" for time in times]
+
+
+@pytest.fixture
+def catalog():
+    """Return a catalog of two radars."""
+    filepaths = _get_filepaths(radar="KFSD") + _get_filepaths(radar="KABR")
+    return FileCatalog.from_filepaths(filepaths, network="NEXRAD", sizes=range(len(filepaths)))
+
+
+class TestFileCatalog:
+    """Test FileCatalog."""
+
+    def test_from_filepaths(self, catalog):
+        """Test the catalog is sorted by start time."""
+        assert len(catalog) == 576
+        assert catalog.network == "NEXRAD"
+        assert catalog.product == "NEXRAD_L2"
+        assert catalog.radars == ["KABR", "KFSD"]
+        assert np.all(np.diff(catalog.start_times) >= np.timedelta64(0))
+        assert catalog.start_times.dtype == np.dtype("datetime64[us]")
+        # Files without end time have the default file duration
+        assert np.all(catalog.end_times - catalog.start_times == np.timedelta64(7, "m"))
+        assert catalog[0] == "s3://unidata-nexrad-level2/KABR20230101_000000_V06"
+        assert catalog.sizes[0] == 288
+        assert "s3://unidata-nexrad-level2/KFSD20230101_000500_V06" in catalog
+        assert "576 files" in repr(catalog)
+
+    def test_from_filepaths_invalid(self):
+        """Test invalid filenames raise an error unless ignored."""
+        filepaths = [*_get_filepaths(end_time="2023-01-01 00:10:00"), "dummy.txt"]
+        with pytest.raises(ValueError):
+            FileCatalog.from_filepaths(filepaths, network="NEXRAD")
+        catalog = FileCatalog.from_filepaths(filepaths, network="NEXRAD", ignore_errors=True)
+        assert len(catalog) == 2
+        assert catalog.sizes == [None, None]
+
+    def test_sel_time(self, catalog):
+        """Test the time period selection matches the brute force selection."""
+        start_time = datetime.datetime(2023, 1, 1, 10, 2)
+        end_time = datetime.datetime(2023, 1, 1, 11, 0)
+        sub_catalog = catalog.sel_time(start_time, end_time)
+        expected = [
+            fpath
+            for fpath, s, e in zip(catalog.filepaths, catalog.start_times, catalog.end_times, strict=True)
+            if s < np.datetime64(end_time) and e > np.datetime64(start_time)
+        ]
+        assert sub_catalog.filepaths == expected
+        assert sub_catalog[0] == "s3://unidata-nexrad-level2/KABR20230101_100000_V06"
+        assert len(sub_catalog) == 2 * 12
+        # Empty selections
+        assert len(catalog.sel_time("2022-01-01", "2022-01-02")) == 0
+        assert len(catalog.sel_time("2022-01-01", "2022-01-02").sel_time("2022-01-01", "2022-01-02")) == 0
+        with pytest.raises(ValueError):
+            catalog.sel_time(end_time, start_time)
+
+    def test_sel(self, catalog):
+        """Test the selection by file information values."""
+        sub_catalog = catalog.sel(radar="KABR")
+        assert sub_catalog.radars == ["KABR"]
+        assert len(sub_catalog) == 288
+        assert len(catalog.sel(radar=["KABR", "KFSD"])) == 576
+        assert len(catalog.sel(radar_acronym="KFSD")) == 288
+        assert len(catalog.sel(radar="KABR").sel_time("2023-01-01 00:00:00", "2023-01-01 01:00:00")) == 12
+        with pytest.raises(ValueError):
+            catalog.sel(dummy="KABR")
+
+    def test_isel(self, catalog):
+        """Test the positional selection."""
+        assert catalog[:10] == catalog.isel(slice(0, 10))
+        assert len(catalog[:10]) == 10
+        assert list(catalog[:2]) == catalog.filepaths[:2]
+        assert catalog != catalog[:10]
+
+        # Check the sub-catalog keeps the time order and the end times of the parent catalog
+        sub_catalog = catalog.isel([5, 1, 3])
+        assert sub_catalog.filepaths == [catalog[1], catalog[3], catalog[5]]
+        np.testing.assert_array_equal(sub_catalog.end_times, catalog.end_times[[1, 3, 5]])
+        assert len(catalog.isel(np.arange(len(catalog)) % 2 == 0)) == 288
+        assert len(catalog.isel(3)) == 1
+
+    def test_from_filepaths_radar(self):
+        """Test the radar name is inferred from the directory paths."""
+        filepaths = [
+            "/data/MCH/2023/23001/MLA23001.zip/PHA2300100000U.001",
+            "/data/MCH/2023/23001/MLD23001.zip/PHD2300100000U.001",
+        ]
+        catalog = FileCatalog.from_filepaths(filepaths, network="MCH_CSCS")
+        assert catalog.radars == ["A", "D"]
+        assert catalog.sel(radar="A").filepaths == filepaths[:1]
+        filepaths = ["s3://unidata-nexrad-level2/2023/01/01/KFSD/KABR20230101_000000_V06"]
+        assert FileCatalog.from_filepaths(filepaths, network="NEXRAD").radars == ["KFSD"]
+
+    def test_group_filepaths(self, catalog):
+        """Test group_filepaths returns catalogs when a catalog is provided."""
+        dict_catalogs = group_filepaths(catalog, network="NEXRAD", groups=["radar_acronym", "hour"])
+        assert len(dict_catalogs) == 48
+        assert all(isinstance(sub_catalog, FileCatalog) for sub_catalog in dict_catalogs.values())
+        assert (
+            dict_catalogs["KABR/0"].filepaths
+            == group_filepaths(
+                catalog.filepaths,
+                network="NEXRAD",
+                groups=["radar_acronym", "hour"],
+            )["KABR/0"]
+        )
+
+
+def test_find_files_return_catalog(tmp_path):
+    """Test find_files returns a catalog of the local files."""
+    base_dir = str(tmp_path / "RADAR")
+    dir_path = os.path.join(base_dir, "NEXRAD", "2023", "01", "01", "00", "KABR")
+    os.makedirs(dir_path)
+    for filename in ["KABR20230101_000000_V06", "KABR20230101_001000_V06"]:
+        with open(os.path.join(dir_path, filename), "wb") as f:
+            f.write(b"00")
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01 00:00:00",
+        "end_time": "2023-01-01 01:00:00",
+        "base_dir": base_dir,
+        "protocol": "file",
+    }
+    catalog = find_files(**kwargs, return_catalog=True)
+    assert isinstance(catalog, FileCatalog)
+    assert catalog.filepaths == find_files(**kwargs)
+    assert catalog.sizes == [2, 2]
+
+
+def test_download_files_catalog(tmp_path, mocker):
+    """Test download_files selects the files to download from the catalog."""
+    bucket_dir = os.path.join(tmp_path, "bucket")
+    os.makedirs(bucket_dir)
+    bucket_fpaths = []
+    for time in pd.date_range("2023-01-01 00:00:00", "2023-01-03 00:00:00", freq="6h", inclusive="left"):
+        bucket_fpath = os.path.join(bucket_dir, f"KABR{time.strftime('%Y%m%d_%H%M%S')}_V06")
+        with open(bucket_fpath, "wb") as f:
+            f.write(b"0")
+        bucket_fpaths.append(bucket_fpath)
+    catalog = FileCatalog.from_filepaths(bucket_fpaths, network="NEXRAD", sizes=[1] * len(bucket_fpaths))
+
+    mock_find_files = mocker.patch("radar_api.download.find_files")
+    mocker.patch("radar_api.download.get_filesystem", return_value=fsspec.filesystem("file"))
+    base_dir = os.path.join(tmp_path, "RADAR")
+    os.makedirs(base_dir)
+    filepaths = download_files(
+        network="NEXRAD",
+        radar="KABR",
+        start_time="2023-01-01 05:00:00",
+        end_time="2023-01-02 13:00:00",
+        base_dir=base_dir,
+        catalog=catalog,
+        verbose=False,
+        progress_bar=False,
+    )
+    assert mock_find_files.call_count == 0
+    assert len(filepaths) == 6
+    assert all(os.path.isfile(fpath) for fpath in filepaths)
+
+    # The catalog must refer to the network product to download
+    with pytest.raises(TypeError):
+        download_files(
+            network="NEXRAD",
+            radar="KABR",
+            start_time="2023-01-01",
+            end_time="2023-01-02",
+            base_dir=base_dir,
+            catalog=bucket_fpaths,
+        )
+    catalog = FileCatalog.from_filepaths(bucket_fpaths, network="NEXRAD")
+    catalog.product = "DUMMY"
+    with pytest.raises(ValueError):
+        download_files(
+            network="NEXRAD",
+            radar="KABR",
+            start_time="2023-01-01",
+            end_time="2023-01-02",
+            base_dir=base_dir,
+            catalog=catalog,
+        )
@@ -38,10 +38,12 @@ from radar_api.checks import (
     check_base_dir,
     check_date,
     check_download_protocol,
+    check_encoding,
     check_network,
     check_product,
     check_protocol,
     check_radar,
+    check_radars,
     check_start_end_time,
     check_time,
     get_current_utc_time,
@@ -155,6 +157,21 @@ def test_check_radar() -> None:
         check_radar("DUMMY", network="NEXRAD")
 
 
+def test_check_radars() -> None:
+    """Test check_radars()."""
+    assert check_radars("KLIX", network="NEXRAD") == ["KLIX"]
+    assert check_radars(["KLIX", "KABR", "KLIX"], network="NEXRAD") == ["KLIX", "KABR"]
+    # Test (network, radar) tuples of available_radars_within_extent
+    radars = [("NEXRAD", "KLIX"), ("FMI", "fikor"), ("NEXRAD", "KABR", 1000.0)]
+    assert check_radars(radars, network="NEXRAD") == ["KLIX", "KABR"]
+    with pytest.raises(TypeError):
+        check_radars(None, network="NEXRAD")
+    with pytest.raises(ValueError):
+        check_radars(["DUMMY"], network="NEXRAD")
+    with pytest.raises(ValueError):
+        check_radars([("NEXRAD",)], network="NEXRAD")
+
+
 def test_check_product() -> None:
     """Test check_product()."""
     # Check if for a network only one product available, return that
@@ -347,3 +364,12 @@ def test_check_start_end_time() -> None:
         datetime.datetime(2014, 12, 31, 12, 30, 30, 300),
         get_current_utc_time(),
     )
+
+
+def test_check_encoding():
+    """Test check_encoding."""
+    assert check_encoding(None) is None
+    assert check_encoding("float32") == "float32"
+    assert check_encoding("packed") == "packed"
+    with pytest.raises(ValueError):
+        check_encoding("float64")
@@ -0,0 +1,75 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module test the radar database snapshot."""
+
+import os
+
+import pandas as pd
+import pytest
+
+import radar_api.database
+from radar_api.database import (
+    build_database_snapshot,
+    get_database_digest,
+    get_database_snapshot_filepath,
+    load_database_snapshot,
+    read_database_from_yaml,
+)
+
+
+def test_shipped_database_snapshot_is_up_to_date():
+    """Test the database snapshot shipped with RADAR-API is consistent with the radar configuration files.
+
+    If this test fails, rebuild the snapshot with ``radar_api.database.build_database_snapshot()``.
+    """
+    assert os.path.isfile(get_database_snapshot_filepath())
+    assert load_database_snapshot() is not None
+
+
+@pytest.mark.parametrize("network", [None, "NEXRAD", "FMI", "MCH_LTE"])
+def test_load_database_snapshot(tmp_path, network):
+    """Test load_database_snapshot returns the same content of the radar configuration files."""
+    filepath = build_database_snapshot(filepath=str(tmp_path / "database.npz"))
+    db = load_database_snapshot(network=network, filepath=filepath)
+    expected_db = read_database_from_yaml(network=network)
+    assert isinstance(db, pd.DataFrame)
+    assert set(db.columns) == set(expected_db.columns)
+    pd.testing.assert_frame_equal(db, expected_db[list(db.columns)])
+
+
+def test_load_database_snapshot_missing_file(tmp_path):
+    """Test load_database_snapshot returns None if the snapshot does not exist."""
+    assert load_database_snapshot(filepath=str(tmp_path / "database.npz")) is None
+
+
+def test_load_database_snapshot_out_of_date(tmp_path, monkeypatch):
+    """Test load_database_snapshot returns None if the radar configuration files changed."""
+    filepath = build_database_snapshot(filepath=str(tmp_path / "database.npz"))
+    assert isinstance(get_database_digest(), str)
+    monkeypatch.setattr(radar_api.database, "get_database_digest", lambda: "modified")
+    assert load_database_snapshot(filepath=filepath) is None
+    assert load_database_snapshot(filepath=filepath, check_digest=False) is not None
@@ -25,16 +25,30 @@
 
 # -----------------------------------------------------------------------------.
 """This module test the files download routines."""
+
 import datetime
+import hashlib
 import os
 
+import fsspec
+import pandas as pd
+import pytest
+from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
+
+import radar_api.download
 from radar_api.download import (
+    _REPORT_COLUMNS,
     define_local_filepath,
     download_files,
+    download_files_multi,
     get_end_of_day,
+    get_files_info,
     get_list_daily_time_blocks,
     get_start_of_day,
+    remove_corrupted_files,
 )
+from radar_api.inventory import reindex
+from radar_api.search import find_files
 
 
 class TestDayBoundaries:
@@ -135,6 +149,316 @@ def test_define_local_filepath(tmp_path):
     assert res == os.path.join(base_dir, network, "1991", "06", "05", "16", radar, filename)
 
 
+def _create_mock_bucket(bucket_dir, start_time, end_time, freq="2h"):
+    """Create fake NEXRAD files in a local directory mimicking a cloud bucket."""
+    os.makedirs(bucket_dir, exist_ok=True)
+    bucket_fpaths = []
+    for i, time in enumerate(pd.date_range(start_time, end_time, freq=freq, inclusive="left")):
+        bucket_fpath = os.path.join(bucket_dir, f"KABR{time.strftime('%Y%m%d_%H%M%S')}_V06")
+        with open(bucket_fpath, "wb") as f:
+            f.write(b"0" * (i + 1))
+        bucket_fpaths.append(bucket_fpath)
+    return bucket_fpaths
+
+
+@pytest.mark.parametrize("backend", ["threads", "async"])
+def test_download_files_pipeline(tmp_path, mocker, backend):
+    """Test download_files searches and downloads files of multiple days."""
+    bucket_fpaths = _create_mock_bucket(
+        bucket_dir=os.path.join(tmp_path, "bucket"),
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-04 00:00:00",
+    )
+
+    def find_files(start_time, end_time, detail=False, **kwargs):
+        times = pd.to_datetime([os.path.basename(fpath)[4:19] for fpath in bucket_fpaths], format="%Y%m%d_%H%M%S")
+        fpaths = [fpath for fpath, time in zip(bucket_fpaths, times, strict=True) if start_time <= time < end_time]
+        if detail:
+            return {fpath: os.path.getsize(fpath) for fpath in fpaths}
+        return fpaths
+
+    fs = fsspec.filesystem("file")
+    if backend == "async":
+        fs = AsyncFileSystemWrapper(fs)
+    mocker.patch("radar_api.download.find_files", side_effect=find_files)
+    mocker.patch("radar_api.download.get_filesystem", return_value=fs)
+
+    base_dir = os.path.join(tmp_path, "RADAR")
+    os.makedirs(base_dir)
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01 01:00:00",
+        "end_time": "2023-01-03 23:00:00",
+        "base_dir": base_dir,
+        "n_threads": 3,
+        "max_concurrency": 2,
+        "backend": backend,
+        "verbose": False,
+        "progress_bar": False,
+    }
+    filepaths = download_files(**kwargs)
+    assert len(filepaths) == 35
+    assert filepaths == sorted(filepaths)
+    assert all(os.path.isfile(fpath) for fpath in filepaths)
+    assert filepaths[0] == os.path.join(base_dir, "NEXRAD", "2023", "01", "01", "02", "KABR", "KABR20230101_020000_V06")
+
+    # Existing files are not downloaded again
+    os.remove(filepaths[0])
+    spy = mocker.spy(fs, "_get_file" if backend == "async" else "get_file")
+    assert download_files(**kwargs) == filepaths
+    assert spy.call_count == 1
+
+
+def test_download_files_pipeline_overlapping_blocks(tmp_path, mocker):
+    """Test files returned by the searches of multiple time blocks are downloaded once."""
+    bucket_fpaths = _create_mock_bucket(
+        bucket_dir=os.path.join(tmp_path, "bucket"),
+        start_time="2023-01-01 20:00:00",
+        end_time="2023-01-02 04:00:00",
+    )
+    # The mocked search returns the files overlapping both daily time blocks
+    mocker.patch("radar_api.download.find_files", return_value=dict.fromkeys(bucket_fpaths))
+    mocker.patch("radar_api.download.get_filesystem", return_value=fsspec.filesystem("file"))
+    spy = mocker.spy(radar_api.download, "transfer_file")
+    base_dir = os.path.join(tmp_path, "RADAR")
+    os.makedirs(base_dir)
+    summaries = radar_api.download._download_pipeline(
+        network="NEXRAD",
+        radars=["KABR"],
+        product="NEXRAD_L2",
+        time_blocks=get_list_daily_time_blocks(
+            datetime.datetime(2023, 1, 1, 0),
+            datetime.datetime(2023, 1, 2, 4),
+        ),
+        fs=fsspec.filesystem("file"),
+        base_dir=base_dir,
+        progress_bar=False,
+        verbose=False,
+    )
+    summary = summaries["KABR"]
+    assert spy.call_count == len(bucket_fpaths)
+    assert sorted(summary["bucket_fpaths"]) == bucket_fpaths
+    assert len(summary["local_fpaths"]) == len(bucket_fpaths)
+    assert summary["n_total_files"] == summary["n_downloaded_files"] == len(bucket_fpaths)
+
+
+def test_download_files_multi(tmp_path, mocker):
+    """Test download_files_multi downloads the files of each radar with a shared downloader."""
+    bucket_fpaths = []
+    for radar in ["KABR", "KFSD"]:
+        for time in pd.date_range("2023-01-01 00:00:00", "2023-01-03 00:00:00", freq="6h", inclusive="left"):
+            bucket_fpath = os.path.join(tmp_path, "bucket", f"{radar}{time.strftime('%Y%m%d_%H%M%S')}_V06")
+            os.makedirs(os.path.dirname(bucket_fpath), exist_ok=True)
+            with open(bucket_fpath, "wb") as f:
+                f.write(b"0")
+            bucket_fpaths.append(bucket_fpath)
+
+    def find_files(radar, start_time, end_time, **kwargs):
+        times = pd.to_datetime([os.path.basename(fpath)[4:19] for fpath in bucket_fpaths], format="%Y%m%d_%H%M%S")
+        return {
+            fpath: 1
+            for fpath, time in zip(bucket_fpaths, times, strict=True)
+            if os.path.basename(fpath).startswith(radar) and start_time <= time < end_time
+        }
+
+    mocker.patch("radar_api.download.find_files", side_effect=find_files)
+    mocker.patch("radar_api.download.get_filesystem", return_value=fsspec.filesystem("file"))
+    spy = mocker.spy(radar_api.download, "_get_downloader")
+    base_dir = os.path.join(tmp_path, "RADAR")
+    os.makedirs(base_dir)
+    dict_filepaths, report = download_files_multi(
+        network="NEXRAD",
+        radars=[("NEXRAD", "KABR"), ("NEXRAD", "KFSD")],
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-03 00:00:00",
+        base_dir=base_dir,
+        verbose=False,
+        progress_bar=False,
+        return_report=True,
+    )
+    assert spy.call_count == 1
+    assert list(dict_filepaths) == ["KABR", "KFSD"]
+    for radar, filepaths in dict_filepaths.items():
+        assert len(filepaths) == 8
+        assert all(os.path.basename(fpath).startswith(radar) for fpath in filepaths)
+        assert all(os.path.isfile(fpath) for fpath in filepaths)
+    assert len(report) == 0
+    assert list(report.columns) == ["radar", *_REPORT_COLUMNS]
+
+
+class TestRemoveCorruptedFiles:
+    """Test remove_corrupted_files."""
+
+    def _create_files(self, tmp_path):
+        bucket_fpaths = _create_mock_bucket(
+            bucket_dir=os.path.join(tmp_path, "bucket"),
+            start_time="2023-01-01 00:00:00",
+            end_time="2023-01-01 08:00:00",
+        )
+        local_dir = os.path.join(tmp_path, "local")
+        os.makedirs(local_dir)
+        local_fpaths = [os.path.join(local_dir, os.path.basename(fpath)) for fpath in bucket_fpaths]
+        for bucket_fpath, local_fpath in zip(bucket_fpaths[:-1], local_fpaths[:-1], strict=True):
+            with open(bucket_fpath, "rb") as f_src, open(local_fpath, "wb") as f_dst:
+                f_dst.write(f_src.read())
+        # Truncate a local file
+        with open(local_fpaths[0], "wb") as f:
+            f.write(b"")
+        return local_fpaths, bucket_fpaths
+
+    @pytest.mark.parametrize("use_bucket_sizes", [True, False])
+    def test_size_check(self, tmp_path, use_bucket_sizes, mocker):
+        """Test corrupted files are removed by comparing file sizes."""
+        local_fpaths, bucket_fpaths = self._create_files(tmp_path)
+        fs = fsspec.filesystem("file")
+        spy = mocker.spy(fs, "info")
+        bucket_sizes = [os.path.getsize(fpath) for fpath in bucket_fpaths] if use_bucket_sizes else None
+        corrupted = remove_corrupted_files(local_fpaths, bucket_fpaths, fs=fs, bucket_sizes=bucket_sizes)
+        assert corrupted == ([local_fpaths[0]], [bucket_fpaths[0]])
+        assert not os.path.exists(local_fpaths[0])
+        assert spy.call_count == (0 if use_bucket_sizes else 3)
+
+        valid = remove_corrupted_files(local_fpaths, bucket_fpaths, fs=fs, return_corrupted_fpaths=False)
+        assert valid == (local_fpaths[1:-1], bucket_fpaths[1:-1])
+
+    def test_duplicated_files(self, tmp_path):
+        """Test corrupted files listed multiple times are removed once."""
+        local_fpaths, bucket_fpaths = self._create_files(tmp_path)
+        local_fpaths = [local_fpaths[0], *local_fpaths]
+        bucket_fpaths = [bucket_fpaths[0], *bucket_fpaths]
+        fs = fsspec.filesystem("file")
+        corrupted = remove_corrupted_files(local_fpaths, bucket_fpaths, fs=fs)
+        assert corrupted == (local_fpaths[:2], bucket_fpaths[:2])
+        assert not os.path.exists(local_fpaths[0])
+
+    def test_checksum(self, tmp_path, mocker):
+        """Test corrupted files are identified by comparing MD5 checksum with the ETag."""
+        local_fpaths, bucket_fpaths = self._create_files(tmp_path)
+        # Corrupt a local file without changing its size
+        with open(local_fpaths[1], "wb") as f:
+            f.write(b"1" * os.path.getsize(bucket_fpaths[1]))
+
+        fs = fsspec.filesystem("file")
+        info = fs.info
+
+        def info_with_etag(fpath, **kwargs):
+            with open(fpath, "rb") as f:
+                etag = hashlib.md5(f.read()).hexdigest()
+            return {**info(fpath, **kwargs), "ETag": f'"{etag}"'}
+
+        mocker.patch.object(fs, "info", side_effect=info_with_etag)
+        corrupted_local_fpaths, _ = remove_corrupted_files(local_fpaths, bucket_fpaths, fs=fs)
+        assert corrupted_local_fpaths == [local_fpaths[0]]
+        corrupted_local_fpaths, _ = remove_corrupted_files(local_fpaths, bucket_fpaths, fs=fs, verify_checksum=True)
+        assert corrupted_local_fpaths == [local_fpaths[1]]
+
+
+def test_get_files_info(tmp_path):
+    """Test get_files_info returns the metadata of files in input order."""
+    bucket_fpaths = _create_mock_bucket(
+        bucket_dir=os.path.join(tmp_path, "bucket"),
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-01 08:00:00",
+    )
+    fpaths = [*bucket_fpaths, os.path.join(tmp_path, "missing")]
+    for fs in [fsspec.filesystem("file"), AsyncFileSystemWrapper(fsspec.filesystem("file"))]:
+        infos = get_files_info(fs=fs, fpaths=fpaths, max_concurrency=3)
+        assert [info["size"] for info in infos[:-1]] == [1, 2, 3, 4]
+        assert infos[-1] is None
+
+
+def test_download_files_update_inventory(tmp_path, mocker):
+    """Test download_files updates the local inventory."""
+    bucket_fpaths = _create_mock_bucket(
+        bucket_dir=os.path.join(tmp_path, "bucket"),
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-01 06:00:00",
+    )
+    mocker.patch("radar_api.download.find_files", return_value=dict.fromkeys(bucket_fpaths))
+    mocker.patch("radar_api.download.get_filesystem", return_value=fsspec.filesystem("file"))
+    base_dir = str(tmp_path / "RADAR")
+    os.makedirs(base_dir)
+    reindex(network="NEXRAD", base_dir=base_dir)
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01 00:00:00",
+        "end_time": "2023-01-01 06:00:00",
+        "base_dir": base_dir,
+    }
+    filepaths = download_files(**kwargs, verbose=False, progress_bar=False)
+    assert len(filepaths) == 3
+    mocker.patch("radar_api.search.list_directories", side_effect=AssertionError("The inventory is not used."))
+    assert find_files(**kwargs, protocol="local") == filepaths
+
+
+def test_download_files_report(tmp_path, mocker):
+    """Test download_files reports the files which could not be downloaded."""
+    bucket_fpaths = _create_mock_bucket(
+        bucket_dir=os.path.join(tmp_path, "bucket"),
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-01 06:00:00",
+    )
+    missing_fpath = os.path.join(tmp_path, "bucket", "KABR20230101_050000_V06")
+    mocker.patch("radar_api.download.find_files", return_value=dict.fromkeys([*bucket_fpaths, missing_fpath]))
+    mocker.patch("radar_api.download.get_filesystem", return_value=fsspec.filesystem("file"))
+    filepaths, report = download_files(
+        network="NEXRAD",
+        radar="KABR",
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-01 06:00:00",
+        base_dir=tmp_path,
+        verbose=False,
+        progress_bar=False,
+        return_report=True,
+    )
+    assert len(filepaths) == 3
+    assert isinstance(report, pd.DataFrame)
+    assert report["bucket_fpath"].tolist() == [missing_fpath]
+    assert report["error_type"].tolist() == ["FileNotFoundError"]
+    assert report["n_attempts"].tolist() == [1]
+
+
+def test_download_files_positional_arguments(tmp_path, mocker):
+    """Test the positional arguments of download_files are backward compatible."""
+    bucket_fpaths = _create_mock_bucket(
+        bucket_dir=os.path.join(tmp_path, "bucket"),
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-01 06:00:00",
+    )
+    mocker.patch("radar_api.download.find_files", return_value=dict.fromkeys(bucket_fpaths))
+    mocker.patch("radar_api.download.get_filesystem", return_value=fsspec.filesystem("file"))
+    base_dir = str(tmp_path / "RADAR")
+    os.makedirs(base_dir)
+    start_time, end_time = "2023-01-01 00:00:00", "2023-01-01 06:00:00"
+    args = ["NEXRAD", "KABR", start_time, end_time, None, 2, False, True, False, False, base_dir]
+    filepaths = download_files(*args)
+    assert len(filepaths) == 3
+    assert all(fpath.startswith(base_dir) for fpath in filepaths)
+    with pytest.raises(TypeError):
+        download_files(*args, "s3", {}, 20)
+
+
+def test_download_files_invalid_backend(tmp_path, mocker):
+    """Test download_files raises an error for invalid or unsupported download backends."""
+    mocker.patch("radar_api.download.find_files", return_value=[])
+    mocker.patch("radar_api.download.get_filesystem", return_value=fsspec.filesystem("file"))
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01 01:00:00",
+        "end_time": "2023-01-01 02:00:00",
+        "base_dir": tmp_path,
+        "verbose": False,
+        "progress_bar": False,
+    }
+    with pytest.raises(ValueError, match="Invalid download backend"):
+        download_files(**kwargs, backend="invalid")
+    with pytest.raises(ValueError, match="requires an asynchronous filesystem"):
+        download_files(**kwargs, backend="async")
+
+
 def test_find_files_on_cloud_bucket(tmp_path):
     """Test the find_files function on the s3 cloud bucket."""
     base_dir = tmp_path
@@ -25,10 +25,12 @@
 
 # -----------------------------------------------------------------------------.
 """This module test the file filtering routines."""
+import pandas as pd
+
 from radar_api.filter import (
+    filter_file,
+    filter_files,
     is_file_within_time,
-    # filter_file,
-    # filter_files,
 )
 
 
@@ -74,3 +76,21 @@ def test_is_file_within_time() -> None:
             )
             is False
         )
+
+
+def test_filter_files() -> None:
+    """Test filter_files selects the files overlapping the time period."""
+    times = pd.date_range("2023-01-01 00:00:00", "2023-01-01 01:00:00", freq="5min", inclusive="left")
+    fpaths = [f"{time.strftime('%Y%m%d%H%M')}_fikor_PVOL.h5" for time in times]
+    # FMI files cover 5 minutes: the file starting at 00:05 ends at 00:10
+    expected = ["202301010010_fikor_PVOL.h5", "202301010015_fikor_PVOL.h5"]
+    kwargs = {"network": "FMI", "start_time": "2023-01-01 00:10:00", "end_time": "2023-01-01 00:20:00"}
+    assert filter_files([*fpaths, "dummy.txt"], **kwargs) == expected
+    # The vectorized selection matches the file by file selection
+    start_time, end_time = pd.Timestamp("2023-01-01 00:10:00"), pd.Timestamp("2023-01-01 00:20:00")
+    assert [
+        fpath for fpath in fpaths if filter_file(fpath, "FMI", "PVOL", start_time=start_time, end_time=end_time)
+    ] == expected
+    # No time period
+    assert filter_files(fpaths, network="FMI") == fpaths
+    assert filter_files([], **kwargs) == []
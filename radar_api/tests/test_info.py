@@ -26,14 +26,19 @@
 """This module test the info extraction from radar filename."""
 
 import datetime
+import os
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from radar_api.info import (
     FILE_KEYS,
     TIME_KEYS,
+    _get_time_component_values,
     check_groups,
     get_end_time_from_filepaths,
+    get_filename_parser,
     get_info_from_filename,
     get_info_from_filepath,
     get_key_from_filepath,
@@ -44,7 +49,9 @@ from radar_api.info import (
     get_time_component,
     get_version_from_filepaths,
     group_filepaths,
+    parse_filepaths,
 )
+from radar_api.utils.patterns import FilenameParser
 
 SAMPLE_FILES = {
     # <network> : {"product": <product>, "files": [<sample_filenames>]}
@@ -290,6 +297,18 @@ def test_get_versions_from_filepaths() -> None:
     ]  # input str output list
 
 
+def test_get_versions_from_filepaths_strings(mocker) -> None:
+    """Test that the version strings keep their leading zeros if integer=False."""
+    mocker.patch(
+        "radar_api.info.get_product_filename_patterns",
+        return_value=["{radar_acronym:4s}{start_time:%Y%m%d_%H%M%S}_V{version:2s}"],
+    )
+    filenames = ["KABR20100101_000618_V06", "KABR20100101_000618_V10"]
+    assert get_version_from_filepaths(filenames, network="NEXRAD", integer=False) == ["06", "10"]
+    assert get_version_from_filepaths(filenames, network="NEXRAD", integer=True) == [6, 10]
+    assert group_filepaths(filenames, network="NEXRAD", groups="version") == {"06": filenames[:1], "10": filenames[1:]}
+
+
 def test_check_groups():
     """Test check_groups function."""
     valid_groups = ["radar_acronym", "volume_identifier", "version", "extension"]
@@ -326,6 +345,11 @@ def test_get_season():
     assert get_season(datetime.datetime(2020, 7, 1)) == "JJA"
     assert get_season(datetime.datetime(2020, 10, 1)) == "SON"
 
+    # Check the vectorized season of the time components
+    times = pd.Series(pd.date_range("2020-01-01", "2020-12-01", freq="MS"))
+    seasons = [get_season(time) for time in times]
+    assert _get_time_component_values(times, component="season") == seasons
+
 
 @pytest.mark.parametrize("network", NETWORKS)
 def test_group_filepaths(network):
@@ -371,3 +395,61 @@ def test_group_filepaths_by_time():
     ) == {
         "KABR/2010/1": [dummy_filepath],
     }
+
+
+def test_get_filename_parser_is_cached():
+    """Test get_filename_parser compiles the filename patterns only once."""
+    parser = get_filename_parser(network="NEXRAD", product="NEXRAD_L2")
+    assert isinstance(parser, FilenameParser)
+    assert get_filename_parser(network="NEXRAD", product="NEXRAD_L2") is parser
+
+
+@pytest.mark.parametrize(
+    ("network", "product", "filename", "expected_info"),
+    _generate_test_params(SAMPLE_FILES_INFO_DICT),
+)
+def test_parse_filepaths(network, product, filename, expected_info):
+    """Test parse_filepaths is consistent with get_info_from_filename."""
+    df = parse_filepaths([os.path.join("dir", filename)], network=network, product=product)
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == ["filepath", *FILE_KEYS]
+    row = df.iloc[0]
+    assert row["start_time"] == expected_info["start_time"]
+    assert pd.isna(row["end_time"])
+    for key in ["radar_acronym", "volume_identifier", "sweep_identifier", "extension"]:
+        assert row[key] == expected_info[key]
+    if expected_info["version"] == "":
+        assert pd.isna(row["version"])
+    else:
+        assert row["version"] == int(expected_info["version"])
+
+
+def test_parse_filepaths_types_and_order():
+    """Test parse_filepaths returns typed columns in the input order."""
+    filepaths = ["KABR20100101_000618_V06", "s3://bucket/KFSX19960701_044028.gz", "KABR20100101_000618_V03.gz"]
+    df = parse_filepaths(filepaths, network="NEXRAD", product="NEXRAD_L2")
+    assert df["filepath"].tolist() == filepaths
+    assert np.issubdtype(df["start_time"].dtype, np.datetime64)
+    assert df["version"].tolist() == [6, pd.NA, 3]
+    df = parse_filepaths(filepaths, network="NEXRAD", product="NEXRAD_L2", integer_version=False)
+    assert df["version"].tolist() == ["6", "", "3"]
+    assert df["extension"].tolist() == ["", "gz", "gz"]
+
+    # Test a string input
+    assert len(parse_filepaths(filepaths[0], network="NEXRAD", product="NEXRAD_L2")) == 1
+
+    # Test empty input
+    df = parse_filepaths([], network="NEXRAD", product="NEXRAD_L2")
+    assert len(df) == 0
+    assert list(df.columns) == ["filepath", *FILE_KEYS]
+
+
+def test_parse_filepaths_invalid_filenames():
+    """Test parse_filepaths raises error or set missing values for invalid filenames."""
+    filepaths = ["KABR20100101_000618_V06", "invalid_filename", "KABR20101301_000618_V06"]
+    with pytest.raises(ValueError):
+        parse_filepaths(filepaths, network="NEXRAD", product="NEXRAD_L2")
+
+    df = parse_filepaths(filepaths, network="NEXRAD", product="NEXRAD_L2", ignore_errors=True)
+    assert df["start_time"].isna().tolist() == [False, True, True]
+    assert df["radar_acronym"].tolist() == ["KABR", "", ""]
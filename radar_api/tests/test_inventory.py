@@ -0,0 +1,180 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Test the local inventory of radar files."""
+import datetime
+import os
+
+import pandas as pd
+import pytest
+
+import radar_api
+from radar_api.inventory import LocalInventory, get_inventory_filepath, get_local_inventory, reindex
+
+
+def _create_local_files(base_dir, radar="KABR", start_time="2023-01-01 00:00:00", end_time="2023-01-02 00:00:00"):
+    """Create fake NEXRAD files in the local storage layout."""
+    filepaths = []
+    for time in pd.date_range(start_time, end_time, freq="5min", inclusive="left"):
+        dir_path = os.path.join(base_dir, "NEXRAD", time.strftime("%Y/%m/%d/%H"), radar)
+        os.makedirs(dir_path, exist_ok=True)
+        filepath = os.path.join(dir_path, f"{radar}{time.strftime('%Y%m%d_%H%M%S')}_V06")
+        with open(filepath, "wb") as f:
+            f.write(b"0")
+        filepaths.append(filepath)
+    return filepaths
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    """Return a local base directory with fake NEXRAD files."""
+    base_dir = str(tmp_path / "RADAR")
+    os.makedirs(base_dir)
+    _create_local_files(base_dir, radar="KABR")
+    _create_local_files(base_dir, radar="KFSD")
+    return base_dir
+
+
+def test_reindex(base_dir):
+    """Test reindex builds the inventory of local files."""
+    # Add files which must not be indexed
+    dir_path = os.path.join(base_dir, "NEXRAD", "2023", "01", "01", "00", "KABR")
+    for filename in [
+        "KABR20230101_000000_V06.part",
+        "KABR20230101_000000_V06.part.json",
+        "KABR20230101_000000_V06_MDM",
+        "invalid",
+    ]:
+        with open(os.path.join(dir_path, filename), "wb") as f:
+            f.write(b"0")
+
+    assert get_local_inventory(base_dir) is None
+    assert reindex(network="NEXRAD", base_dir=base_dir) == 2 * 288
+    inventory = get_local_inventory(base_dir)
+    assert isinstance(inventory, LocalInventory)
+    assert inventory.filepath == get_inventory_filepath(base_dir)
+    assert inventory.is_indexed(network="NEXRAD", product="NEXRAD_L2")
+    assert not inventory.is_indexed(network="FMI", product="PVOL")
+
+    with radar_api.config.set({"inventory.enabled": False}):
+        assert get_local_inventory(base_dir) is None
+
+
+def test_reindex_not_indexable_products(tmp_path):
+    """Test reindex does not index products whose local directories are not radar specific."""
+    base_dir = str(tmp_path / "RADAR")
+    os.makedirs(os.path.join(base_dir, "MCH", "2023", "01", "01", "00", "HZT"))
+    assert reindex(network="MCH_LTE", base_dir=base_dir) == 0
+    assert reindex(network="MCH_CSCS", base_dir=base_dir) == 0
+    inventory = get_local_inventory(base_dir)
+    assert inventory.is_indexed(network="MCH_LTE", product="POL")
+    assert not inventory.is_indexed(network="MCH_LTE", product="HZT")
+    assert not inventory.is_indexed(network="MCH_CSCS", product="POL")
+
+
+def test_find_files_with_inventory(base_dir, mocker):
+    """Test find_files searches local files with the inventory."""
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01 10:00:00",
+        "end_time": "2023-01-01 12:00:00",
+        "protocol": "local",
+        "base_dir": base_dir,
+    }
+    expected_filepaths = radar_api.find_files(**kwargs)
+    assert len(expected_filepaths) == 25
+
+    reindex(network="NEXRAD", base_dir=base_dir)
+    spy = mocker.spy(radar_api.search, "list_directories")
+    assert radar_api.find_files(**kwargs) == expected_filepaths
+    assert spy.call_count == 0
+    assert radar_api.find_files(**kwargs, detail=True) == dict.fromkeys(expected_filepaths, 1)
+
+    # Check deleted files are discarded
+    os.remove(expected_filepaths[-1])
+    assert radar_api.find_files(**kwargs) == expected_filepaths[:-1]
+
+
+def test_find_files_with_inventory_modified_directories(base_dir, mocker):
+    """Test find_files scans again the directories modified since the inventory was built."""
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01 23:00:00",
+        "end_time": "2023-01-02 01:00:00",
+        "protocol": "local",
+        "base_dir": base_dir,
+    }
+    # Set the modification time of the directories in the past
+    past_time = datetime.datetime.now().timestamp() - 3600
+    for dir_path, _, _ in os.walk(base_dir):
+        os.utime(dir_path, (past_time, past_time))
+    reindex(network="NEXRAD", base_dir=base_dir)
+    expected_filepaths = radar_api.find_files(**kwargs)
+    assert len(expected_filepaths) == 13
+
+    # Check unmodified directories are not scanned again
+    spy = mocker.spy(radar_api.inventory, "_list_local_files")
+    assert radar_api.find_files(**kwargs) == expected_filepaths
+    assert spy.call_count == 0
+
+    # Add files without updating the inventory (i.e. with rsync)
+    new_filepaths = [
+        os.path.join(base_dir, "NEXRAD", "2023", "01", "01", "23", "KABR", "KABR20230101_231200_V06"),
+        os.path.join(base_dir, "NEXRAD", "2023", "01", "02", "00", "KABR", "KABR20230102_000000_V06"),
+    ]
+    for filepath in new_filepaths:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, "wb") as f:
+            f.write(b"0")
+    assert radar_api.find_files(**kwargs) == sorted(expected_filepaths + new_filepaths)
+    assert spy.call_count == 2
+
+
+def test_inventory_update_files(tmp_path):
+    """Test files are added, updated and removed from the inventory."""
+    base_dir = str(tmp_path)
+    filepaths = _create_local_files(base_dir, end_time="2023-01-01 01:00:00")
+    inventory = LocalInventory(get_inventory_filepath(base_dir))
+    assert inventory.update_files(filepaths, network="NEXRAD", product="NEXRAD_L2", radar="KABR") == 12
+
+    start_time = datetime.datetime(2023, 1, 1, 0, 0, 0)
+    end_time = datetime.datetime(2023, 1, 1, 1, 0, 0)
+    kwargs = {"network": "NEXRAD", "product": "NEXRAD_L2", "start_time": start_time, "end_time": end_time}
+    assert inventory.query(radar="KABR", **kwargs) == filepaths
+    assert inventory.query(radar="KFSD", **kwargs) == []
+
+    # Check files overlapping the time period are selected
+    # - Files without end_time are assumed to last the NEXRAD file_time_coverage (7 minutes)
+    kwargs["start_time"] = datetime.datetime(2023, 1, 1, 0, 12, 0)
+    kwargs["end_time"] = datetime.datetime(2023, 1, 1, 0, 20, 0)
+    assert inventory.query(radar="KABR", **kwargs) == filepaths[2:4]
+
+    # Check missing files are removed
+    os.remove(filepaths[2])
+    inventory.update_files(filepaths[2:], network="NEXRAD", product="NEXRAD_L2", radar="KABR")
+    assert inventory.query(radar="KABR", **kwargs) == filepaths[3:4]
@@ -27,21 +27,29 @@
 """This module test the I/O routines."""
 import datetime
 import os
+import threading
 
 import fsspec
 import pytest
 import s3fs
+import yaml
 
+import radar_api
 from radar_api.io import (
+    ConfigRegistry,
+    FilesystemPool,
     available_networks,
     available_products,
     available_radars,
+    close_filesystems,
     get_bucket_prefix,
+    get_config_registry,
     get_directory_pattern,
     get_filesystem,
     get_network_config_path,
     get_network_radars_config_path,
     get_product_config_filepath,
+    get_product_file_time_coverage,
     get_product_filename_patterns,
     get_product_info,
     get_radar_config_filepath,
@@ -51,6 +59,7 @@ from radar_api.io import (
     get_radar_start_time,
     get_radar_time_coverage,
     is_radar_available,
+    reset_config_registry,
 )
 
 NETWORKS = available_networks()
@@ -177,6 +186,34 @@ def test_get_product_filename_patterns(network):
         assert isinstance(patterns, list)
 
 
+@pytest.mark.parametrize("network", NETWORKS)
+def test_get_product_file_time_coverage(network):
+    """Test get_product_file_time_coverage returns a positive file duration."""
+    for product in available_products(network=network):
+        file_time_coverage = get_product_file_time_coverage(network, product=product)
+        assert isinstance(file_time_coverage, datetime.timedelta)
+        assert file_time_coverage > datetime.timedelta(0)
+    assert get_product_file_time_coverage("NEXRAD", "NEXRAD_L2") == datetime.timedelta(minutes=7)
+
+
+@pytest.mark.parametrize(
+    ("file_time_coverage", "expected"),
+    [(None, datetime.timedelta(minutes=7)), ("2min 30s", datetime.timedelta(seconds=150))],
+)
+def test_get_product_file_time_coverage_setting(mocker, file_time_coverage, expected):
+    """Test the file_time_coverage setting of the product configuration file."""
+    mocker.patch("radar_api.io._get_product_info", return_value={"file_time_coverage": file_time_coverage})
+    assert get_product_file_time_coverage("NEXRAD", "NEXRAD_L2") == expected
+
+
+@pytest.mark.parametrize("file_time_coverage", ["dummy", "-5min"])
+def test_get_product_file_time_coverage_invalid(mocker, file_time_coverage):
+    """Test invalid file_time_coverage settings raise an error."""
+    mocker.patch("radar_api.io._get_product_info", return_value={"file_time_coverage": file_time_coverage})
+    with pytest.raises(ValueError):
+        get_product_file_time_coverage("NEXRAD", "NEXRAD_L2")
+
+
 @pytest.mark.parametrize("network", NETWORKS)
 def test_get_directory_pattern_cloud(network):
     """Test get_directory_pattern for a cloud protocol (e.g. s3)."""
@@ -206,6 +243,49 @@ def test_get_filesystem_s3():
     assert fs.anon is True
 
 
+def test_get_filesystem_pool():
+    """Test get_filesystem reuses the filesystems and does not modify fs_args."""
+    close_filesystems()
+    fs_args = {}
+    fs = get_filesystem("s3", fs_args=fs_args)
+    assert fs_args == {}
+    assert fs.config_kwargs == {"max_pool_connections": 50}
+    assert get_filesystem("s3") is fs
+    assert get_filesystem("s3", fs_args={"anon": True}) is fs
+    assert get_filesystem("s3", fs_args={"anon": True, "config_kwargs": {"max_pool_connections": 5}}) is not fs
+
+    # The filesystems are created again after closing them
+    close_filesystems()
+    assert get_filesystem("s3") is not fs
+
+
+def test_filesystem_pool_max_pool_connections():
+    """Test the connection pool size is set by the configuration."""
+    pool = FilesystemPool()
+    with radar_api.config.set({"filesystem.max_pool_connections": 10}):
+        fs = pool.get("s3")
+    assert fs.config_kwargs == {"max_pool_connections": 10}
+    assert len(pool) == 1
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_filesystem_pool_uncopyable_fs_args(mocker):
+    """Test the filesystem arguments are passed through without being copied."""
+    mock_filesystem = mocker.patch("radar_api.io.fsspec.filesystem", side_effect=lambda *args, **kwargs: object())
+    lock = threading.Lock()
+    pool = FilesystemPool()
+    fs = pool.get("file", fs_args={"lock": lock})
+    assert mock_filesystem.call_args.kwargs["lock"] is lock
+    assert pool.get("file", fs_args={"lock": lock}) is fs
+    assert len(pool) == 1
+
+    # Test the filesystem is not pooled if the arguments cannot be tokenized
+    mocker.patch("radar_api.io.tokenize", side_effect=TypeError)
+    assert pool.get("file", fs_args={"lock": lock}) is not fs
+    assert len(pool) == 1
+
+
 # def test_get_filesystem_gcs():
 #     """Test get_filesystem returns a gcs fsspec filesystem."""
 #     fs = get_filesystem("gcs")
@@ -236,3 +316,52 @@ def test_get_bucket_prefix():
 
     with pytest.raises(NotImplementedError):
         get_bucket_prefix("ftp")
+
+
+def test_get_config_registry():
+    """Test get_config_registry returns the same in-memory registry across calls."""
+    registry = get_config_registry()
+    assert isinstance(registry, ConfigRegistry)
+    assert get_config_registry() is registry
+    assert "NEXRAD" in registry.networks
+    assert "KABR" in registry.radars
+
+    # Test the registry is rebuilt after a reset
+    reset_config_registry()
+    assert get_config_registry() is not registry
+
+
+def test_get_product_info_returns_copy():
+    """Test the configuration dictionaries returned to the caller can be safely modified."""
+    info = get_product_info("NEXRAD", product="NEXRAD_L2")
+    info["filename_patterns"].append("dummy")
+    info["xradar_reader"] = "dummy"
+    assert "dummy" not in get_product_filename_patterns("NEXRAD", product="NEXRAD_L2")
+    assert get_product_info("NEXRAD", product="NEXRAD_L2")["xradar_reader"] == "open_nexradlevel2_datatree"
+
+
+def test_config_registry(tmp_path):
+    """Test ConfigRegistry lookups and invalidation."""
+    network_config_path = tmp_path / "network"
+    radars_config_path = tmp_path / "radar"
+    os.makedirs(network_config_path / "DUMMY")
+    os.makedirs(radars_config_path / "DUMMY")
+    with open(network_config_path / "DUMMY" / "L2.yaml", "w") as f:
+        yaml.safe_dump({"filename_patterns": ["{radar_acronym:4s}"]}, f)
+    with open(radars_config_path / "DUMMY" / "RAD1.yaml", "w") as f:
+        yaml.safe_dump({"latitude": 45.0, "longitude": 8.0}, f)
+
+    registry = ConfigRegistry(str(network_config_path), str(radars_config_path))
+    assert registry.networks == ("DUMMY",)
+    assert registry.get_products("DUMMY") == ("L2",)
+    assert registry.get_network_radars("DUMMY") == ("RAD1",)
+    assert registry.get_product_info("DUMMY", "L2")["filename_patterns"] == ["{radar_acronym:4s}"]
+    assert registry.get_radar_info("DUMMY", "RAD1")["latitude"] == 45.0
+    with pytest.raises(KeyError):
+        registry.get_radar_info("DUMMY", "RAD2")
+    assert registry.is_valid()
+
+    # Test the registry is invalidated when a configuration file is added
+    with open(radars_config_path / "DUMMY" / "RAD2.yaml", "w") as f:
+        yaml.safe_dump({"latitude": 46.0, "longitude": 8.0}, f)
+    assert not registry.is_valid()
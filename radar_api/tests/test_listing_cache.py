@@ -0,0 +1,156 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Test the directory listing cache."""
+
+import os
+
+import fsspec
+import pandas as pd
+
+import radar_api
+from radar_api.listing_cache import ListingCache, get_listing_cache, get_listing_cache_filepath
+from radar_api.search import get_directories_end_times, list_directories_with_cache
+
+
+class TestListingCache:
+    """Test ListingCache."""
+
+    def test_get_set(self, tmp_path):
+        """Test listings are stored and retrieved by protocol and directory path."""
+        cache = ListingCache(tmp_path / "cache" / "listings.sqlite")
+        listings = {"bucket/dir1": [("bucket/dir1/file1", 10), ("bucket/dir1/file2", 20)], "bucket/dir2": []}
+        cache.set(protocol="s3", listings=listings)
+        assert cache.get(protocol="s3", dir_paths=["bucket/dir1", "bucket/dir2", "bucket/dir3"], ttl=60) == listings
+        assert cache.get(protocol="gcs", dir_paths=["bucket/dir1"], ttl=60) == {}
+
+        cache.clear()
+        assert cache.get(protocol="s3", dir_paths=["bucket/dir1"], ttl=60) == {}
+
+    def test_expiration(self, tmp_path):
+        """Test listings of open periods expire while listings of closed periods never expire."""
+        cache = ListingCache(tmp_path / "listings.sqlite")
+        now = pd.Timestamp("2023-01-02 12:00:00").timestamp()
+        listings = {"closed": [("closed/file", 1)], "open": [("open/file", 1)], "unknown": [("unknown/file", 1)]}
+        end_times = {
+            "closed": pd.Timestamp("2023-01-01 23:59:59").timestamp(),
+            "open": pd.Timestamp("2023-01-02 23:59:59").timestamp(),
+        }
+        cache.set(protocol="s3", listings=listings, end_times=end_times, now=now)
+
+        dir_paths = list(listings)
+        assert cache.get(protocol="s3", dir_paths=dir_paths, ttl=300, now=now + 100) == listings
+        expected = {"closed": [("closed/file", 1)]}
+        assert cache.get(protocol="s3", dir_paths=dir_paths, ttl=300, now=now + 10**8) == expected
+
+
+def test_get_listing_cache(tmp_path):
+    """Test get_listing_cache follows the radar_api config."""
+    config = {"listing_cache.enabled": True, "listing_cache.filepath": None}
+    with radar_api.config.set({**config, "base_dir": None}):
+        assert get_listing_cache_filepath() is None
+        assert get_listing_cache() is None
+
+    # Check the base_dir is not created implicitly
+    base_dir = str(tmp_path / "missing")
+    with radar_api.config.set({**config, "base_dir": base_dir}):
+        assert get_listing_cache() is None
+    assert not os.path.exists(base_dir)
+
+    with radar_api.config.set({**config, "base_dir": str(tmp_path)}):
+        filepath = os.path.join(str(tmp_path), ".radar_api", "listings.sqlite")
+        assert get_listing_cache_filepath() == filepath
+        cache = get_listing_cache()
+        assert isinstance(cache, ListingCache)
+        assert cache.filepath == filepath
+        assert get_listing_cache() is cache
+
+        with radar_api.config.set({"listing_cache.enabled": False}):
+            assert get_listing_cache() is None
+
+
+def test_get_directories_end_times():
+    """Test the end time of the period covered by directories."""
+    timesteps = pd.DatetimeIndex(["2023-01-01 00:00", "2023-12-31 00:00"])
+    end_times = get_directories_end_times(timesteps, freq="D")
+    assert end_times[0].floor("s") == pd.Timestamp("2023-01-01 23:59:59")
+    end_times = get_directories_end_times(timesteps, freq="YE")
+    assert end_times[1].floor("s") == pd.Timestamp("2023-12-31 23:59:59")
+
+
+def test_list_directories_with_cache(tmp_path, mocker):
+    """Test only directories without valid cached listing are listed."""
+    cache = ListingCache(tmp_path / "listings.sqlite")
+    dir_paths = []
+    for i in range(3):
+        dir_path = str(tmp_path / f"dir_{i}")
+        os.makedirs(dir_path)
+        with open(os.path.join(dir_path, "file"), "w") as f:
+            f.write("data")
+        dir_paths.append(dir_path)
+    dir_paths.append(str(tmp_path / "missing"))
+    end_times = pd.DatetimeIndex(["2000-01-01"] * 4)
+
+    fs = fsspec.filesystem("file")
+    spy = mocker.spy(fs, "ls")
+    kwargs = {"fs": fs, "protocol": "file", "dir_paths": dir_paths, "end_times": end_times, "listing_cache": cache}
+    results = list_directories_with_cache(**kwargs)
+    assert results == [[os.path.join(dir_path, "file")] for dir_path in dir_paths[:3]] + [[]]
+    assert spy.call_count == 4
+
+    # Cached listings are reused. Failed listings are not cached.
+    assert list_directories_with_cache(**kwargs) == results
+    assert spy.call_count == 5
+    assert cache.get(protocol="file", dir_paths=dir_paths[:1], ttl=0)[dir_paths[0]][0][1] == 4
+
+
+def test_list_directories_with_cache_prefix(tmp_path, mocker):
+    """Test listings restricted to a prefix are cached separately and reuse full directory listings."""
+    cache = ListingCache(tmp_path / "listings.sqlite")
+    dir_paths = []
+    for i in range(2):
+        dir_path = str(tmp_path / f"dir_{i}")
+        os.makedirs(dir_path)
+        for filename in ["file_a", "file_b"]:
+            with open(os.path.join(dir_path, filename), "w") as f:
+                f.write("data")
+        dir_paths.append(dir_path)
+
+    fs = fsspec.filesystem("file")
+    spy = mocker.spy(fs, "ls")
+    kwargs = {"fs": fs, "protocol": "file", "listing_cache": cache}
+    # Full listing of the first directory
+    list_directories_with_cache(dir_paths=dir_paths[:1], **kwargs)
+    assert spy.call_count == 1
+    # Only the second directory is listed, and its listing is cached under the prefix key
+    results = list_directories_with_cache(dir_paths=dir_paths, prefix="file_b", **kwargs)
+    assert results == [[os.path.join(dir_path, "file_b")] for dir_path in dir_paths]
+    assert spy.call_count == 2
+    assert list(cache.get(protocol="file", dir_paths=[f"{dir_paths[1]}/file_b*", dir_paths[1]], ttl=60)) == [
+        f"{dir_paths[1]}/file_b*",
+    ]
+    assert list_directories_with_cache(dir_paths=dir_paths, prefix="file_b", **kwargs) == results
+    assert spy.call_count == 2
@@ -0,0 +1,186 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Test the read cache of remote files."""
+
+import os
+import shutil
+
+import pytest
+
+import radar_api
+from radar_api.read_cache import (
+    ReadCache,
+    _get_radar_from_directory,
+    get_local_copy,
+    get_read_cache,
+    get_read_cache_directory,
+)
+
+TEST_FILEPATH = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+
+
+class FakeFileSystem:
+    """Filesystem writing files of a given size and counting the downloads."""
+
+    def __init__(self, size=10):
+        self.size = size
+        self.n_downloads = 0
+
+    def get_file(self, rpath, lpath):
+        self.n_downloads += 1
+        with open(lpath, "wb") as f:
+            f.write(b"0" * self.size)
+
+
+class TestReadCache:
+    """Test ReadCache."""
+
+    def test_get(self, tmp_path):
+        """Test files are downloaded once and stored following the bucket layout."""
+        cache = ReadCache(tmp_path / "cache", max_bytes=100)
+        fs = FakeFileSystem()
+        filepath = "s3://bucket/2023/01/01/file1"
+        assert cache.lookup(filepath) is None
+        cache_filepath = cache.get(filepath, fs=fs)
+        assert cache_filepath == os.path.join(str(tmp_path / "cache"), "s3", "bucket", "2023", "01", "01", "file1")
+        assert os.path.getsize(cache_filepath) == 10
+        assert cache.get(filepath, fs=fs) == cache_filepath
+        assert cache.lookup(filepath) == cache_filepath
+        assert fs.n_downloads == 1
+        assert cache.size == 10
+        # Check no temporary file is left
+        assert os.listdir(os.path.dirname(cache_filepath)) == ["file1"]
+
+    def test_put(self, tmp_path):
+        """Test the in-memory content of a remote file is stored in the cache."""
+        cache = ReadCache(tmp_path / "cache", max_bytes=100)
+        filepath = "s3://bucket/2023/01/01/file1"
+        cache_filepath = cache.put(filepath, b"0" * 10)
+        assert cache.lookup(filepath) == cache_filepath
+        assert cache.get(filepath, fs=FakeFileSystem()) == cache_filepath
+        assert cache.size == 10
+        assert os.listdir(os.path.dirname(cache_filepath)) == ["file1"]
+
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently used files are evicted when exceeding max_bytes."""
+        cache = ReadCache(tmp_path, max_bytes=25)
+        fs = FakeFileSystem()
+        cache.get("s3://bucket/file1", fs=fs, now=1)
+        cache.get("s3://bucket/file2", fs=fs, now=2)
+        # Access file1 so that file2 becomes the least recently used file
+        cache.lookup("s3://bucket/file1", now=3)
+        cache.get("s3://bucket/file3", fs=fs, now=4)
+        assert cache.size == 20
+        assert cache.lookup("s3://bucket/file2") is None
+        assert cache.lookup("s3://bucket/file1") is not None
+        assert cache.lookup("s3://bucket/file3") is not None
+
+    def test_file_larger_than_cache(self, tmp_path):
+        """Test a file larger than max_bytes is kept until the next file is cached."""
+        cache = ReadCache(tmp_path, max_bytes=5)
+        fs = FakeFileSystem()
+        cache_filepath = cache.get("s3://bucket/file1", fs=fs)
+        assert os.path.exists(cache_filepath)
+        cache.get("s3://bucket/file2", fs=fs)
+        assert not os.path.exists(cache_filepath)
+
+    def test_shared_index(self, tmp_path):
+        """Test caches sharing the same directory see each other files."""
+        cache1 = ReadCache(tmp_path, max_bytes=100)
+        cache2 = ReadCache(tmp_path, max_bytes=100)
+        fs = FakeFileSystem()
+        cache1.get("s3://bucket/file1", fs=fs)
+        assert cache2.lookup("s3://bucket/file1") is not None
+        assert cache2.size == 10
+
+    def test_clear(self, tmp_path):
+        """Test clear removes all cached files."""
+        cache = ReadCache(tmp_path, max_bytes=100)
+        cache_filepath = cache.get("s3://bucket/file1", fs=FakeFileSystem())
+        assert cache.clear() == ["s3://bucket/file1"]
+        assert cache.size == 0
+        assert not os.path.exists(cache_filepath)
+
+    def test_failed_download(self, tmp_path):
+        """Test a failed download does not leave files in the cache."""
+
+        class FailingFileSystem:
+            def get_file(self, rpath, lpath):
+                with open(lpath, "wb") as f:
+                    f.write(b"0")
+                raise OSError("Connection error")
+
+        cache = ReadCache(tmp_path / "cache", max_bytes=100)
+        with pytest.raises(OSError):
+            cache.get("s3://bucket/file1", fs=FailingFileSystem())
+        assert os.listdir(tmp_path / "cache" / "s3" / "bucket") == []
+        assert cache.size == 0
+
+
+def test_get_read_cache(tmp_path):
+    """Test get_read_cache follows the radar_api config."""
+    with radar_api.config.set({"read_cache.enabled": False}):
+        assert get_read_cache() is None
+
+    with radar_api.config.set({"base_dir": str(tmp_path), "read_cache.directory": None}):
+        assert get_read_cache_directory() == os.path.join(str(tmp_path), ".radar_api", "read_cache")
+    # Check a missing base_dir is not used (and created)
+    with radar_api.config.set({"base_dir": str(tmp_path / "missing"), "read_cache.directory": None}):
+        assert not get_read_cache_directory().startswith(str(tmp_path))
+
+    directory = str(tmp_path / "read_cache")
+    with radar_api.config.set({"read_cache.directory": directory, "read_cache.max_bytes": 1000}):
+        cache = get_read_cache()
+        assert isinstance(cache, ReadCache)
+        assert cache.directory == directory
+        assert cache.max_bytes == 1000
+        assert get_read_cache() is cache
+
+
+def test_get_radar_from_directory():
+    """Test the radar name is extracted from the bucket directory path."""
+    pattern = "s3://unidata-nexrad-level2/{time:%Y}/{time:%m}/{time:%d}/{radar:s}"
+    assert _get_radar_from_directory("s3://unidata-nexrad-level2/2023/01/01/KABR", pattern) == "KABR"
+    with pytest.raises(ValueError):
+        _get_radar_from_directory("s3://another-bucket/2023/01/01/KABR", pattern)
+
+
+def test_get_local_copy(tmp_path):
+    """Test the copy of a remote file in the base_dir archive is found."""
+    filepath = "s3://unidata-nexrad-level2/2023/01/01/KABR/KABR20230101_000142_V06"
+    with radar_api.config.set({"base_dir": str(tmp_path)}):
+        assert get_local_copy(filepath, network="NEXRAD", product=None) is None
+        dst_dir = os.path.join(str(tmp_path), "NEXRAD", "2023", "01", "01", "00", "KABR")
+        os.makedirs(dst_dir)
+        shutil.copy(TEST_FILEPATH, dst_dir)
+        local_filepath = get_local_copy(filepath, network="NEXRAD", product=None)
+        assert local_filepath == os.path.join(dst_dir, "KABR20230101_000142_V06")
+
+    with radar_api.config.set({"base_dir": None}):
+        assert get_local_copy(filepath, network="NEXRAD", product=None) is None
+    with radar_api.config.set({"base_dir": str(tmp_path / "missing")}):
+        assert get_local_copy(filepath, network="NEXRAD", product=None) is None
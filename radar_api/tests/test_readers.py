@@ -25,28 +25,30 @@
 
 # -----------------------------------------------------------------------------.
 """This module test the RADAR-API readers functions."""
+
+import contextlib
+import io
 import os
+import shutil
 
+import numpy as np
 import pytest
 import xarray as xr
 
 import radar_api
+from radar_api.read_cache import get_read_cache
 from radar_api.readers import (
+    ReaderPool,
+    _prepare_file,
     check_software_availability,
-    get_simplecache_file,
     open_dataset,
     open_datatree,
+    open_many,
+    open_mfdatatree,
     # open_pyart,
 )
 
 
-def test_get_simplecache_file():
-    """Test file simple caching with fsspec."""
-    filepath = "s3://unidata-nexrad-level2/2023/01/01/KABR/KABR20230101_000142_V06"
-    file = get_simplecache_file(filepath)
-    assert isinstance(file, str)
-
-
 def test_check_software_availability_decorator():
     """Test check_software_availability_decorator raise ImportError."""
 
@@ -80,6 +82,212 @@ def test_open_dataset():
     assert isinstance(ds, xr.Dataset)
 
 
+def test_prepare_file_bytes():
+    """Test _prepare_file wraps the in-memory file content for the reader."""
+    content = b"content"
+    with contextlib.ExitStack() as stack:
+        assert _prepare_file(content, stack, engine="nexradlevel2") is content
+        buffer = _prepare_file(content, stack, engine="odim")
+        assert isinstance(buffer, io.BytesIO)
+        assert buffer.read() == content
+        assert isinstance(_prepare_file(content, stack), io.BytesIO)
+        assert _prepare_file("local_filepath", stack) == "local_filepath"
+
+
+@pytest.mark.parametrize("sweep", [None, "sweep_0"])
+def test_open_remote_file_in_memory(tmp_path, mocker, sweep):
+    """Test remote files are opened from memory and stored in the read cache."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    with open(filepath, "rb") as f:
+        content = f.read()
+    mock_get_bytes = mocker.patch("radar_api.readers.get_file_bytes", return_value=content)
+    remote_filepath = "s3://unidata-nexrad-level2/2023/01/01/KABR/KABR20230101_000142_V06"
+
+    def _open():
+        if sweep is None:
+            return open_datatree(remote_filepath, network=network)
+        return open_dataset(remote_filepath, network=network, sweep=sweep)
+
+    with radar_api.config.set({"base_dir": None, "read_cache.directory": str(tmp_path / "cache")}):
+        assert isinstance(_open(), (xr.DataTree, xr.Dataset))
+        mock_get_bytes.assert_called_once_with(remote_filepath)
+        cache_filepath = get_read_cache().lookup(remote_filepath)
+        assert cache_filepath is not None
+        assert os.listdir(os.path.dirname(cache_filepath)) == ["KABR20230101_000142_V06"]
+
+        # Check the next reads use the read cache
+        assert isinstance(_open(), (xr.DataTree, xr.Dataset))
+        assert mock_get_bytes.call_count == 1
+
+    # Check no local file is written if the read cache is disabled
+    cache_dir = str(tmp_path / "disabled_cache")
+    with radar_api.config.set({"read_cache.enabled": False, "read_cache.directory": cache_dir}):
+        assert isinstance(_open(), (xr.DataTree, xr.Dataset))
+    assert mock_get_bytes.call_count == 2
+    assert not os.path.exists(cache_dir)
+
+
+def test_open_remote_file_missing_base_dir(tmp_path, mocker):
+    """Test remote files are opened when the configured base_dir does not exist."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    with open(filepath, "rb") as f:
+        content = f.read()
+    mocker.patch("radar_api.readers.get_file_bytes", return_value=content)
+    remote_filepath = "s3://unidata-nexrad-level2/2023/01/01/KABR/KABR20230101_000142_V06"
+    base_dir = str(tmp_path / "missing")
+    mocker.patch("tempfile.gettempdir", return_value=str(tmp_path / "tmp"))
+    with radar_api.config.set({"base_dir": base_dir, "read_cache.directory": None}):
+        assert isinstance(open_datatree(remote_filepath, network=network), xr.DataTree)
+    assert not os.path.exists(base_dir)
+
+
+def test_open_remote_file_evicted_from_read_cache(tmp_path, mocker):
+    """Test remote files removed from the read cache after their lookup are fetched again."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    with open(filepath, "rb") as f:
+        content = f.read()
+    read_cache = mocker.Mock()
+    read_cache.lookup.return_value = str(tmp_path / "evicted")
+    mocker.patch("radar_api.readers.get_read_cache", return_value=read_cache)
+    mock_get_bytes = mocker.patch("radar_api.readers.get_file_bytes", return_value=content)
+    remote_filepath = "s3://unidata-nexrad-level2/2023/01/01/KABR/KABR20230101_000142_V06"
+    with radar_api.config.set({"base_dir": None}):
+        assert isinstance(open_dataset(remote_filepath, network=network, sweep="sweep_0"), xr.Dataset)
+    mock_get_bytes.assert_called_once_with(remote_filepath)
+
+
+def test_open_remote_file_with_read_cache(tmp_path, mocker):
+    """Test remote files are downloaded once into the read cache with in_memory=False."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    fs = mocker.Mock()
+    fs.get_file.side_effect = lambda rpath, lpath: shutil.copy(filepath, lpath)
+    mocker.patch("radar_api.readers.get_filesystem", return_value=fs)
+    mock_get_bytes = mocker.patch("radar_api.readers.get_file_bytes")
+    remote_filepath = "s3://unidata-nexrad-level2/2023/01/01/KABR/KABR20230101_000142_V06"
+    with radar_api.config.set({"base_dir": None, "read_cache.directory": str(tmp_path / "cache")}):
+        assert isinstance(open_datatree(remote_filepath, network=network, in_memory=False), xr.DataTree)
+        assert isinstance(open_datatree(remote_filepath, network=network, in_memory=False), xr.DataTree)
+        # Check the cached file is also reused with in_memory=True
+        assert isinstance(open_datatree(remote_filepath, network=network), xr.DataTree)
+    assert fs.get_file.call_count == 1
+    mock_get_bytes.assert_not_called()
+
+
+def test_open_remote_file_from_base_dir(tmp_path, mocker):
+    """Test remote files already downloaded in the base_dir archive are opened from disk."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    dst_dir = os.path.join(str(tmp_path), "NEXRAD", "2023", "01", "01", "00", "KABR")
+    os.makedirs(dst_dir)
+    shutil.copy(filepath, dst_dir)
+    mock_get_bytes = mocker.patch("radar_api.readers.get_file_bytes")
+    remote_filepath = "s3://unidata-nexrad-level2/2023/01/01/KABR/KABR20230101_000142_V06"
+    with radar_api.config.set({"base_dir": str(tmp_path)}):
+        assert isinstance(open_datatree(remote_filepath, network=network), xr.DataTree)
+    mock_get_bytes.assert_not_called()
+
+
+@pytest.mark.parametrize("encoding", ["packed", "float32"])
+def test_open_datatree_encoding(encoding):
+    """Test the radar moments are kept packed or decoded to float32."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    dt_ref = open_datatree(filepath, network=network)
+    dt = open_datatree(filepath, network=network, encoding=encoding)
+    da = dt["sweep_0"]["DBZH"]
+    if encoding == "packed":
+        assert da.dtype == np.uint8
+        assert "scale_factor" in da.attrs
+        da = xr.decode_cf(dt["sweep_0"].to_dataset())["DBZH"]
+    else:
+        assert da.dtype == np.float32
+    np.testing.assert_allclose(da.values, dt_ref["sweep_0"]["DBZH"].values)
+
+
+@pytest.mark.parametrize("encoding", ["packed", "float32"])
+def test_open_dataset_encoding(encoding):
+    """Test open_dataset with the encoding options."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    ds = open_dataset(filepath, sweep="sweep_0", network=network, encoding=encoding)
+    assert ds["ZDR"].dtype == (np.uint16 if encoding == "packed" else np.float32)
+
+
+def test_open_datatree_invalid_encoding():
+    """Test invalid encoding arguments raise errors."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    with pytest.raises(ValueError):
+        open_datatree(filepath, network=network, encoding="float16")
+    with pytest.raises(ValueError):
+        open_datatree(filepath, network=network, encoding="packed", mask_and_scale=True)
+
+
+def test_open_mfdatatree(tmp_path):
+    """Test open_mfdatatree stacks the sweeps of multiple files along volume_time."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    filepaths = []
+    for filename in ["KABR20230101_000142_V06", "KABR20230101_000742_V06"]:
+        filepaths.append(str(tmp_path / filename))
+        shutil.copy(filepath, filepaths[-1])
+    dt = open_mfdatatree(filepaths, network=network, chunks={"range": 500})
+    assert list(dt.children) == [f"sweep_{i}" for i in range(12)]
+    ds = dt["sweep_9"].to_dataset()
+    assert ds["DBZH"].dims == ("volume_time", "azimuth", "range")
+    assert ds.sizes["volume_time"] == 2
+    assert ds.sizes["azimuth"] == 360  # rays reindexed to a regular grid
+    assert ds["volume_time"].values[1] == np.datetime64("2023-01-01T00:07:42")
+    assert ds["DBZH"].chunks[2][0] == 500
+    assert ds["DBZH"].chunks[0] == (1, 1)
+    ds_ref = open_dataset(filepath, network=network, sweep="sweep_0")
+    np.testing.assert_allclose(
+        dt["sweep_0"]["DBZH"].isel(volume_time=1).values,
+        ds_ref["DBZH"].sortby("azimuth").values,
+    )
+
+    # Check the sweeps are not reindexed with reindex_angle=False
+    dt = open_mfdatatree(filepaths[:1], network=network, parallel=False, reindex_angle=False)
+    assert dt["sweep_9"].sizes["azimuth"] == 358
+
+    with pytest.raises(ValueError):
+        open_mfdatatree([], network=network)
+
+
+def test_open_many(tmp_path):
+    """Test open_many decodes the files with a pool of worker processes."""
+    network = "NEXRAD"
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    filepaths = []
+    for filename in ["KABR20230101_000142_V06", "KABR20230101_000742_V06"]:
+        filepaths.append(str(tmp_path / filename))
+        shutil.copy(filepath, filepaths[-1])
+
+    # Check results are yielded in order
+    results = list(open_many(filepaths, network=network, n_workers=2, encoding="float32"))
+    assert [result[0] for result in results] == filepaths
+    dt = results[0][1]
+    assert isinstance(dt, xr.DataTree)
+    assert dt["sweep_0"]["DBZH"].dtype == np.float32
+    ds_ref = open_dataset(filepath, network=network, sweep="sweep_0", encoding="float32")
+    np.testing.assert_array_equal(dt["sweep_0"]["DBZH"].values, ds_ref["DBZH"].values)
+
+    # Check results are yielded as completed with a persistent pool
+    with ReaderPool(network=network, n_workers=1, max_pending=1) as pool:
+        results = list(pool.imap(filepaths, ordered=False))
+        assert sorted(result[0] for result in results) == filepaths
+        assert isinstance(pool.submit(filepaths[0]).result(), xr.DataTree)  # the pool is reused
+
+    with pytest.raises(ValueError):
+        ReaderPool(network=network, reader="dummy")
+    with pytest.raises(ValueError):
+        ReaderPool(network=network, n_workers=0)
+
+
 # def test_open_pyart():
 #     """Test file with open_pyart."""
 #     network = "NEXRAD"
@@ -25,18 +25,27 @@
 
 # -----------------------------------------------------------------------------.
 """This module test the files search routines."""
+
+import asyncio
 import os
 import shutil
 
+import fsspec
 import pandas as pd
 import pytest
+from fsspec.asyn import get_loop
 
 import radar_api
 from radar_api.search import (
+    _try_list_files,
     find_files,
+    find_files_multi,
     get_directories_paths,
+    get_filenames_prefix,
     get_list_timesteps,
     get_pattern_shortest_time_component,
+    iter_files,
+    list_directories,
 )
 
 
@@ -240,6 +249,240 @@ def test_find_files_on_local_disk(tmp_path):
     assert filepaths[0].endswith("KABR20230101_000142_V06")
 
 
+class TestListDirectories:
+    """Test list_directories."""
+
+    def _create_directories(self, tmp_path, n_directories=5):
+        dir_paths = []
+        for i in range(n_directories):
+            dir_path = os.path.join(tmp_path, f"dir_{i}")
+            os.makedirs(dir_path)
+            for j in range(i):
+                with open(os.path.join(dir_path, f"file_{j}"), "w") as f:
+                    f.write("")
+            dir_paths.append(dir_path)
+        return dir_paths
+
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    def test_sync_filesystem(self, tmp_path, max_concurrency):
+        """Test directories are listed in input order with a sync filesystem."""
+        fs = fsspec.filesystem("file")
+        dir_paths = self._create_directories(tmp_path)
+        dir_paths.append(os.path.join(tmp_path, "missing"))
+        results = list_directories(fs=fs, dir_paths=dir_paths, max_concurrency=max_concurrency)
+        assert [len(fpaths) for fpaths in results] == [0, 1, 2, 3, 4, 0]
+        assert results == [_try_list_files(fs=fs, dir_path=dir_path) for dir_path in dir_paths]
+
+    def test_async_filesystem(self):
+        """Test directories are listed concurrently with an async filesystem."""
+
+        class AsyncFileSystem:
+            async_impl = True
+
+            def __init__(self):
+                self.loop = get_loop()
+                self.n_running = 0
+                self.max_running = 0
+
+            async def _ls(self, path, detail=False):
+                if path == "missing":
+                    raise FileNotFoundError(path)
+                self.n_running += 1
+                self.max_running = max(self.max_running, self.n_running)
+                await asyncio.sleep(0.01)
+                self.n_running -= 1
+                return [f"{path}/file"]
+
+        fs = AsyncFileSystem()
+        dir_paths = [f"dir_{i}" for i in range(10)] + ["missing"]
+        results = list_directories(fs=fs, dir_paths=dir_paths, max_concurrency=3)
+        assert results == [[f"dir_{i}/file"] for i in range(10)] + [[]]
+        assert fs.max_running == 3
+
+
+@pytest.mark.parametrize(
+    ("network", "product", "radar", "period", "expected"),
+    [
+        ("NEXRAD", "NEXRAD_L2", "KABR", ("2023-01-01 01:10:00", "2023-01-01 01:20:00"), "KABR20230101_01"),
+        # Files starting up to file_time_coverage (7 minutes) before start_time can overlap the period
+        ("NEXRAD", "NEXRAD_L2", "KABR", ("2023-01-01 01:05:00", "2023-01-01 01:20:00"), "KABR20230101_0"),
+        ("NEXRAD", "NEXRAD_L2", "KABR", ("2023-01-01 01:00:00", "2023-01-03 00:00:00"), "KABR2023010"),
+        ("FMI", "PVOL", "fikor", ("2023-01-01 01:10:00", "2023-01-01 01:20:00"), "2023010101"),
+        ("MCH_LTE", "POL", "A", ("2023-01-01 01:10:00", "2023-01-01 01:20:00"), "MLA2300101"),
+        # The radar acronym of the filenames differs from the radar name
+        ("IDEAM", "IDEAM_L2", "Bogota", ("2023-01-01 01:10:00", "2023-01-01 01:20:00"), ""),
+        ("MCH_CSCS", "POL", "A", ("2023-01-01 01:10:00", "2023-01-01 01:20:00"), ""),
+    ],
+)
+def test_get_filenames_prefix(network, product, radar, period, expected):
+    """Test get_filenames_prefix returns the filename prefix shared by the files of the period."""
+    prefix = get_filenames_prefix(
+        network=network,
+        product=product,
+        radar=radar,
+        start_time=pd.Timestamp(period[0]),
+        end_time=pd.Timestamp(period[1]),
+    )
+    assert prefix == expected
+
+
+class TestPrefixListing:
+    """Test directory listings restricted to a filename prefix."""
+
+    def test_prefix_requests(self):
+        """Test the prefix is passed to the listing requests of filesystems supporting it."""
+
+        class PrefixFileSystem:
+            async_impl = True
+
+            def __init__(self):
+                self.loop = get_loop()
+                self.prefixes = []
+
+            async def _lsdir(self, path, prefix="", **kwargs):
+                self.prefixes.append(prefix)
+                names = [f"{path}/KABR20230101_{hour:02d}0000_V06" for hour in range(24)]
+                return [
+                    {"name": name, "size": 1, "type": "file"}
+                    for name in names
+                    if name.split("/")[-1].startswith(prefix)
+                ]
+
+        fs = PrefixFileSystem()
+        for max_concurrency in [1, 2]:
+            results = list_directories(
+                fs=fs,
+                dir_paths=["dir_0", "dir_1"],
+                max_concurrency=max_concurrency,
+                prefix="KABR20230101_01",
+            )
+            assert results == [["dir_0/KABR20230101_010000_V06"], ["dir_1/KABR20230101_010000_V06"]]
+        assert fs.prefixes == ["KABR20230101_01"] * 4
+
+    def test_prefix_filter(self, tmp_path):
+        """Test files are filtered by prefix on filesystems without prefix listing."""
+        for filename in ["KABR20230101_000000_V06", "KABR20230101_010000_V06"]:
+            with open(tmp_path / filename, "w") as f:
+                f.write("")
+        fs = fsspec.filesystem("file")
+        results = list_directories(fs=fs, dir_paths=[str(tmp_path)], prefix="KABR20230101_01", detail=True)
+        assert results == [[(str(tmp_path / "KABR20230101_010000_V06"), 0)]]
+
+
+def test_find_files_max_concurrency(tmp_path):
+    """Test find_files returns the same sorted list regardless of max_concurrency."""
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    base_dir = os.path.join(tmp_path, "RADAR")
+    for hour in range(4):
+        dst_dir = os.path.join(base_dir, "NEXRAD", "2023", "01", "01", f"{hour:02d}", "KABR")
+        os.makedirs(dst_dir, exist_ok=True)
+        shutil.copy(filepath, os.path.join(dst_dir, f"KABR20230101_{hour:02d}0142_V06"))
+
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01T00:00:00",
+        "end_time": "2023-01-01T04:00:00",
+        "protocol": "local",
+        "base_dir": base_dir,
+    }
+    filepaths = find_files(**kwargs, max_concurrency=1)
+    assert len(filepaths) == 4
+    assert filepaths == sorted(filepaths)
+    assert find_files(**kwargs, max_concurrency=10) == filepaths
+
+    # Check file sizes are returned with detail=True
+    dict_sizes = find_files(**kwargs, detail=True)
+    assert list(dict_sizes) == filepaths
+    assert list(dict_sizes.values()) == [os.path.getsize(filepath)] * 4
+
+    # Check the positional arguments are backward compatible
+    args = ["KABR", "NEXRAD", kwargs["start_time"], kwargs["end_time"], base_dir, "local", None, {}, False]
+    assert find_files(*args) == filepaths
+    with pytest.raises(TypeError):
+        find_files(*args, 1)
+
+
+def test_find_files_multi(tmp_path, mocker):
+    """Test find_files_multi returns the files of each radar."""
+    filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+    base_dir = os.path.join(tmp_path, "RADAR")
+    for radar in ["KABR", "KFSD"]:
+        dst_dir = os.path.join(base_dir, "NEXRAD", "2023", "01", "01", "00", radar)
+        os.makedirs(dst_dir, exist_ok=True)
+        shutil.copy(filepath, os.path.join(dst_dir, f"{radar}20230101_000142_V06"))
+
+    kwargs = {
+        "network": "NEXRAD",
+        "start_time": "2023-01-01T00:00:00",
+        "end_time": "2023-01-01T01:00:00",
+        "protocol": "local",
+        "base_dir": base_dir,
+    }
+    spy = mocker.spy(radar_api.search, "get_filesystem")
+    radars = [("NEXRAD", "KABR"), ("NEXRAD", "KFSD"), ("NEXRAD", "KLIX"), ("FMI", "fikor")]
+    results = find_files_multi(radars=radars, **kwargs)
+    assert list(results) == ["KABR", "KFSD", "KLIX"]
+    assert spy.call_count == 1
+    for radar in ["KABR", "KFSD"]:
+        assert results[radar] == find_files(radar=radar, **kwargs)
+        assert len(results[radar]) == 1
+    assert results["KLIX"] == []
+
+    # Check file sizes are returned with detail=True
+    results = find_files_multi(radars=["KABR"], detail=True, **kwargs)
+    assert results["KABR"] == find_files(radar="KABR", detail=True, **kwargs)
+
+
+class TestIterFiles:
+    @pytest.fixture
+    def kwargs(self, tmp_path):
+        """Create a local archive with one file per hour and return the search arguments."""
+        filepath = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+        base_dir = os.path.join(tmp_path, "RADAR")
+        for hour in [3, 1, 0, 2]:
+            dst_dir = os.path.join(base_dir, "NEXRAD", "2023", "01", "01", f"{hour:02d}", "KABR")
+            os.makedirs(dst_dir, exist_ok=True)
+            for minute in [40, 1]:
+                shutil.copy(filepath, os.path.join(dst_dir, f"KABR20230101_{hour:02d}{minute:02d}42_V06"))
+        return {
+            "network": "NEXRAD",
+            "radar": "KABR",
+            "start_time": "2023-01-01T00:30:00",
+            "end_time": "2023-01-01T04:00:00",
+            "protocol": "local",
+            "base_dir": base_dir,
+        }
+
+    @pytest.mark.parametrize("max_concurrency", [1, 2, 10])
+    def test_same_files_as_find_files(self, kwargs, max_concurrency):
+        """Test iter_files yields the files of find_files in time order."""
+        filepaths = list(iter_files(**kwargs, max_concurrency=max_concurrency))
+        assert len(filepaths) == 7
+        assert filepaths == sorted(filepaths, key=os.path.basename)
+        assert filepaths == find_files(**kwargs)
+
+    def test_detail(self, kwargs):
+        """Test iter_files yields the file information with detail=True."""
+        records = list(iter_files(**kwargs, detail=True))
+        assert [record["filepath"] for record in records] == find_files(**kwargs)
+        assert records[0]["start_time"] == pd.Timestamp("2023-01-01 00:40:42")
+        assert records[0]["size"] == os.path.getsize(records[0]["filepath"])
+        assert records[0]["radar_acronym"] == "KABR"
+
+    def test_early_stop(self, kwargs):
+        """Test iter_files can be stopped before all directories are listed."""
+        iterator = iter_files(**kwargs, max_concurrency=1)
+        assert os.path.basename(next(iterator)) == "KABR20230101_004042_V06"
+        iterator.close()
+
+    def test_no_files(self, kwargs):
+        """Test iter_files yields nothing if no files are available."""
+        kwargs["start_time"] = "2023-01-02T00:00:00"
+        kwargs["end_time"] = "2023-01-02T01:00:00"
+        assert list(iter_files(**kwargs)) == []
+
+
 def test_find_files_invalid_arguments():
     """Test the find_files raise error if base_dir specified with cloud protocol."""
     radar = "KABR"
@@ -0,0 +1,203 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module test the streaming routines."""
+
+import os
+import shutil
+
+import fsspec
+import pytest
+import xarray as xr
+
+import radar_api
+from radar_api.stream import _iter_ordered_results, check_reader, stream_datasets
+
+TEST_FILEPATH = os.path.join(radar_api._root_path, "radar_api", "tests", "test_data", "KABR20230101_000142_V06")
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    """Create a local archive with one NEXRAD file per hour."""
+    base_dir = os.path.join(tmp_path, "RADAR")
+    for hour in range(3):
+        dst_dir = os.path.join(base_dir, "NEXRAD", "2023", "01", "01", f"{hour:02d}", "KABR")
+        os.makedirs(dst_dir, exist_ok=True)
+        shutil.copy(TEST_FILEPATH, os.path.join(dst_dir, f"KABR20230101_{hour:02d}0142_V06"))
+    return base_dir
+
+
+def test_check_reader():
+    """Test check_reader."""
+    assert check_reader("xradar") == "xradar"
+    assert check_reader("pyart") == "pyart"
+    with pytest.raises(ValueError):
+        check_reader("dummy")
+    with pytest.raises(TypeError):
+        check_reader(1)
+
+
+@pytest.mark.parametrize("max_prefetch", [1, 3, 10])
+def test_iter_ordered_results(max_prefetch):
+    """Test _iter_ordered_results preserves the input order and bounds the prefetch."""
+    consumed = []
+
+    def _iterable():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    results = _iter_ordered_results(lambda x: x**2, _iterable(), max_prefetch=max_prefetch, n_workers=2)
+    assert next(results) == 0
+    assert len(consumed) == min(max_prefetch, 10)
+    assert list(results) == [i**2 for i in range(1, 10)]
+
+
+def test_iter_ordered_results_error():
+    """Test _iter_ordered_results propagates the errors of the function."""
+
+    def _func(x):
+        if x == 2:
+            raise ValueError("Corrupted file")
+        return x
+
+    results = _iter_ordered_results(_func, range(5), max_prefetch=2, n_workers=2)
+    assert next(results) == 0
+    assert next(results) == 1
+    with pytest.raises(ValueError, match="Corrupted file"):
+        next(results)
+
+
+def test_stream_datasets_local(base_dir):
+    """Test stream_datasets yields the DataTrees of the local files in time order."""
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01T00:00:00",
+        "end_time": "2023-01-01T03:00:00",
+        "protocol": "local",
+        "base_dir": base_dir,
+    }
+    dts = list(stream_datasets(**kwargs, max_prefetch=2))
+    assert len(dts) == 3
+    assert all(isinstance(dt, xr.DataTree) for dt in dts)
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_stream_datasets_remote(base_dir, mocker, in_memory):
+    """Test stream_datasets fetches the remote files in memory or through a temporary file."""
+    filepaths = [
+        os.path.join(base_dir, "NEXRAD", "2023", "01", "01", f"{hour:02d}", "KABR", f"KABR20230101_{hour:02d}0142_V06")
+        for hour in range(3)
+    ]
+    fs = fsspec.filesystem("file")
+    mocker.patch("radar_api.stream.iter_files", return_value=(filepath for filepath in filepaths))
+    mocker.patch("radar_api.stream.get_filesystem", return_value=fs)
+    spy_cat = mocker.spy(fs, "cat_file")
+    spy_get = mocker.spy(fs, "get_file")
+    results = stream_datasets(
+        network="NEXRAD",
+        radar="KABR",
+        start_time="2023-01-01T00:00:00",
+        end_time="2023-01-01T03:00:00",
+        in_memory=in_memory,
+        max_prefetch=2,
+    )
+    dts = list(results)
+    assert len(dts) == 3
+    assert all(isinstance(dt, xr.DataTree) for dt in dts)
+    assert spy_cat.call_count == (3 if in_memory else 0)
+    assert spy_get.call_count == (0 if in_memory else 3)
+    # Check the temporary files are deleted but the data remain accessible
+    assert dts[-1]["sweep_0"]["DBZH"].values.size > 0
+
+
+def test_stream_datasets_remote_same_filenames(tmp_path, mocker):
+    """Test remote files with the same name are downloaded into distinct temporary files."""
+    filepaths = []
+    for dirname in ["dir_1", "dir_2"]:
+        os.makedirs(tmp_path / dirname)
+        filepaths.append(str(tmp_path / dirname / "KABR20230101_000142_V06"))
+        shutil.copy(TEST_FILEPATH, filepaths[-1])
+    fs = fsspec.filesystem("file")
+    mocker.patch("radar_api.stream.iter_files", return_value=(filepath for filepath in filepaths))
+    mocker.patch("radar_api.stream.get_filesystem", return_value=fs)
+    spy_get = mocker.spy(fs, "get_file")
+    results = stream_datasets(
+        network="NEXRAD",
+        radar="KABR",
+        start_time="2023-01-01T00:00:00",
+        end_time="2023-01-01T01:00:00",
+        in_memory=False,
+        max_prefetch=2,
+    )
+    assert len(list(results)) == 2
+    local_filepaths = [call.args[1] for call in spy_get.call_args_list]
+    assert len(set(local_filepaths)) == 2
+    assert all(os.path.basename(fpath).endswith("KABR20230101_000142_V06") for fpath in local_filepaths)
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_stream_datasets_processes(base_dir, mocker, in_memory):
+    """Test stream_datasets decodes the fetched files with worker processes."""
+    filepaths = [
+        os.path.join(base_dir, "NEXRAD", "2023", "01", "01", f"{hour:02d}", "KABR", f"KABR20230101_{hour:02d}0142_V06")
+        for hour in range(2)
+    ]
+    fs = fsspec.filesystem("file")
+    mocker.patch("radar_api.stream.iter_files", return_value=(filepath for filepath in filepaths))
+    mocker.patch("radar_api.stream.get_filesystem", return_value=fs)
+    spy_remove = mocker.spy(os, "remove")
+    results = stream_datasets(
+        network="NEXRAD",
+        radar="KABR",
+        start_time="2023-01-01T00:00:00",
+        end_time="2023-01-01T02:00:00",
+        in_memory=in_memory,
+        max_prefetch=2,
+        n_processes=1,
+        encoding="float32",
+    )
+    dts = list(results)
+    assert len(dts) == 2
+    assert all(isinstance(dt, xr.DataTree) for dt in dts)
+    assert dts[0]["sweep_0"]["DBZH"].dtype == "float32"
+    # Check the temporary files are deleted once decoded
+    assert spy_remove.call_count == (0 if in_memory else 2)
+
+
+def test_stream_datasets_invalid_arguments():
+    """Test stream_datasets raise errors for invalid arguments."""
+    kwargs = {
+        "network": "NEXRAD",
+        "radar": "KABR",
+        "start_time": "2023-01-01T00:00:00",
+        "end_time": "2023-01-01T01:00:00",
+    }
+    with pytest.raises(ValueError):
+        next(stream_datasets(**kwargs, reader="dummy"))
+    with pytest.raises(ValueError):
+        next(stream_datasets(**kwargs, max_prefetch=0))
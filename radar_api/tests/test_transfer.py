@@ -0,0 +1,265 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module test the file transfer routines."""
+import asyncio
+import errno
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fsspec
+import pytest
+from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
+
+import radar_api.transfer
+from radar_api.transfer import (
+    TransferError,
+    async_transfer_file,
+    get_backoff_delay,
+    get_part_filepath,
+    is_retryable_error,
+    transfer_file,
+)
+
+DATA = bytes(range(256)) * 100
+
+
+@pytest.fixture
+def bucket_fpath(tmp_path):
+    """Return the filepath of a file mimicking a cloud bucket file."""
+    fpath = os.path.join(tmp_path, "bucket_file")
+    with open(fpath, "wb") as f:
+        f.write(DATA)
+    # Set a modification time in the past
+    os.utime(fpath, (time.time() - 3600, time.time() - 3600))
+    return fpath
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    """Disable the delay between retries."""
+    monkeypatch.setattr(radar_api.transfer, "get_backoff_delay", lambda attempt: 0)
+
+
+def _transfer_file(fs, bucket_fpath, local_fpath, n_retries=5):
+    """Run the sync or async file transfer depending on the filesystem."""
+    if getattr(fs, "async_impl", False):
+        return asyncio.run(async_transfer_file(fs, bucket_fpath, local_fpath, n_retries=n_retries))
+    return transfer_file(fs, bucket_fpath, local_fpath, n_retries=n_retries)
+
+
+def _read(fpath):
+    with open(fpath, "rb") as f:
+        return f.read()
+
+
+def test_get_backoff_delay():
+    """Test the exponential backoff delay with jitter."""
+    assert 0 <= get_backoff_delay(0, base=1, max_delay=30) <= 1
+    assert 0 <= get_backoff_delay(3, base=1, max_delay=30) <= 8
+    assert 0 <= get_backoff_delay(10, base=1, max_delay=30) <= 30
+
+
+def test_get_part_filepath():
+    """Test the temporary file of a transfer does not change across calls."""
+    assert get_part_filepath("local_file") == "local_file.part"
+    assert get_part_filepath("local_file") == get_part_filepath("local_file")
+
+
+def test_is_retryable_error():
+    """Test only transient network and server errors are retried."""
+    assert is_retryable_error(ConnectionError())
+    assert is_retryable_error(TimeoutError())
+    assert is_retryable_error(OSError("SlowDown"))
+    assert is_retryable_error(OSError(errno.EBUSY, "SlowDown"))
+    assert not is_retryable_error(FileNotFoundError())
+    assert not is_retryable_error(PermissionError())
+    assert not is_retryable_error(OSError(errno.ENOSPC, "No space left on device"))
+    assert not is_retryable_error(OSError(errno.EROFS, "Read-only file system"))
+    assert not is_retryable_error(RuntimeError())
+
+
+def _copy(rpath, lpath, n_bytes=-1):
+    with open(rpath, "rb") as f_src, open(lpath, "wb") as f_dst:
+        f_dst.write(f_src.read(n_bytes))
+
+
+def _mock_get_file(mocker, fs, side_effect):
+    """Patch the method downloading a file with a synchronous side effect ``side_effect(i, rpath, lpath)``."""
+    calls = []
+
+    def get_file(rpath, lpath, **kwargs):
+        calls.append(rpath)
+        return side_effect(len(calls) - 1, rpath, lpath)
+
+    async def async_get_file(rpath, lpath, **kwargs):
+        return get_file(rpath, lpath, **kwargs)
+
+    if getattr(fs, "async_impl", False):
+        return mocker.patch.object(fs, "_get_file", side_effect=async_get_file)
+    return mocker.patch.object(fs, "get_file", side_effect=get_file)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+class TestTransferFile:
+    """Test transfer_file and async_transfer_file."""
+
+    def _get_fs(self, asynchronous):
+        fs = fsspec.filesystem("file")
+        return AsyncFileSystemWrapper(fs) if asynchronous else fs
+
+    def test_transfer(self, tmp_path, bucket_fpath, asynchronous):
+        """Test the file is written through a temporary .part file."""
+        local_fpath = os.path.join(tmp_path, "local_file")
+        assert _transfer_file(self._get_fs(asynchronous), bucket_fpath, local_fpath) == local_fpath
+        assert _read(local_fpath) == DATA
+        assert sorted(os.listdir(tmp_path)) == ["bucket_file", "local_file"]
+
+    def test_resume(self, tmp_path, bucket_fpath, asynchronous, mocker):
+        """Test a transfer interrupted by a transient error is resumed from the .part file."""
+
+        def side_effect(i, rpath, lpath):
+            _copy(rpath, lpath, n_bytes=1000)
+            raise ConnectionError("connection reset")
+
+        fs = self._get_fs(asynchronous)
+        mock = _mock_get_file(mocker, fs, side_effect=side_effect)
+        spy = mocker.spy(fs, "_cat_file" if asynchronous else "cat_file")
+        local_fpath = os.path.join(tmp_path, "local_file")
+        _transfer_file(fs, bucket_fpath, local_fpath)
+        assert _read(local_fpath) == DATA
+        assert mock.call_count == 1
+        assert spy.call_args.kwargs["start"] == 1000
+
+    def test_resume_modified_file(self, tmp_path, bucket_fpath, asynchronous, mocker):
+        """Test the transfer restarts if the bucket file was modified since the transfer started."""
+
+        def side_effect(i, rpath, lpath):
+            if i > 0:
+                return _copy(rpath, lpath)
+            _copy(rpath, lpath, n_bytes=1000)
+            with open(bucket_fpath, "wb") as f:
+                f.write(DATA[::-1])
+            raise ConnectionError("connection reset")
+
+        fs = self._get_fs(asynchronous)
+        mock = _mock_get_file(mocker, fs, side_effect=side_effect)
+        local_fpath = os.path.join(tmp_path, "local_file")
+        _transfer_file(fs, bucket_fpath, local_fpath)
+        assert _read(local_fpath) == DATA[::-1]
+        assert mock.call_count == 2
+
+    def test_resume_later_call(self, tmp_path, bucket_fpath, asynchronous, mocker):
+        """Test a transfer left unfinished by a previous call is resumed and no temporary file remains."""
+
+        def side_effect(i, rpath, lpath):
+            _copy(rpath, lpath, n_bytes=1000)
+            raise ConnectionError("connection reset")
+
+        fs = self._get_fs(asynchronous)
+        local_fpath = os.path.join(tmp_path, "local_file")
+        mock = _mock_get_file(mocker, fs, side_effect=side_effect)
+        with pytest.raises(TransferError):
+            _transfer_file(fs, bucket_fpath, local_fpath, n_retries=0)
+        assert sorted(os.listdir(tmp_path)) == ["bucket_file", "local_file.part", "local_file.part.json"]
+
+        # Mimic the lock file of a killed process and the uniquely named temporary file of an older version
+        for filename in ["local_file.part.lock", f"local_file.{'a' * 32}.part"]:
+            with open(os.path.join(tmp_path, filename), "wb") as f:
+                f.write(b"0")
+
+        mocker.stop(mock)
+        spy = mocker.spy(fs, "_cat_file" if asynchronous else "cat_file")
+        _transfer_file(fs, bucket_fpath, local_fpath)
+        assert _read(local_fpath) == DATA
+        assert spy.call_args_list[0].kwargs["start"] == 1000
+        assert sorted(os.listdir(tmp_path)) == ["bucket_file", "local_file"]
+
+    def test_concurrent_transfers(self, tmp_path, bucket_fpath, asynchronous):
+        """Test concurrent transfers of the same file do not interfere."""
+        fs = self._get_fs(asynchronous)
+        local_fpath = os.path.join(tmp_path, "local_file")
+        if asynchronous:
+
+            async def _transfer_files():
+                tasks = [async_transfer_file(fs, bucket_fpath, local_fpath) for _ in range(4)]
+                return await asyncio.gather(*tasks)
+
+            results = asyncio.run(_transfer_files())
+        else:
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(lambda _: transfer_file(fs, bucket_fpath, local_fpath), range(4)))
+        assert results == [local_fpath] * 4
+        assert _read(local_fpath) == DATA
+        assert sorted(os.listdir(tmp_path)) == ["bucket_file", "local_file"]
+
+    def test_retry(self, tmp_path, bucket_fpath, asynchronous, mocker):
+        """Test transient errors are retried."""
+
+        def side_effect(i, rpath, lpath):
+            if i < 2:
+                raise ConnectionError("connection reset")
+            return _copy(rpath, lpath)
+
+        fs = self._get_fs(asynchronous)
+        mock = _mock_get_file(mocker, fs, side_effect=side_effect)
+        local_fpath = os.path.join(tmp_path, "local_file")
+        _transfer_file(fs, bucket_fpath, local_fpath)
+        assert _read(local_fpath) == DATA
+        assert mock.call_count == 3
+
+        # Check the error is raised after all retries
+        mock = _mock_get_file(mocker, fs, side_effect=lambda i, rpath, lpath: side_effect(0, rpath, lpath))
+        with pytest.raises(TransferError) as excinfo:
+            _transfer_file(fs, bucket_fpath, local_fpath, n_retries=2)
+        assert excinfo.value.n_attempts == 3
+        assert excinfo.value.to_dict()["error_type"] == "ConnectionError"
+
+    def test_local_storage_error(self, tmp_path, bucket_fpath, asynchronous, mocker):
+        """Test errors of the local storage are not retried and the temporary files are removed."""
+
+        def side_effect(i, rpath, lpath):
+            _copy(rpath, lpath, n_bytes=1000)
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        fs = self._get_fs(asynchronous)
+        mock = _mock_get_file(mocker, fs, side_effect=side_effect)
+        local_fpath = os.path.join(tmp_path, "local_file")
+        with pytest.raises(TransferError) as excinfo:
+            _transfer_file(fs, bucket_fpath, local_fpath)
+        assert excinfo.value.n_attempts == 1
+        assert mock.call_count == 1
+        assert sorted(os.listdir(tmp_path)) == ["bucket_file"]
+
+    def test_non_retryable_error(self, tmp_path, asynchronous):
+        """Test non transient errors are not retried."""
+        local_fpath = os.path.join(tmp_path, "local_file")
+        with pytest.raises(TransferError) as excinfo:
+            _transfer_file(self._get_fs(asynchronous), os.path.join(tmp_path, "missing"), local_fpath)
+        assert excinfo.value.n_attempts == 1
+        assert isinstance(excinfo.value.error, FileNotFoundError)
+        assert not os.path.exists(local_fpath)
@@ -26,6 +26,7 @@
 # -----------------------------------------------------------------------------.
 """Tests for geospatial radar utility helpers."""
 
+import pandas as pd
 import pytest
 
 from radar_api.utilities import (
@@ -118,3 +119,12 @@ def test_available_radars_within_extent_invalid_extent():
     """Test extent with invalid latitude ordering is rejected."""
     with pytest.raises(ValueError, match="lat_min <= lat_max"):
         available_radars_within_extent(extent=(-10, 10, 5, -5))
+
+
+def test_read_database_without_snapshot(monkeypatch):
+    """Test read_database reads the radar configuration files if the snapshot is unavailable."""
+    import radar_api.utilities
+
+    db = read_database(network="FMI")
+    monkeypatch.setattr(radar_api.utilities, "load_database_snapshot", lambda network: None)
+    pd.testing.assert_frame_equal(read_database(network="FMI"), db)
@@ -0,0 +1,132 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module test the precompiled filename pattern parsers."""
+import datetime
+
+import pytest
+from trollsift import Parser
+
+from radar_api.utils.patterns import (
+    FilenameParser,
+    FilenamePattern,
+    get_datetime_converter,
+    get_field_converter,
+)
+
+
+@pytest.mark.parametrize(
+    ("format_spec", "string"),
+    [
+        ("%Y%m%d_%H%M%S", "20100101_000618"),
+        ("%Y%m%d%H%M", "202101010100"),
+        ("%y%m%d%H%M%S", "240201135316"),
+        ("%Y%m%d-%H%M%S", "20240202-105624"),
+        ("%y%j%H%M", "230011234"),
+        ("%y%j%H%M", "233660000"),
+        ("%y%j%H%M", "991231234"),
+        ("%Y-%b-%d", "2023-Jan-01"),
+    ],
+)
+def test_get_datetime_converter(format_spec, string):
+    """Test get_datetime_converter is consistent with datetime.strptime."""
+    converter = get_datetime_converter(format_spec)
+    assert converter(string) == datetime.datetime.strptime(string, format_spec)
+
+
+def test_get_datetime_converter_invalid_values():
+    """Test get_datetime_converter raises ValueError for invalid dates."""
+    with pytest.raises(ValueError):
+        get_datetime_converter("%Y%m%d")("20231301")
+    with pytest.raises(ValueError):
+        get_datetime_converter("%y%j")("23367")
+
+
+def test_get_field_converter():
+    """Test get_field_converter returns typed values."""
+    assert get_field_converter("s") is None
+    assert get_field_converter("4s") is None
+    assert get_field_converter("03d")("012") == 12
+    assert get_field_converter("x")("ff") == 255
+    assert get_field_converter("5.2f")("12.50") == 12.5
+    assert get_field_converter("_>5s")("__abc") == "abc"
+
+
+@pytest.mark.parametrize(
+    ("pattern", "filename"),
+    [
+        ("{radar_acronym:4s}{start_time:%Y%m%d_%H%M%S}_V0{version:1s}", "KABR20100101_000618_V06"),
+        ("{start_time:%Y%m%d%H%M}_{radar_acronym:s}_{volume_identifier:s}.{extension:s}", "202101010100_fiika_PVOL.h5"),
+        ("{radar_acronym:3s}{start_time:%y%j%H%M}0U.{volume_identifier:3s}", "MLA2300100000U.001"),
+        ("{name}_{number:03d}_{value:4.1f}", "file_012_12.5"),
+    ],
+)
+def test_filename_pattern_consistent_with_trollsift(pattern, filename):
+    """Test FilenamePattern.parse returns the same results of trollsift."""
+    assert FilenamePattern(pattern).parse(filename) == Parser(pattern).parse(filename)
+
+
+def test_filename_pattern_no_match():
+    """Test FilenamePattern.parse returns None if the filename does not match."""
+    pattern = FilenamePattern("{radar_acronym:4s}{start_time:%Y%m%d_%H%M%S}_V0{version:1s}")
+    assert pattern.keys() == ["radar_acronym", "start_time", "version"]
+    assert pattern.parse("invalid_filename") is None
+    # Matching the regex but invalid datetime
+    assert pattern.parse("KABR20101301_000618_V06") is None
+
+
+def test_filename_parser():
+    """Test FilenameParser uses the first matching pattern."""
+    parser = FilenameParser(
+        [
+            "{radar_acronym:4s}{start_time:%Y%m%d_%H%M%S}_V0{version:1s}",
+            "{radar_acronym:4s}{start_time:%Y%m%d_%H%M%S}_V0{version:1s}.{extension:2s}",
+        ],
+    )
+    assert parser.parse("KABR20100101_000618_V06") == {
+        "radar_acronym": "KABR",
+        "start_time": datetime.datetime(2010, 1, 1, 0, 6, 18),
+        "version": "6",
+    }
+    assert parser.parse("KABR20100101_000618_V06.gz")["extension"] == "gz"
+    assert parser.parse("invalid_filename") == {}
+
+    # Test a single pattern can be specified as a string
+    assert len(FilenameParser("{name}.{extension}").patterns) == 1
+
+
+def test_filename_pattern_extract():
+    """Test FilenamePattern.extract returns the fields values of multiple filenames."""
+    pattern = FilenamePattern("{radar_acronym:4s}{start_time:%Y%m%d_%H%M%S}_V0{version:1s}")
+    is_matched, dict_values = pattern.extract(["KABR20100101_000618_V06", "invalid", "", "KFSX19960701_044028_V03"])
+    assert is_matched.tolist() == [True, False, False, True]
+    assert dict_values["radar_acronym"].tolist() == ["KABR", "", "", "KFSX"]
+    assert dict_values["start_time"].tolist() == ["20100101_000618", "", "", "19960701_044028"]
+
+    # Test empty list
+    is_matched, dict_values = pattern.extract([])
+    assert len(is_matched) == 0
+    assert len(dict_values["version"]) == 0
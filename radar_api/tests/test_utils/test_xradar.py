@@ -0,0 +1,125 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module test the xradar utilities."""
+import types
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from radar_api.utils.xradar import get_mch_datatree_from_pyart, get_nexrad_datatree_from_pyart
+
+
+def _create_radar_obj(sweep_numbers, nrays_per_sweep=4, ngates=5):
+    """Create an object mimicking a pyart.Radar object."""
+    n_sweeps = len(sweep_numbers)
+    nrays = n_sweeps * nrays_per_sweep
+    data = np.arange(nrays * ngates, dtype="float32").reshape(nrays, ngates)
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[0, 0] = True
+    return types.SimpleNamespace(
+        fields={
+            "reflectivity": {
+                "data": np.ma.MaskedArray(data, mask=mask),
+                "units": "dBZ",
+                "_FillValue": -9999.0,
+                "coordinates": "elevation azimuth range",
+            },
+            "velocity": {"data": np.ma.MaskedArray(np.ones((nrays, ngates), dtype="int16")), "units": "m/s"},
+        },
+        time={"data": np.arange(nrays, dtype="float64"), "units": "seconds since 2023-01-01T00:00:00Z"},
+        range={"data": np.arange(ngates, dtype="float32") * 250, "units": "meters"},
+        azimuth={"data": np.tile(np.arange(nrays_per_sweep, dtype="float32") * 90, n_sweeps), "units": "degrees"},
+        elevation={"data": np.repeat(np.arange(n_sweeps, dtype="float32") + 0.5, nrays_per_sweep), "units": "degrees"},
+        sweep_number={"data": np.array(sweep_numbers)},
+        sweep_start_ray_index={"data": np.arange(n_sweeps) * nrays_per_sweep},
+        sweep_end_ray_index={"data": np.arange(1, n_sweeps + 1) * nrays_per_sweep - 1},
+        sweep_mode={"data": np.array(["azimuth_surveillance"] * n_sweeps)},
+        fixed_angle={"data": np.arange(n_sweeps, dtype="float32") + 0.5},
+        latitude={"data": np.array([45.0])},
+        longitude={"data": np.array([9.0])},
+        altitude={"data": np.array([100.0])},
+    )
+
+
+def test_get_nexrad_datatree_from_pyart():
+    """Test the conversion of a multi-sweep pyart object to a DataTree."""
+    radar_obj = _create_radar_obj(sweep_numbers=[0, 1, 2])
+    field_data = radar_obj.fields["reflectivity"]["data"].data
+    dt = get_nexrad_datatree_from_pyart(radar_obj)
+    assert list(dt.children) == ["sweep_0", "sweep_1", "sweep_2"]
+    assert float(dt["latitude"]) == 45.0
+
+    ds = dt["sweep_1"].to_dataset()
+    assert set(ds.data_vars) == {"DBZH", "VRADH"}
+    assert ds["DBZH"].dims == ("azimuth", "range")
+    assert ds.sizes == {"azimuth": 4, "range": 5}
+    np.testing.assert_equal(ds["DBZH"].values, field_data[4:8])
+    np.testing.assert_equal(ds["azimuth"].values, [0, 90, 180, 270])
+    assert ds["DBZH"].attrs == {"units": "dBZ"}
+    assert ds["VRADH"].dtype == np.float64
+    assert int(ds["sweep_number"]) == 1
+    assert float(ds["sweep_fixed_angle"]) == 1.5
+    assert ds["time"].values[0] == np.datetime64("2023-01-01T00:00:04")
+
+    # Check masked values are set to NaN
+    assert np.isnan(dt["sweep_0"]["DBZH"].values[0, 0])
+
+    # Check sweep variables are views of the pyart fields
+    assert np.shares_memory(dt["sweep_2"]["DBZH"].values, field_data)
+
+
+def test_get_mch_datatree_from_pyart():
+    """Test the conversion of a single-sweep pyart object keeps the sweep number."""
+    radar_obj = _create_radar_obj(sweep_numbers=[7])
+    dt = get_mch_datatree_from_pyart(radar_obj)
+    assert list(dt.children) == ["sweep_7"]
+    assert dt["sweep_7"].sizes["azimuth"] == 4
+    assert isinstance(dt["sweep_7"]["DBZH"], xr.DataArray)
+
+
+@pytest.mark.parametrize("n_sweeps", [1, 14])
+def test_sweeps_share_range(n_sweeps):
+    """Test the range coordinate is shared across sweeps."""
+    radar_obj = _create_radar_obj(sweep_numbers=list(range(n_sweeps)))
+    dt = get_nexrad_datatree_from_pyart(radar_obj)
+    assert len(dt.children) == n_sweeps
+    range_values = dt["sweep_0"]["range"].values
+    for sweep in dt.children:
+        assert np.shares_memory(dt[sweep]["range"].values, range_values)
+
+
+@pytest.mark.parametrize("encoding", ["float32", "packed"])
+def test_datatree_from_pyart_float32(encoding):
+    """Test the fields are converted to float32 with the encoding options."""
+    radar_obj = _create_radar_obj(sweep_numbers=[0, 1])
+    field_data = radar_obj.fields["reflectivity"]["data"].data
+    dt = get_nexrad_datatree_from_pyart(radar_obj, encoding=encoding)
+    assert dt["sweep_0"]["DBZH"].dtype == np.float32
+    assert dt["sweep_0"]["VRADH"].dtype == np.float32
+    # Check float32 fields are not copied
+    assert np.shares_memory(dt["sweep_1"]["DBZH"].values, field_data)
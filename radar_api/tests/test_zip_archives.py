@@ -0,0 +1,190 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Test the direct reads of files archived within zip files."""
+
+import contextlib
+import io
+import os
+import shutil
+import zipfile
+
+import fsspec
+import pytest
+
+from radar_api.readers import _open_file, _prepare_file, open_pyart
+from radar_api.search import list_directories
+from radar_api.zip_archives import (
+    ZipMemberView,
+    clear_zip_indexes,
+    get_zip_index,
+    list_zip_members,
+    open_zip_member,
+    split_zip_member_path,
+)
+
+STORED_CONTENT = bytes(range(256)) * 10
+DEFLATED_CONTENT = b"radar" * 1000
+
+
+@pytest.fixture
+def zip_filepath(tmp_path):
+    """Create a zip file with an uncompressed and a compressed member."""
+    zip_filepath = str(tmp_path / "MLA23001.zip")
+    with zipfile.ZipFile(zip_filepath, "w") as zf:
+        zf.writestr("PHA2300100000U.001", STORED_CONTENT, compress_type=zipfile.ZIP_STORED)
+        zf.writestr("PHA2300100050U.001", DEFLATED_CONTENT, compress_type=zipfile.ZIP_DEFLATED)
+    clear_zip_indexes()
+    return zip_filepath
+
+
+def test_split_zip_member_path(zip_filepath, tmp_path):
+    """Test split_zip_member_path only splits the paths within existing zip files."""
+    assert split_zip_member_path(os.path.join(zip_filepath, "PHA2300100000U.001")) == (
+        zip_filepath,
+        "PHA2300100000U.001",
+    )
+    assert split_zip_member_path(zip_filepath) is None
+    assert split_zip_member_path("/data/MLA23001.zip/PHA2300100000U.001") is None
+    assert split_zip_member_path("/data/PHA2300100000U.001") is None
+    assert split_zip_member_path(b"content") is None
+
+    # Check directories and files named *.zip which are not zip files
+    dir_path = tmp_path / "foo.zip"
+    dir_path.mkdir()
+    (dir_path / "bar.zip").write_bytes(b"not a zip file")
+    assert split_zip_member_path(str(dir_path / "bar.h5")) is None
+    assert split_zip_member_path(str(dir_path / "bar.zip" / "member")) is None
+
+    # Check zip files within directories named *.zip
+    nested_zip_filepath = str(dir_path / "MLA23001.zip")
+    shutil.copy(zip_filepath, nested_zip_filepath)
+    assert split_zip_member_path(os.path.join(nested_zip_filepath, "PHA2300100000U.001")) == (
+        nested_zip_filepath,
+        "PHA2300100000U.001",
+    )
+
+
+def test_get_zip_index_cache(zip_filepath, mocker):
+    """Test the zip central directory is read once until the zip file is modified."""
+    spy = mocker.spy(zipfile.ZipFile, "infolist")
+    zip_index = get_zip_index(zip_filepath)
+    assert list(zip_index.members) == ["PHA2300100000U.001", "PHA2300100050U.001"]
+    assert get_zip_index(zip_filepath) is zip_index
+    assert spy.call_count == 1
+
+    # Check the central directory is read again if the zip file is modified
+    with zipfile.ZipFile(zip_filepath, "a") as zf:
+        zf.writestr("PHA2300100100U.001", b"new")
+    os.utime(zip_filepath, ns=(0, zip_index.mtime_ns + 10**9))
+    assert len(get_zip_index(zip_filepath).members) == 3
+    assert spy.call_count == 2
+
+
+def test_list_zip_members(zip_filepath):
+    """Test list_zip_members returns the member paths and sizes."""
+    filepaths = list_zip_members(zip_filepath)
+    assert filepaths == [
+        os.path.join(zip_filepath, "PHA2300100000U.001"),
+        os.path.join(zip_filepath, "PHA2300100050U.001"),
+    ]
+    infos = list_zip_members(zip_filepath, detail=True)
+    assert [info["size"] for info in infos] == [len(STORED_CONTENT), len(DEFLATED_CONTENT)]
+
+    # Check the directory listing of zip files
+    fs = fsspec.filesystem("file")
+    assert list_directories(fs=fs, dir_paths=[zip_filepath]) == [filepaths]
+
+
+def test_open_stored_member(zip_filepath):
+    """Test uncompressed members are opened through a seekable memory-mapped view."""
+    with open_zip_member(os.path.join(zip_filepath, "PHA2300100000U.001")) as f:
+        assert isinstance(f, ZipMemberView)
+        assert f.read(10) == STORED_CONTENT[:10]
+        assert f.tell() == 10
+        f.seek(-5, io.SEEK_END)
+        assert f.read() == STORED_CONTENT[-5:]
+        f.seek(100)
+        assert f.read(3) == STORED_CONTENT[100:103]
+        assert bytes(f.getbuffer()) == STORED_CONTENT
+        f.seek(0)
+        assert f.read() == STORED_CONTENT
+
+
+def test_open_deflated_member(zip_filepath):
+    """Test compressed members are decompressed on the fly."""
+    with open_zip_member(os.path.join(zip_filepath, "PHA2300100050U.001")) as f:
+        assert f.seekable()
+        assert f.read(5) == b"radar"
+        f.seek(0)
+        assert f.read() == DEFLATED_CONTENT
+
+
+def test_open_missing_member(zip_filepath):
+    """Test opening a missing member raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        open_zip_member(os.path.join(zip_filepath, "missing"))
+
+
+def test_prepare_zip_member(zip_filepath, mocker):
+    """Test the readers open zip members from memory and close the zip file."""
+    filepath = os.path.join(zip_filepath, "PHA2300100000U.001")
+    spy = mocker.spy(ZipMemberView, "close")
+    with contextlib.ExitStack() as stack:
+        f = _prepare_file(filepath, stack, network="MCH_CSCS", engine="odim")
+        assert isinstance(f, io.BytesIO)
+        assert f.read() == STORED_CONTENT
+        assert _prepare_file(filepath, stack, network="MCH_CSCS", engine="nexradlevel2") == STORED_CONTENT
+    assert spy.call_count >= 2
+
+
+def test_open_zip_member_with_filepath_reader(zip_filepath):
+    """Test zip members are extracted with their filename for the readers requiring a filepath."""
+    filepath = os.path.join(zip_filepath, "PHA2300100050U.001")
+
+    def reader(filename):
+        assert os.path.basename(filename) == "PHA2300100050U.001"
+        with open(filename, "rb") as f:
+            assert f.read() == DEFLATED_CONTENT
+        return filename
+
+    tmp_filepath = _open_file(reader, filepath, network="MCH_CSCS")
+    assert not os.path.exists(os.path.dirname(tmp_filepath))
+
+
+def test_open_pyart_zip_member(zip_filepath, mocker):
+    """Test open_pyart reads zip members with the pyart readers requiring a filepath."""
+    pytest.importorskip("pyart")
+
+    def read_metranet(filename, **kwargs):
+        # Mimic read_metranet, which infers the product from the filename
+        assert os.path.basename(filename).startswith("PHA")
+        with open(filename, "rb") as f:
+            return f.read()
+
+    mocker.patch("radar_api.readers.get_pyart_reader", return_value=read_metranet)
+    filepath = os.path.join(zip_filepath, "PHA2300100000U.001")
+    assert open_pyart(filepath, network="MCH_CSCS") == STORED_CONTENT
@@ -0,0 +1,411 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides a robust transfer layer to download files from cloud buckets.
+
+Files are first written to a temporary ``<filename>.part`` file, which is atomically
+renamed to the final filepath once the transfer succeeds. The version of the bucket file
+(i.e. size, ETag and modification time) is recorded in a ``<filename>.part.json`` sidecar file,
+and concurrent transfers of the same file are serialized by an exclusive lock on a
+``<filename>.part.lock`` file.
+Transient errors (i.e. throttling, server or connection errors) are retried with
+exponential backoff and jitter, while errors of the local storage (i.e. no space left
+on device) are raised immediately. When a ``.part`` file is left by a previous attempt,
+by a previous call or by a killed process, the transfer is resumed with range requests
+from the current size of the ``.part`` file, provided that the bucket file version
+matches the recorded one.
+"""
+import asyncio
+import contextlib
+import datetime
+import errno
+import glob
+import json
+import os
+import random
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+PART_SUFFIX = ".part"
+VERSION_SUFFIX = ".part.json"
+LOCK_SUFFIX = ".part.lock"
+
+# Suffixes of the temporary files of ongoing or interrupted transfers
+TEMPORARY_SUFFIXES = (PART_SUFFIX, VERSION_SUFFIX, LOCK_SUFFIX)
+
+# Parameters of the exponential backoff (in seconds)
+_RETRY_BACKOFF_BASE = 0.5
+_RETRY_BACKOFF_MAX = 30
+
+# Interval between attempts to acquire the lock of a file transferred by another call (in seconds)
+_LOCK_POLL_INTERVAL = 0.1
+
+# Size of the range requests used to resume interrupted transfers (in bytes)
+_RESUME_CHUNK_SIZE = 8 * 2**20
+
+# Errors which are not solved by retrying the transfer
+_NON_RETRYABLE_ERRORS = (
+    FileNotFoundError,
+    PermissionError,
+    IsADirectoryError,
+    NotADirectoryError,
+    NotImplementedError,
+    ValueError,
+    TypeError,
+)
+
+# Error numbers of OSError raised by transient server errors.
+# s3fs translates the server errors (i.e. 5xx and throttling) into OSError with these error numbers.
+_RETRYABLE_ERRNOS = {
+    errno.EIO,
+    errno.EBUSY,
+    errno.EAGAIN,
+    errno.ETIMEDOUT,
+    errno.ECONNRESET,
+    errno.ECONNABORTED,
+    getattr(errno, "EREMOTEIO", errno.EIO),
+}
+
+# Root modules of the network libraries whose errors are transient
+_NETWORK_ERROR_MODULES = ("aiohttp", "aiobotocore", "botocore", "urllib3", "requests", "http")
+
+
+class TransferError(Exception):
+    """Error raised when a file can not be transferred."""
+
+    def __init__(self, bucket_fpath, local_fpath, error, n_attempts):
+        self.bucket_fpath = bucket_fpath
+        self.local_fpath = local_fpath
+        self.error = error
+        self.n_attempts = n_attempts
+        super().__init__(f"Unable to download {bucket_fpath} after {n_attempts} attempt(s): {error!r}")
+
+    def to_dict(self):
+        """Return a dictionary describing the failed transfer."""
+        return {
+            "bucket_fpath": self.bucket_fpath,
+            "local_fpath": self.local_fpath,
+            "error_type": type(self.error).__name__,
+            "error_message": str(self.error),
+            "n_attempts": self.n_attempts,
+        }
+
+
+def get_part_filepath(local_fpath):
+    """Return the filepath of the temporary file of a transfer."""
+    return f"{local_fpath}{PART_SUFFIX}"
+
+
+def get_version_filepath(local_fpath):
+    """Return the filepath of the sidecar file recording the bucket file version of a transfer."""
+    return f"{local_fpath}{VERSION_SUFFIX}"
+
+
+def get_lock_filepath(local_fpath):
+    """Return the filepath of the lock file of a transfer."""
+    return f"{local_fpath}{LOCK_SUFFIX}"
+
+
+def _is_network_error(error):
+    """Return True if the error is raised by a network library on a connection or server error."""
+    # botocore ClientError: retry server errors and throttling only
+    response = getattr(error, "response", None)
+    if isinstance(response, dict) and "Error" in response:
+        status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        code = response["Error"].get("Code")
+        return (status_code is not None and status_code >= 500) or status_code == 429 or code == "SlowDown"
+    return any(cls.__module__.split(".")[0] in _NETWORK_ERROR_MODULES for cls in type(error).__mro__)
+
+
+def is_retryable_error(error):
+    """Return True if the transfer error is likely transient (i.e. throttling, server or connection errors)."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    if isinstance(error, _NON_RETRYABLE_ERRORS):
+        return False
+    if isinstance(error, OSError):
+        # Errors of the local storage (i.e. ENOSPC, EACCES) are not retried
+        return error.errno is None or error.errno in _RETRYABLE_ERRNOS
+    return _is_network_error(error)
+
+
+def get_backoff_delay(attempt, base=_RETRY_BACKOFF_BASE, max_delay=_RETRY_BACKOFF_MAX):
+    """Return the delay (in seconds) before the next attempt using exponential backoff with full jitter."""
+    return random.uniform(0, min(max_delay, base * 2**attempt))
+
+
+def _get_part_size(part_fpath):
+    """Return the size of the temporary file (0 if it does not exist)."""
+    try:
+        return os.path.getsize(part_fpath)
+    except OSError:
+        return 0
+
+
+def _remove_file(fpath):
+    with contextlib.suppress(OSError):
+        os.remove(fpath)
+
+
+def _remove_temporary_files(local_fpath):
+    """Remove the temporary files of the transfers of a file, including the stale uniquely named ones."""
+    _remove_file(get_part_filepath(local_fpath))
+    _remove_file(get_version_filepath(local_fpath))
+    for fpath in glob.glob(f"{glob.escape(local_fpath)}.{'[0-9a-f]' * 32}{PART_SUFFIX}"):
+        _remove_file(fpath)
+
+
+def _lock_file(fd):
+    """Try to lock an open file without blocking. Return True if the lock is acquired."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _try_acquire_lock(lock_fpath):
+    """Try to acquire the lock of a transfer.
+
+    Return the file descriptor of the lock file, or None if the lock is held by another transfer.
+    The lock is released by the operating system if the process is killed.
+    """
+    fd = os.open(lock_fpath, os.O_CREAT | os.O_RDWR)
+    if _lock_file(fd):
+        # Check the lock file has not been removed by the previous lock holder in the meantime
+        with contextlib.suppress(OSError):
+            if os.path.samestat(os.fstat(fd), os.stat(lock_fpath)):
+                return fd
+    os.close(fd)
+    return None
+
+
+def _acquire_lock(lock_fpath):
+    fd = _try_acquire_lock(lock_fpath)
+    while fd is None:
+        time.sleep(_LOCK_POLL_INTERVAL)
+        fd = _try_acquire_lock(lock_fpath)
+    return fd
+
+
+async def _async_acquire_lock(lock_fpath):
+    fd = _try_acquire_lock(lock_fpath)
+    while fd is None:
+        await asyncio.sleep(_LOCK_POLL_INTERVAL)
+        fd = _try_acquire_lock(lock_fpath)
+    return fd
+
+
+def _release_lock(fd, lock_fpath):
+    # The lock file is removed before being unlocked, so that waiting transfers do not lock a removed file
+    _remove_file(lock_fpath)
+    os.close(fd)
+
+
+def _get_modification_time(info):
+    """Return the POSIX timestamp of the last modification of a bucket file, or None if unknown."""
+    mtime = info.get("LastModified", info.get("mtime"))
+    if isinstance(mtime, datetime.datetime):
+        return mtime.timestamp()
+    if isinstance(mtime, (int, float)):
+        return float(mtime)
+    return None
+
+
+def _get_file_version(info):
+    """Return the (size, ETag, modification time) tuple identifying the version of a bucket file."""
+    return (info["size"], info.get("ETag", info.get("etag")), _get_modification_time(info))
+
+
+def _write_version(version_fpath, version):
+    with open(version_fpath, "w") as f:
+        json.dump(version, f)
+
+
+def _read_version(version_fpath):
+    """Return the bucket file version recorded by a previous transfer, or None if unavailable."""
+    try:
+        with open(version_fpath) as f:
+            return tuple(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _get_resume_offset(part_fpath, version_fpath, version):
+    """Return the offset from which the transfer can be resumed, or 0 if it must restart from scratch.
+
+    A partial transfer is resumed only if the bucket file version matches the version
+    recorded when the transfer started.
+    """
+    offset = _get_part_size(part_fpath)
+    if offset > version[0] or _read_version(version_fpath) != version:
+        return 0
+    return offset
+
+
+def _resume_file(fs, bucket_fpath, part_fpath, offset, size):
+    """Resume the transfer of a file from the given offset using range requests."""
+    with open(part_fpath, "r+b") as f_dst:
+        f_dst.truncate(offset)
+        f_dst.seek(offset)
+        while offset < size:
+            end = min(offset + _RESUME_CHUNK_SIZE, size)
+            f_dst.write(fs.cat_file(bucket_fpath, start=offset, end=end))
+            offset = end
+
+
+def _download_file(fs, bucket_fpath, local_fpath):
+    """Download a file, resuming the partial transfer left by a previous attempt if possible."""
+    part_fpath = get_part_filepath(local_fpath)
+    version_fpath = get_version_filepath(local_fpath)
+    # Retrieve the current bucket file version when resuming (and not the cached one)
+    if os.path.exists(part_fpath):
+        fs.invalidate_cache(bucket_fpath)
+    version = _get_file_version(fs.info(bucket_fpath))
+    offset = _get_resume_offset(part_fpath, version_fpath, version=version)
+    if offset > 0:
+        _resume_file(fs, bucket_fpath=bucket_fpath, part_fpath=part_fpath, offset=offset, size=version[0])
+    else:
+        _write_version(version_fpath, version)
+        fs.get_file(bucket_fpath, part_fpath)
+    os.replace(part_fpath, local_fpath)
+
+
+def transfer_file(fs, bucket_fpath, local_fpath, n_retries=5):
+    """
+    Download a file from a cloud bucket to local storage.
+
+    Parameters
+    ----------
+    fs : fsspec.FileSystem
+        fsspec filesystem instance.
+    bucket_fpath : str
+        Filepath on the cloud bucket.
+    local_fpath : str
+        Filepath where to save the file on local storage.
+    n_retries : int, optional
+        Maximum number of retries on transient errors. The default is 5.
+        If all retries fail, the temporary ``.part`` file is kept and the transfer
+        is resumed by the next call.
+
+    Returns
+    -------
+    str
+        The local filepath.
+
+    Raises
+    ------
+    TransferError
+        If the file can not be downloaded.
+    """
+    lock_fpath = get_lock_filepath(local_fpath)
+    fd = _acquire_lock(lock_fpath)
+    try:
+        attempt = 0
+        while True:
+            try:
+                _download_file(fs, bucket_fpath=bucket_fpath, local_fpath=local_fpath)
+                _remove_temporary_files(local_fpath)
+                return local_fpath
+            except Exception as e:
+                is_retryable = is_retryable_error(e)
+                if attempt >= n_retries or not is_retryable:
+                    if not is_retryable:
+                        _remove_temporary_files(local_fpath)
+                    raise TransferError(bucket_fpath, local_fpath, error=e, n_attempts=attempt + 1) from e
+                time.sleep(get_backoff_delay(attempt))
+                attempt += 1
+    finally:
+        _release_lock(fd, lock_fpath)
+
+
+async def _async_resume_file(fs, bucket_fpath, part_fpath, offset, size):
+    """Resume the transfer of a file from the given offset using range requests coroutines.
+
+    The writes to local storage run in a thread, so that they do not block the event loop.
+    """
+    f_dst = await asyncio.to_thread(open, part_fpath, "r+b")
+    try:
+        await asyncio.to_thread(f_dst.truncate, offset)
+        f_dst.seek(offset)
+        while offset < size:
+            end = min(offset + _RESUME_CHUNK_SIZE, size)
+            data = await fs._cat_file(bucket_fpath, start=offset, end=end)
+            await asyncio.to_thread(f_dst.write, data)
+            offset = end
+    finally:
+        await asyncio.to_thread(f_dst.close)
+
+
+async def _async_download_file(fs, bucket_fpath, local_fpath):
+    """Download a file with the filesystem coroutines, resuming the partial transfer if possible."""
+    part_fpath = get_part_filepath(local_fpath)
+    version_fpath = get_version_filepath(local_fpath)
+    if os.path.exists(part_fpath):
+        fs.invalidate_cache(bucket_fpath)
+    version = _get_file_version(await fs._info(bucket_fpath))
+    offset = _get_resume_offset(part_fpath, version_fpath, version=version)
+    if offset > 0:
+        await _async_resume_file(fs, bucket_fpath=bucket_fpath, part_fpath=part_fpath, offset=offset, size=version[0])
+    else:
+        _write_version(version_fpath, version)
+        await fs._get_file(bucket_fpath, part_fpath)
+    os.replace(part_fpath, local_fpath)
+
+
+async def async_transfer_file(fs, bucket_fpath, local_fpath, n_retries=5):
+    """
+    Download a file from a cloud bucket to local storage using the filesystem coroutines.
+
+    See :py:func:`transfer_file` for the description of the arguments.
+    """
+    lock_fpath = get_lock_filepath(local_fpath)
+    fd = await _async_acquire_lock(lock_fpath)
+    try:
+        attempt = 0
+        while True:
+            try:
+                await _async_download_file(fs, bucket_fpath=bucket_fpath, local_fpath=local_fpath)
+                _remove_temporary_files(local_fpath)
+                return local_fpath
+            except Exception as e:
+                is_retryable = is_retryable_error(e)
+                if attempt >= n_retries or not is_retryable:
+                    if not is_retryable:
+                        _remove_temporary_files(local_fpath)
+                    raise TransferError(bucket_fpath, local_fpath, error=e, n_attempts=attempt + 1) from e
+                await asyncio.sleep(get_backoff_delay(attempt))
+                attempt += 1
+    finally:
+        _release_lock(fd, lock_fpath)
@@ -27,7 +27,8 @@
 import numpy as np
 import pandas as pd
 
-from radar_api.io import available_networks, available_radars, get_radar_info
+from radar_api.checks import check_network
+from radar_api.database import load_database_snapshot, read_database_from_yaml
 
 
 def _normalize_point(point):
@@ -111,22 +112,21 @@ def read_database(network=None):
         DataFrame with one row per radar. Columns are the union of the keys
         available across the radar configuration files, plus ``network`` and
         ``radar``.
+
+    Notes
+    -----
+    The radar metadata are loaded from a precompiled snapshot of the radar
+    configuration files. If the snapshot is missing or out of date, the
+    radar configuration files are read instead.
     """
-    networks = available_networks() if network is None else [network]
-
-    records = []
-    for current_network in networks:
-        for radar in available_radars(network=current_network):
-            record = {
-                "network": current_network,
-                "radar": radar,
-            }
-            record.update(get_radar_info(network=current_network, radar=radar))
-            records.append(record)
-
-    if len(records) == 0:
-        return pd.DataFrame(columns=["network", "radar"])
-    return pd.DataFrame.from_records(records)
+    if network is not None:
+        network = check_network(network)
+    # Load the precompiled database snapshot (if up to date)
+    db = load_database_snapshot(network=network)
+    # Otherwise read the radar configuration YAML files
+    if db is None:
+        db = read_database_from_yaml(network=network)
+    return db
 
 
 def _get_radar_location_database(network=None):
@@ -0,0 +1,244 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides precompiled filename pattern parsers."""
+import datetime
+import re
+
+import numpy as np
+from trollsift.parser import get_convert_dict, regex_format
+
+# Width of the datetime directives that can be decoded by slicing
+_DATETIME_DIRECTIVES_WIDTH = {
+    "%Y": 4,
+    "%y": 2,
+    "%m": 2,
+    "%d": 2,
+    "%j": 3,
+    "%H": 2,
+    "%M": 2,
+    "%S": 2,
+}
+
+_FORMAT_SPEC_REGEX = re.compile(
+    r"^(?:(?P<fill>.)?(?P<align>[<>=^]))?(?P<sign>[+\- ])?(?P<width>\d+)?(?:\.(?P<precision>\d+))?(?P<type>[a-zA-Z]?)$",
+)
+
+
+def _get_datetime_slices(format_spec):
+    """Return the ``(directive, start, end)`` slices of a fixed-width datetime format.
+
+    Returns ``None`` if the format contains directives of variable width.
+    """
+    slices = []
+    position = 0
+    i = 0
+    while i < len(format_spec):
+        if format_spec[i] == "%":
+            directive = format_spec[i : i + 2]
+            if directive not in _DATETIME_DIRECTIVES_WIDTH:
+                return None
+            width = _DATETIME_DIRECTIVES_WIDTH[directive]
+            slices.append((directive, position, position + width))
+            position += width
+            i += 2
+        else:
+            # Literal character
+            position += 1
+            i += 1
+    return slices
+
+
+def _get_short_year(short_year):
+    """Return the full year of a ``%y`` directive following the ``datetime.strptime`` convention."""
+    return short_year + 2000 if short_year <= 68 else short_year + 1900
+
+
+def get_datetime_converter(format_spec):
+    """Return a function converting a string into a :py:class:`datetime.datetime` object.
+
+    Fixed-width formats are decoded by string slicing, which is much faster than
+    :py:meth:`datetime.datetime.strptime`. Other formats fall back to ``strptime``.
+    """
+    slices = _get_datetime_slices(format_spec)
+    if slices is None:
+        return lambda string: datetime.datetime.strptime(string, format_spec)
+
+    dict_slices = {directive: slice(start, end) for directive, start, end in slices}
+    year_slice = dict_slices.get("%Y")
+    short_year_slice = dict_slices.get("%y")
+    doy_slice = dict_slices.get("%j")
+    month_slice, day_slice, hour_slice, minute_slice, second_slice = (
+        dict_slices.get(directive) for directive in ["%m", "%d", "%H", "%M", "%S"]
+    )
+
+    def converter(string):
+        if year_slice:
+            year = int(string[year_slice])
+        else:
+            year = _get_short_year(int(string[short_year_slice])) if short_year_slice else 1900
+        hour = int(string[hour_slice]) if hour_slice else 0
+        minute = int(string[minute_slice]) if minute_slice else 0
+        second = int(string[second_slice]) if second_slice else 0
+        if doy_slice is None:
+            month = int(string[month_slice]) if month_slice else 1
+            day = int(string[day_slice]) if day_slice else 1
+            return datetime.datetime(year, month, day, hour, minute, second)
+        # Follow the datetime.strptime convention (day 366 of a non-leap year is the next 1st January)
+        doy = int(string[doy_slice])
+        if not 1 <= doy <= 366:
+            raise ValueError(f"Invalid day of year {doy}.")
+        return datetime.datetime(year, 1, 1, hour, minute, second) + datetime.timedelta(days=doy - 1)
+
+    return converter
+
+
+def get_field_converter(format_spec):
+    """Return a function converting a matched string field to its typed value."""
+    if "%" in format_spec:
+        return get_datetime_converter(format_spec)
+    match = _FORMAT_SPEC_REGEX.match(format_spec)
+    if match is None:
+        raise ValueError(f"Invalid format specification: '{format_spec}'")
+    align = match["align"]
+    fill = match["fill"] or (" " if align else None)
+    ftype = match["type"]
+
+    def strip_padding(string):
+        if align == ">":
+            return string.lstrip(fill)
+        if align == "<":
+            return string.rstrip(fill)
+        if align == "^":
+            return string.strip(fill)
+        return string
+
+    bases = {"d": 10, "x": 16, "X": 16, "o": 8, "b": 2}
+    if ftype in bases:
+        base = bases[ftype]
+        return lambda string: int(strip_padding(string), base)
+    if ftype in ("f", "F", "e", "E", "g", "G", "n"):
+        return lambda string: float(strip_padding(string))
+    if align:
+        return strip_padding
+    return None  # keep the string as it is
+
+
+class FilenamePattern:
+    """Precompiled trollsift filename pattern.
+
+    The pattern is converted once into a compiled regular expression, and
+    a converter is defined for each typed field.
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.regex = re.compile("^" + regex_format(pattern) + "$")
+        # Regex matching each line of a newline-joined buffer of filenames.
+        # The last group captures the newline only if the line matches the pattern.
+        self.buffer_regex = re.compile(
+            "^(?:" + regex_format(pattern) + ")(\n)|^[^\n]*\n",
+            flags=re.MULTILINE,
+        )
+        self.format_specs = get_convert_dict(pattern)
+        self.converters = {
+            key: converter
+            for key, converter in (
+                (key, get_field_converter(format_spec)) for key, format_spec in self.format_specs.items()
+            )
+            if converter is not None
+        }
+
+    def __repr__(self):
+        """Return the string representation of the pattern."""
+        return f"FilenamePattern('{self.pattern}')"
+
+    def keys(self):
+        """Return the keys defined in the pattern."""
+        return sorted(self.regex.groupindex, key=self.regex.groupindex.get)
+
+    def parse(self, filename):
+        """Parse a filename.
+
+        Returns ``None`` if the filename does not match the pattern.
+        """
+        match = self.regex.match(filename)
+        if match is None:
+            return None
+        info_dict = match.groupdict()
+        try:
+            for key, converter in self.converters.items():
+                info_dict[key] = converter(info_dict[key])
+        except ValueError:
+            return None
+        return info_dict
+
+    def extract(self, filenames):
+        """Extract the (untyped) fields values of a list of filenames in a single pass.
+
+        The filenames are joined in a newline-separated buffer which is scanned once
+        by the compiled regular expression.
+
+        Returns
+        -------
+        tuple
+            A boolean array indicating which filenames match the pattern and
+            a dictionary with the string values of each field (an empty string
+            is returned for filenames not matching the pattern).
+        """
+        keys = self.keys()
+        if len(filenames) == 0:
+            return np.zeros(0, dtype=bool), {key: np.zeros(0, dtype=object) for key in keys}
+        buffer = "\n".join(filenames) + "\n"
+        matches = self.buffer_regex.findall(buffer)
+        arr = np.array(matches, dtype=object).reshape(len(matches), -1)
+        is_matched = arr[:, -1] == "\n"
+        dict_values = {key: arr[:, i] for i, key in enumerate(keys)}
+        return is_matched, dict_values
+
+
+class FilenameParser:
+    """Parser trying a list of precompiled filename patterns in order."""
+
+    def __init__(self, patterns):
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        self.patterns = tuple(FilenamePattern(pattern) for pattern in patterns)
+
+    def __repr__(self):
+        """Return the string representation of the parser."""
+        return f"FilenameParser({[pattern.pattern for pattern in self.patterns]})"
+
+    def parse(self, filename):
+        """Parse a filename with the first matching pattern.
+
+        Returns an empty dictionary if the filename does not match any pattern.
+        """
+        for pattern in self.patterns:
+            info_dict = pattern.parse(filename)
+            if info_dict is not None:
+                return info_dict
+        return {}
@@ -26,11 +26,31 @@
 import numpy as np
 import xarray as xr
 
+from radar_api.checks import check_encoding
 
-def _get_field_array(radar_obj, sweep, field_name):
-    masked_arr = radar_obj.get_field(sweep=sweep, field_name=field_name)
-    arr = masked_arr.data
-    arr[masked_arr.mask] = np.nan
+# pyart metadata keys not copied to the xarray variable attributes
+_EXCLUDED_ATTRS = ["data", "coordinates", "_FillValue"]
+
+
+def _get_attrs(dict_var):
+    return {key: value for key, value in dict_var.items() if key not in _EXCLUDED_ATTRS}
+
+
+def _get_field_array(radar_obj, field_name, dtype=None):
+    """Return the (nrays, ngates) array of a field, with masked values set to NaN.
+
+    Floating point fields are filled in place to avoid copying the data.
+    If ``dtype`` is specified, the field is cast to it if needed.
+    """
+    masked_arr = radar_obj.fields[field_name]["data"]
+    arr = np.ma.getdata(masked_arr)
+    mask = np.ma.getmask(masked_arr)
+    if dtype is not None and arr.dtype != dtype:
+        arr = arr.astype(dtype)
+    elif not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(np.float64)
+    if mask is not np.ma.nomask:
+        arr[mask] = np.nan
     return arr
 
 
@@ -43,42 +63,78 @@ def _get_radar_location(radar_obj):
     return dict_loc
 
 
-def _get_sweep_dataset(radar_obj, sweep):
-    dict_da = {}
-    fields = list(radar_obj.fields)
-    for field_name in fields:
-        arr = _get_field_array(radar_obj, sweep, field_name)
-        if "coordinates" in radar_obj.fields[field_name]:
-            dims = radar_obj.fields[field_name]["coordinates"].split(" ")[1:]
-            dict_da[field_name] = xr.DataArray(arr, dims=dims)
-    ds = xr.Dataset(dict_da)
-    # Add coords
-    coords_dict = {
-        "azimuth": ("azimuth", radar_obj.get_azimuth(sweep)),
-        "elevation": ("azimuth", radar_obj.get_elevation(sweep)),
-        "range": ("range", radar_obj.range["data"][: ds.sizes["range"]]),
-        "time": ("azimuth", radar_obj.time["data"][radar_obj.get_slice(sweep)]),
-    }
-    # Add other coordinates
-    coords_dict.update(_get_radar_location(radar_obj))
-    coords_dict["sweep_number"] = sweep
-    coords_dict["sweep_mode"] = radar_obj.sweep_mode["data"][sweep]
-    coords_dict["sweep_fixed_angle"] = radar_obj.fixed_angle["data"][sweep]
+def _get_sweep_slices(radar_obj):
+    """Return the slices of the rays of each sweep."""
+    starts = radar_obj.sweep_start_ray_index["data"]
+    ends = radar_obj.sweep_end_ray_index["data"]
+    return [slice(int(start), int(end) + 1) for start, end in zip(starts, ends, strict=True)]
+
+
+def _decode_time(radar_obj):
+    """Decode the time of all rays at once."""
+    calendar = radar_obj.time.get("calendar", "standard")
+    return xr.coding.times.decode_cf_datetime(radar_obj.time["data"], radar_obj.time["units"], calendar=calendar)
 
-    ds = ds.assign_coords(coords_dict)
-    ds["time"].attrs["units"] = radar_obj.time["units"]
 
-    # Decode time
-    ds = xr.decode_cf(ds, decode_times=True)
-    return ds
+def _get_datatree_from_pyart(radar_obj, dict_var_naming, encoding=None):
+    """Convert a pyart object to xradar datatree.
+
+    Each field is converted only once and the sweep variables are views of the
+    field arrays. The range and radar location coordinates are shared across sweeps.
+    """
+    # Retrieve the arrays shared by all sweeps
+    # - pyart fields are already decoded: the 'packed' encoding falls back to float32
+    dtype = None if check_encoding(encoding) is None else np.float32
+    fields = {
+        dict_var_naming.get(name, name): (
+            _get_field_array(radar_obj, name, dtype=dtype),
+            _get_attrs(radar_obj.fields[name]),
+        )
+        for name in radar_obj.fields
+    }
+    time = _decode_time(radar_obj)
+    azimuth = radar_obj.azimuth["data"]
+    elevation = radar_obj.elevation["data"]
+    range_coords = xr.Coordinates(
+        {"range": xr.Variable("range", radar_obj.range["data"], attrs=_get_attrs(radar_obj.range))},
+    )
+    dict_loc = _get_radar_location(radar_obj)
+
+    # Define the sweep datasets
+    dict_ds = {}
+    for i, sweep_slice in enumerate(_get_sweep_slices(radar_obj)):
+        sweep = radar_obj.sweep_number["data"][i]
+        data_vars = {
+            name: xr.Variable(("azimuth", "range"), arr[sweep_slice], attrs=attrs)
+            for name, (arr, attrs) in fields.items()
+        }
+        coords = {
+            "azimuth": xr.Variable("azimuth", azimuth[sweep_slice], attrs=_get_attrs(radar_obj.azimuth)),
+            "elevation": xr.Variable("azimuth", elevation[sweep_slice], attrs=_get_attrs(radar_obj.elevation)),
+            "time": xr.Variable("azimuth", time[sweep_slice]),
+            **dict_loc,
+            "sweep_number": sweep,
+            "sweep_mode": radar_obj.sweep_mode["data"][i],
+            "sweep_fixed_angle": radar_obj.fixed_angle["data"][i],
+        }
+        dict_ds[f"sweep_{sweep}"] = xr.Dataset(data_vars=data_vars, coords=range_coords).assign_coords(coords)
+    dt = xr.DataTree.from_dict(dict_ds)
+    # Add geolocation
+    for coord, value in dict_loc.items():
+        dt[coord] = value
+    return dt
+
 
+def get_nexrad_datatree_from_pyart(radar_obj, encoding=None):
+    """Convert a pyart object to xradar datatree.
 
-def get_nexrad_datatree_from_pyart(radar_obj):
-    """Convert a pyart object to xradar datatree."""
+    The masked values of the pyart floating point fields are set to NaN in place.
+    With ``encoding="float32"`` or ``encoding="packed"``, the fields are converted to float32.
+    """
     # Define renaming dictionary to CF-Radials2
     # --> https://github.com/openradar/xradar/blob/830d86b1c6290f1dce0e73c60a1d3b819735f906/xradar/model.py#L385
     # --> Currently set same range for all sweeps !
-    # --> Currently do not copy metadata and variable attributes !
+    # --> Currently do not copy global metadata !
     dict_var_naming = {
         "reflectivity": "DBZH",
         "differential_reflectivity": "ZDR",
@@ -88,55 +144,19 @@ def get_nexrad_datatree_from_pyart(radar_obj):
         "velocity": "VRADH",
         # 'clutter_filter_power_removed',
     }
-    dict_ds = {}
-    for sweep in radar_obj.sweep_number["data"]:
-        sweep_name = f"sweep_{sweep}"
-        ds = _get_sweep_dataset(radar_obj, sweep=sweep)
-        dict_ds[sweep_name] = ds.rename(dict_var_naming)
-    dt = xr.DataTree.from_dict(dict_ds)
-    # Add geolocation
-    for coord, value in _get_radar_location(radar_obj).items():
-        dt[coord] = value
-
-    return dt
-
-
-def _get_sweep_dataset_mch(radar_obj, sweep):
-    dict_da = {}
-    fields = list(radar_obj.fields)
-    for field_name in fields:
-        arr = _get_field_array(radar_obj, sweep=0, field_name=field_name)
-        if "coordinates" in radar_obj.fields[field_name]:
-            dims = radar_obj.fields[field_name]["coordinates"].split(" ")[1:]
-            dict_da[field_name] = xr.DataArray(arr, dims=dims)
-    ds = xr.Dataset(dict_da)
-    # Add coords
-    coords_dict = {
-        "azimuth": ("azimuth", radar_obj.get_azimuth(0)),
-        "elevation": ("azimuth", radar_obj.get_elevation(0)),
-        "range": ("range", radar_obj.range["data"][: ds.sizes["range"]]),
-        "time": ("azimuth", radar_obj.time["data"][radar_obj.get_slice(0)]),
-    }
-    # Add other coordinates
-    coords_dict.update(_get_radar_location(radar_obj))
-    coords_dict["sweep_number"] = sweep
-    coords_dict["sweep_mode"] = radar_obj.sweep_mode["data"][0]
-    coords_dict["sweep_fixed_angle"] = radar_obj.fixed_angle["data"][0]
-
-    ds = ds.assign_coords(coords_dict)
-    ds["time"].attrs["units"] = radar_obj.time["units"]
+    return _get_datatree_from_pyart(radar_obj, dict_var_naming=dict_var_naming, encoding=encoding)
 
-    # Decode time
-    ds = xr.decode_cf(ds, decode_times=True)
-    return ds
 
+def get_mch_datatree_from_pyart(radar_obj, encoding=None):
+    """Convert a pyart object to xradar datatree.
 
-def get_mch_datatree_from_pyart(radar_obj):
-    """Convert a pyart object to xradar datatree."""
+    The masked values of the pyart floating point fields are set to NaN in place.
+    With ``encoding="float32"`` or ``encoding="packed"``, the fields are converted to float32.
+    """
     # Define renaming dictionary to CF-Radials2
     # --> https://github.com/openradar/xradar/blob/830d86b1c6290f1dce0e73c60a1d3b819735f906/xradar/model.py#L385
     # --> Currently set same range for all sweeps !
-    # --> Currently do not copy metadata and variable attributes !
+    # --> Currently do not copy global metadata !
     dict_var_naming = {
         "reflectivity": "DBZH",
         "differential_reflectivity": "ZDR",
@@ -148,15 +168,4 @@ def get_mch_datatree_from_pyart(radar_obj):
         # reflectivity_vv
         # signal_to_noise_ratio
     }
-    dict_ds = {}
-    for sweep in radar_obj.sweep_number["data"]:
-        sweep_name = f"sweep_{sweep}"
-        ds = _get_sweep_dataset_mch(radar_obj, sweep=sweep)
-        rename_dict = {k: v for k, v in dict_var_naming.items() if k in ds}
-        dict_ds[sweep_name] = ds.rename(rename_dict)
-    dt = xr.DataTree.from_dict(dict_ds)
-    # Add geolocation
-    for coord, value in _get_radar_location(radar_obj).items():
-        dt[coord] = value
-
-    return dt
+    return _get_datatree_from_pyart(radar_obj, dict_var_naming=dict_var_naming, encoding=encoding)
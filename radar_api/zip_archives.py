@@ -0,0 +1,236 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2025 RADAR-API developers
+#
+# This file is part of RADAR-API.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""This module provides direct reads of the files archived within zip files.
+
+Some networks (i.e. MCH_CSCS) archive the radar files of each radar-day in a zip file.
+The files are referred as ``<zip_filepath>/<member name>``.
+
+The central directory of each zip file is read once and cached in memory together
+with the zip file modification time, so that repeated searches do not re-read it.
+The members are opened in place, without extraction: uncompressed members are
+exposed through a seekable view of the memory-mapped zip file, while compressed
+members are decompressed on the fly.
+"""
+import io
+import mmap
+import os
+import re
+import struct
+import threading
+import zipfile
+from collections import OrderedDict
+
+# Maximum number of zip file central directories cached in memory
+_MAX_ZIP_INDEXES = 4096
+
+_ZIP_INDEXES = OrderedDict()
+_ZIP_INDEXES_LOCK = threading.Lock()
+
+# Zip local file header: signature (4 bytes), 22 bytes of fields, filename and extra field lengths
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# Extension of the zip files followed by a path separator
+_ZIP_EXTENSION_REGEX = re.compile(r"\.zip(?=[/\\].)")
+
+
+class ZipMemberView(io.RawIOBase):
+    """Read-only seekable view of an uncompressed zip member, backed by a memory-mapped zip file."""
+
+    def __init__(self, zip_filepath, offset, size):
+        """Initialize the view of the ``size`` bytes starting at ``offset`` in the zip file."""
+        super().__init__()
+        with open(zip_filepath, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)[offset : offset + size]
+        self._position = 0
+
+    def readable(self):
+        """Return True as the view can be read."""
+        return True
+
+    def seekable(self):
+        """Return True as the view supports random access."""
+        return True
+
+    def readinto(self, buffer):
+        """Read bytes into a pre-allocated writable buffer."""
+        data = self._buffer[self._position : self._position + len(buffer)]
+        n_bytes = len(data)
+        buffer[:n_bytes] = data
+        self._position += n_bytes
+        return n_bytes
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Change the stream position."""
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")
+        self._position = position
+        return position
+
+    def tell(self):
+        """Return the stream position."""
+        return self._position
+
+    def getbuffer(self):
+        """Return a memoryview of the member content, without copy."""
+        return self._buffer
+
+    def close(self):
+        """Release the memory-mapped zip file."""
+        if not self.closed:
+            self._buffer.release()
+            self._mmap.close()
+        super().close()
+
+
+class ZipIndex:
+    """Central directory of a zip file, mapping the member names to their ``zipfile.ZipInfo``."""
+
+    def __init__(self, zip_filepath):
+        """Read the central directory of the given zip file."""
+        self.filepath = str(zip_filepath)
+        stat = os.stat(self.filepath)
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        with zipfile.ZipFile(self.filepath, "r") as zf:
+            self.members = {info.filename: info for info in zf.infolist() if not info.is_dir()}
+        self._data_offsets = {}
+
+    def __repr__(self):
+        """Return the string representation of the zip index."""
+        return f"ZipIndex({self.filepath!r}, n_members={len(self.members)})"
+
+    def is_valid(self):
+        """Return True if the zip file has not been modified since its central directory was read."""
+        try:
+            stat = os.stat(self.filepath)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def get_info(self, member):
+        """Return the ``zipfile.ZipInfo`` of a member."""
+        try:
+            return self.members[member]
+        except KeyError:
+            raise FileNotFoundError(f"{member} is not available in {self.filepath}.") from None
+
+    def get_data_offset(self, member):
+        """Return the offset of the member data within the zip file."""
+        if member not in self._data_offsets:
+            info = self.get_info(member)
+            with open(self.filepath, "rb") as f:
+                f.seek(info.header_offset)
+                header = f.read(_LOCAL_HEADER_SIZE)
+            if header[:4] != _LOCAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile(f"Bad local file header for {member} in {self.filepath}.")
+            filename_length, extra_length = struct.unpack("<HH", header[26:30])
+            self._data_offsets[member] = info.header_offset + _LOCAL_HEADER_SIZE + filename_length + extra_length
+        return self._data_offsets[member]
+
+    def open(self, member):
+        """Open a member as a seekable binary file object, without extracting it."""
+        info = self.get_info(member)
+        offset = self.get_data_offset(member)
+        if info.compress_type == zipfile.ZIP_STORED and info.file_size > 0:
+            return ZipMemberView(self.filepath, offset=offset, size=info.file_size)
+        f = open(self.filepath, "rb")  # noqa: SIM115
+        f.seek(offset)
+        return zipfile.ZipExtFile(f, "r", info, close_fileobj=True)
+
+
+def get_zip_index(zip_filepath):
+    """Return the (cached) central directory of a zip file."""
+    zip_filepath = str(zip_filepath)
+    with _ZIP_INDEXES_LOCK:
+        zip_index = _ZIP_INDEXES.get(zip_filepath)
+        if zip_index is not None and zip_index.is_valid():
+            _ZIP_INDEXES.move_to_end(zip_filepath)
+            return zip_index
+    zip_index = ZipIndex(zip_filepath)
+    with _ZIP_INDEXES_LOCK:
+        _ZIP_INDEXES[zip_filepath] = zip_index
+        while len(_ZIP_INDEXES) > _MAX_ZIP_INDEXES:
+            _ZIP_INDEXES.popitem(last=False)
+    return zip_index
+
+
+def clear_zip_indexes():
+    """Remove all cached zip file central directories."""
+    with _ZIP_INDEXES_LOCK:
+        _ZIP_INDEXES.clear()
+
+
+def _is_zip_file(filepath):
+    """Return True if the filepath is an existing zip file."""
+    if not os.path.isfile(filepath):
+        return False
+    with _ZIP_INDEXES_LOCK:
+        if filepath in _ZIP_INDEXES:
+            return True
+    return zipfile.is_zipfile(filepath)
+
+
+def split_zip_member_path(filepath):
+    """Split a ``<zip_filepath>/<member name>`` path.
+
+    Returns None if the filepath does not refer to a member of an existing zip file
+    (i.e. directories named ``*.zip`` are not zip files).
+    """
+    if not isinstance(filepath, str):
+        return None
+    for match in _ZIP_EXTENSION_REGEX.finditer(filepath):
+        zip_filepath = filepath[: match.end()]
+        if _is_zip_file(zip_filepath):
+            return zip_filepath, filepath[match.end() + 1 :]
+    return None
+
+
+def list_zip_members(zip_filepath, detail=False):
+    """Return the paths (or the info) of the files within a zip file."""
+    members = get_zip_index(zip_filepath).members
+    if detail:
+        return [
+            {"name": os.path.join(zip_filepath, name), "size": info.file_size, "type": "file"}
+            for name, info in members.items()
+        ]
+    return [os.path.join(zip_filepath, name) for name in members]
+
+
+def open_zip_member(filepath):
+    """Open a ``<zip_filepath>/<member name>`` file as a seekable binary file object."""
+    zip_filepath, member = split_zip_member_path(filepath)
+    return get_zip_index(zip_filepath).open(member)